@@ -1,5 +1,6 @@
 from django.contrib import admin
 from .models import Cat, Mission, Target
+from .targets import recount_targets
 
 @admin.register(Cat)
 class CatAdmin(admin.ModelAdmin):
@@ -15,10 +16,31 @@ class TargetInline(admin.TabularInline):
 class MissionAdmin(admin.ModelAdmin):
     list_display = ("id", "assigned_cat", "is_complete", "created_at")
     list_filter = ("is_complete",)
+    readonly_fields = ("target_count", "completed_target_count")
     inlines = [TargetInline]
 
+    def save_related(self, request, form, formsets, change):
+        super().save_related(request, form, formsets, change)
+        recount_targets(form.instance.pk)
+
 @admin.register(Target)
 class TargetAdmin(admin.ModelAdmin):
     list_display = ("id", "mission_id", "name", "country", "is_complete", "updated_at")
     search_fields = ("name",)
     list_filter = ("is_complete", "country")
+
+    def save_model(self, request, obj, form, change):
+        super().save_model(request, obj, form, change)
+        recount_targets(obj.mission_id)
+        if change and "mission" in form.changed_data:
+            recount_targets(form.initial["mission"])
+
+    def delete_model(self, request, obj):
+        super().delete_model(request, obj)
+        recount_targets(obj.mission_id)
+
+    def delete_queryset(self, request, queryset):
+        mission_ids = set(queryset.values_list("mission_id", flat=True))
+        super().delete_queryset(request, queryset)
+        for mission_id in mission_ids:
+            recount_targets(mission_id)
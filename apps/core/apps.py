@@ -5,3 +5,15 @@ class CoreConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "apps.core"
     path = str(Path(__file__).resolve().parent)
+
+    def ready(self):
+        from django.db.backends.signals import connection_created
+        from . import http_cache, metrics, querybudget
+        from .db_pool import collect_pool_metrics
+        from .services import preload_breed_snapshot
+        connection_created.connect(http_cache.install_write_tracker, dispatch_uid="core-write-tracker")
+        connection_created.connect(querybudget.install_query_counter, dispatch_uid="core-query-counter")
+        http_cache.install_on_open_connections()
+        querybudget.install_on_open_connections()
+        metrics.add_collector(collect_pool_metrics)
+        preload_breed_snapshot()
@@ -0,0 +1,132 @@
+from django.conf import settings
+from django.db import IntegrityError, transaction
+from django.db.models import Case, Exists, OuterRef, Value, When
+from django.utils import timezone
+from rest_framework import status
+
+from .models import Cat, Mission
+
+
+class AssignmentError(Exception):
+    def __init__(self, detail: str, status_code: int = status.HTTP_400_BAD_REQUEST):
+        super().__init__(detail)
+        self.detail = detail
+        self.status_code = status_code
+
+
+def assign_cat(mission_id, cat_id) -> None:
+    """
+    Assign a cat to an active mission with a single conditional UPDATE.
+    The partial unique index uniq_active_mission_per_cat rejects a second active
+    mission for the same cat, so concurrent assignments cannot both succeed.
+    """
+    try:
+        mission_id, cat_id = int(mission_id), int(cat_id)
+    except (TypeError, ValueError):
+        raise AssignmentError("Not found.", status.HTTP_404_NOT_FOUND)
+    try:
+        with transaction.atomic():
+            updated = (
+                Mission.objects.filter(pk=mission_id, is_complete=False)
+                .filter(Exists(Cat.objects.filter(pk=cat_id)))
+                .update(assigned_cat_id=cat_id, updated_at=timezone.now())
+            )
+    except IntegrityError:
+        raise AssignmentError("Cat already has an active mission")
+    if updated:
+        return
+    is_complete = Mission.objects.filter(pk=mission_id).values_list("is_complete", flat=True).first()
+    if is_complete is None:
+        raise AssignmentError("Not found.", status.HTTP_404_NOT_FOUND)
+    if is_complete:
+        raise AssignmentError("Cannot assign cat to completed mission")
+    raise AssignmentError("No Cat matches the given query.", status.HTTP_404_NOT_FOUND)
+
+
+class AssignmentConflict(Exception):
+    """Active missions changed between the snapshot and the bulk UPDATE."""
+
+
+def _snapshot():
+    """Map of every active mission id to its current cat id (or None), from one query."""
+    return dict(Mission.objects.filter(is_complete=False).values_list("id", "assigned_cat_id"))
+
+
+def plan_pairs(pairs: list) -> tuple:
+    """
+    Check (mission, cat) pairs against one snapshot of active missions.
+    Missions in the plan release their current cats, so cats may move between
+    missions of the same batch. Returns (plan, rejects); plan maps mission id to cat id.
+    """
+    active = _snapshot()
+    requested = []
+    rejects = []
+    for index, pair in enumerate(pairs):
+        try:
+            requested.append((index, int(pair["mission"]), int(pair["cat"])))
+        except (TypeError, ValueError, KeyError):
+            rejects.append({"index": index, "detail": "Each pair needs integer 'mission' and 'cat'."})
+    cats = set(Cat.objects.filter(pk__in={c for _, _, c in requested}).values_list("id", flat=True))
+
+    plan, plan_index, used_cats = {}, {}, set()
+    for index, mission_id, cat_id in requested:
+        if mission_id not in active:
+            detail = "Mission not found or already completed."
+        elif cat_id not in cats:
+            detail = "No Cat matches the given query."
+        elif mission_id in plan:
+            detail = "Mission appears more than once."
+        elif cat_id in used_cats:
+            detail = "Cat appears more than once."
+        else:
+            plan[mission_id] = cat_id
+            plan_index[mission_id] = index
+            used_cats.add(cat_id)
+            continue
+        rejects.append({"index": index, "detail": detail})
+
+    busy = {cat for mission, cat in active.items() if cat is not None and mission not in plan}
+    for mission_id in [m for m, cat in plan.items() if cat in busy]:
+        rejects.append({"index": plan_index[mission_id], "detail": "Cat already has an active mission"})
+        del plan[mission_id]
+    rejects.sort(key=lambda r: r["index"])
+    return plan, rejects
+
+
+def plan_auto(limit: int | None = None) -> dict:
+    """Match idle cats to unassigned active missions, oldest first on both sides."""
+    missions = Mission.objects.filter(is_complete=False, assigned_cat__isnull=True).order_by("id")
+    missions = list(missions.values_list("id", flat=True)[:limit])
+    busy = Mission.objects.filter(assigned_cat=OuterRef("pk"), is_complete=False)
+    idle = Cat.objects.filter(~Exists(busy)).order_by("id").values_list("id", flat=True)
+    return dict(zip(missions, idle[: len(missions)]))
+
+
+def apply_plan(plan: dict) -> int:
+    """
+    Write the plan with one bulk UPDATE per BULK_BATCH_SIZE missions in a single transaction.
+    Planned missions are cleared first so cats can swap missions without tripping
+    uniq_active_mission_per_cat row by row.
+    """
+    if not plan:
+        return 0
+    now = timezone.now()
+    ids = list(plan)
+    batch = settings.BULK_BATCH_SIZE
+    try:
+        with transaction.atomic():
+            cleared = 0
+            for start in range(0, len(ids), batch):
+                chunk = ids[start:start + batch]
+                cleared += Mission.objects.filter(pk__in=chunk, is_complete=False).update(assigned_cat=None)
+            if cleared != len(ids):
+                raise AssignmentConflict("Some missions were completed or deleted meanwhile.")
+            for start in range(0, len(ids), batch):
+                chunk = ids[start:start + batch]
+                Mission.objects.filter(pk__in=chunk).update(
+                    assigned_cat_id=Case(*[When(pk=m, then=Value(plan[m])) for m in chunk]),
+                    updated_at=now,
+                )
+    except IntegrityError as exc:
+        raise AssignmentConflict("A cat was assigned to another mission meanwhile.") from exc
+    return len(ids)
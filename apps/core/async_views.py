@@ -0,0 +1,210 @@
+"""
+Native async versions of the hot core endpoints, mounted under /api/async/.
+
+Reads use the async ORM end to end and return the same JSON as the DRF views.
+Writes that need a transaction (assign, target patch) run their existing sync
+implementation through sync_to_async, since the async ORM cannot open transactions.
+"""
+import functools
+import json
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.core.cache import cache
+from django.db import DEFAULT_DB_ALIAS, transaction
+from django.http import HttpResponse, HttpResponseNotModified
+from django.views.decorators.csrf import csrf_exempt
+from django.views.decorators.http import require_http_methods, require_POST, require_safe
+from rest_framework.exceptions import NotFound
+from rest_framework.renderers import JSONRenderer
+from rest_framework.request import Request
+
+from . import http_cache
+from .assignment import AssignmentError, assign_cat
+from .fast_serializers import (
+    CAT_FIELDS,
+    MISSION_FIELDS,
+    TARGET_FIELDS,
+    atargets_by_mission,
+    cat_rows,
+    mission_rows,
+)
+from .models import Cat, Mission, Target
+from .pagination import IdCursorPagination
+from .querybudget import query_budget
+from .serializers import TargetUpdateSerializer
+
+_render = JSONRenderer().render
+
+
+def json_response(data, status=200, headers=None) -> HttpResponse:
+    response = HttpResponse(_render(data), status=status, content_type="application/json", headers=headers)
+    response.data = data
+    return response
+
+
+def error(detail, status: int) -> HttpResponse:
+    return json_response({"detail": detail}, status=status)
+
+
+def not_found(model) -> HttpResponse:
+    return error(f"No {model._meta.object_name} matches the given query.", 404)
+
+
+def json_body(request) -> dict | None:
+    try:
+        data = json.loads(request.body or b"{}")
+    except ValueError:
+        return None
+    return data if isinstance(data, dict) else {}
+
+
+def conditional_get(*models):
+    """Async counterpart of http_cache.conditional_get for the views in this module."""
+    tables = tuple(m._meta.db_table for m in models)
+
+    def decorator(view):
+        @functools.wraps(view)
+        async def wrapper(request, *args, **kwargs):
+            if not settings.RESPONSE_CACHE_ENABLED:
+                return await view(request, *args, **kwargs)
+            etag, key = http_cache.precondition(request, tables, await http_cache.atable_versions(tables))
+            if key is None:
+                return HttpResponseNotModified(headers={"ETag": etag})
+            data = await cache.aget(key)
+            if data is not None:
+                return json_response(data, headers={"ETag": etag})
+            response = await view(request, *args, **kwargs)
+            if response.status_code == 200:
+                await cache.aset(key, response.data, timeout=http_cache.response_timeout())
+                response["ETag"] = etag
+            return response
+        return wrapper
+    return decorator
+
+
+async def page_of(request, queryset) -> tuple:
+    """Return (paginator, rows) for the requested cursor page, or (None, 404 response)."""
+    paginator = IdCursorPagination()
+    try:
+        return paginator, await paginator.apaginate_queryset(queryset, Request(request))
+    except NotFound as exc:
+        return None, error(str(exc.detail), 404)
+
+
+async def _mission_rows(rows) -> list:
+    return mission_rows(rows, await atargets_by_mission([row["id"] for row in rows]))
+
+
+@query_budget(1)
+@require_safe
+@conditional_get(Cat)
+async def cat_list(request):
+    paginator, page = await page_of(request, Cat.objects.values(*CAT_FIELDS))
+    if paginator is None:
+        return page
+    return json_response(paginator.paginated_data(cat_rows(page)))
+
+
+@query_budget(1)
+@require_safe
+@conditional_get(Cat)
+async def cat_detail(request, pk):
+    row = await Cat.objects.values(*CAT_FIELDS).filter(pk=pk).afirst()
+    if row is None:
+        return not_found(Cat)
+    return json_response(cat_rows([row])[0])
+
+
+@query_budget(2)
+@require_safe
+@conditional_get(Mission, Target)
+async def mission_list(request):
+    paginator, page = await page_of(request, Mission.objects.values(*MISSION_FIELDS))
+    if paginator is None:
+        return page
+    return json_response(paginator.paginated_data(await _mission_rows(page)))
+
+
+async def _mission(pk) -> dict | None:
+    row = await Mission.objects.values(*MISSION_FIELDS).filter(pk=pk).afirst()
+    return None if row is None else (await _mission_rows([row]))[0]
+
+
+@query_budget(2)
+@require_safe
+@conditional_get(Mission, Target)
+async def mission_detail(request, pk):
+    mission = await _mission(pk)
+    if mission is None:
+        return not_found(Mission)
+    return json_response(mission)
+
+
+@query_budget(5)
+@csrf_exempt
+@require_POST
+async def mission_assign(request, pk):
+    data = json_body(request)
+    if data is None:
+        return error("JSON parse error", 400)
+    cat_id = data.get("cat_id")
+    if not cat_id:
+        return error("cat_id is required", 400)
+    try:
+        await sync_to_async(assign_cat)(pk, cat_id)
+    except AssignmentError as exc:
+        return error(exc.detail, exc.status_code)
+    return json_response(await _mission(pk))
+
+
+@query_budget(1)
+@require_safe
+@conditional_get(Target)
+async def target_list(request):
+    paginator, page = await page_of(request, Target.objects.values(*TARGET_FIELDS))
+    if paginator is None:
+        return page
+    return json_response(paginator.paginated_data(page))
+
+
+@query_budget(1)
+@require_safe
+@conditional_get(Target)
+async def target_detail(request, pk):
+    row = await Target.objects.values(*TARGET_FIELDS).filter(pk=pk).afirst()
+    if row is None:
+        return not_found(Target)
+    return json_response(row)
+
+
+def _target_for_update(mission_id: int, target_id: int):
+    """The target row, locked as TargetUpdateView's locking_actions lock it."""
+    return (
+        Target.objects.select_related("mission")
+        .select_for_update(of=("self",))
+        .filter(pk=target_id, mission_id=mission_id)
+    )
+
+
+@transaction.atomic(using=DEFAULT_DB_ALIAS)
+def _patch_target(mission_id: int, target_id: int, data: dict) -> tuple:
+    target = _target_for_update(mission_id, target_id).first()
+    if target is None:
+        return 404, {"detail": "No Target matches the given query."}
+    serializer = TargetUpdateSerializer(target, data=data, partial=True)
+    if not serializer.is_valid():
+        return 400, serializer.errors
+    serializer.save()
+    return 200, serializer.data
+
+
+@query_budget(4)
+@csrf_exempt
+@require_http_methods(["PATCH"])
+async def target_patch(request, mission_id, target_id):
+    data = json_body(request)
+    if data is None:
+        return error("JSON parse error", 400)
+    status, payload = await sync_to_async(_patch_target)(mission_id, target_id, data)
+    return json_response(payload, status=status)
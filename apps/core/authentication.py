@@ -0,0 +1,21 @@
+"""
+DRF authentication classes used by the API: simplejwt's and DRF's session
+authentication, with their queries (user lookup, session load) left out of query
+budgets. Those cost the same for every view and are not made by the view itself.
+"""
+from rest_framework.authentication import SessionAuthentication
+from rest_framework_simplejwt.authentication import JWTAuthentication
+
+from .querybudget import uncounted
+
+
+class UncountedJWTAuthentication(JWTAuthentication):
+    def authenticate(self, request):
+        with uncounted():
+            return super().authenticate(request)
+
+
+class UncountedSessionAuthentication(SessionAuthentication):
+    def authenticate(self, request):
+        with uncounted():
+            return super().authenticate(request)
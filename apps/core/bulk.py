@@ -0,0 +1,94 @@
+from django.conf import settings
+from django.core.exceptions import ValidationError
+from django.db import transaction
+
+from .models import Cat, Mission, Target
+from .serializers import MissionCreateSerializer
+from .services import normalize_breed, unknown_breeds
+
+CAT_IMPORT_FIELDS = ("name", "years_of_experience", "breed", "salary")
+
+
+def create_missions_bulk(items: list) -> list:
+    """
+    Validate every mission payload in memory, then insert all valid missions and
+    their targets with one bulk INSERT per table (per BULK_BATCH_SIZE rows).
+    Returns one result per input item, in input order.
+    """
+    results = [None] * len(items)
+    valid = []
+    for index, item in enumerate(items):
+        serializer = MissionCreateSerializer(data=item)
+        if serializer.is_valid():
+            valid.append((index, serializer.validated_data))
+        else:
+            results[index] = {"index": index, "status": 400, "errors": serializer.errors}
+    if not valid:
+        return results
+
+    batch_size = settings.BULK_BATCH_SIZE
+    with transaction.atomic():
+        missions = Mission.objects.bulk_create(
+            [
+                Mission(is_complete=data.get("is_complete", False), target_count=len(data["targets"]))
+                for _, data in valid
+            ],
+            batch_size=batch_size,
+        )
+        Target.objects.bulk_create(
+            [
+                Target(mission=mission, **target)
+                for mission, (_, data) in zip(missions, valid)
+                for target in data["targets"]
+            ],
+            batch_size=batch_size,
+        )
+    for mission, (index, _) in zip(missions, valid):
+        results[index] = {"index": index, "status": 201, "id": mission.pk}
+    return results
+
+
+def _clean_cat_row(row) -> tuple:
+    values, errors = {}, {}
+    if not isinstance(row, dict):
+        return None, {"non_field_errors": ["Expected an object."]}
+    for name in CAT_IMPORT_FIELDS:
+        field = Cat._meta.get_field(name)
+        raw = row.get(name)
+        if raw in (None, ""):
+            errors[name] = ["This field is required."]
+            continue
+        try:
+            values[name] = field.clean(raw.strip() if isinstance(raw, str) else raw, None)
+        except ValidationError as exc:
+            errors[name] = exc.messages
+    return values, errors
+
+
+def import_cats(rows, batch_size: int | None = None) -> tuple:
+    """
+    Validate cat rows with the model field rules, check every breed against the
+    breed index with a single set difference, and bulk insert the valid rows.
+    Returns (created_count, rejects) where each reject carries its 1-based row number.
+    """
+    batch_size = batch_size or settings.BULK_BATCH_SIZE
+    cleaned, rejects = [], []
+    for number, row in enumerate(rows, start=1):
+        values, errors = _clean_cat_row(row)
+        if errors:
+            rejects.append({"row": number, "errors": errors})
+        else:
+            cleaned.append((number, values))
+
+    unknown = unknown_breeds(values["breed"] for _, values in cleaned)
+    cats = []
+    for number, values in cleaned:
+        if normalize_breed(values["breed"]) in unknown:
+            rejects.append({"row": number, "errors": {"breed": [f"Unknown breed: {values['breed']}."]}})
+        else:
+            cats.append(Cat(**values))
+    rejects.sort(key=lambda r: r["row"])
+
+    with transaction.atomic():
+        Cat.objects.bulk_create(cats, batch_size=batch_size)
+    return len(cats), rejects
@@ -0,0 +1,230 @@
+"""
+SQLite-backed cache shared by every process on the host.
+
+No external service is needed: all gunicorn workers open the same database file in
+WAL mode. Entries with a timeout are evicted least-recently-used once MAX_ENTRIES or
+MAX_SIZE (bytes of stored values) is exceeded; entries stored with timeout=None are
+never evicted and do not count against either limit. ``add`` and ``incr`` are single
+atomic statements, which is what the version counters of the breed index and the
+response cache rely on.
+"""
+import math
+import os
+import pickle
+import sqlite3
+import threading
+import time
+
+from django.core.cache.backends.base import DEFAULT_TIMEOUT, BaseCache
+
+SCHEMA = (
+    "CREATE TABLE IF NOT EXISTS cache ("
+    " key TEXT PRIMARY KEY, value BLOB NOT NULL, expires REAL, accessed REAL NOT NULL, size INTEGER NOT NULL"
+    ") WITHOUT ROWID",
+    "CREATE INDEX IF NOT EXISTS cache_accessed ON cache (accessed)",
+    "CREATE INDEX IF NOT EXISTS cache_expires ON cache (expires) WHERE expires IS NOT NULL",
+    # Running totals of the evictable (expiring) entries, kept by triggers in the same
+    # transaction as the write, so culling never has to scan the table.
+    "CREATE TABLE IF NOT EXISTS cache_stats ("
+    " id INTEGER PRIMARY KEY CHECK (id = 1), entries INTEGER NOT NULL, size INTEGER NOT NULL)",
+    "INSERT OR IGNORE INTO cache_stats"
+    " SELECT 1, COUNT(*), CAST(TOTAL(size) AS INTEGER) FROM cache WHERE expires IS NOT NULL",
+    "CREATE TRIGGER IF NOT EXISTS cache_stats_insert AFTER INSERT ON cache WHEN new.expires IS NOT NULL"
+    " BEGIN UPDATE cache_stats SET entries = entries + 1, size = size + new.size; END",
+    "CREATE TRIGGER IF NOT EXISTS cache_stats_delete AFTER DELETE ON cache WHEN old.expires IS NOT NULL"
+    " BEGIN UPDATE cache_stats SET entries = entries - 1, size = size - old.size; END",
+    "CREATE TRIGGER IF NOT EXISTS cache_stats_update AFTER UPDATE OF size, expires ON cache BEGIN"
+    " UPDATE cache_stats SET"
+    " entries = entries + (new.expires IS NOT NULL) - (old.expires IS NOT NULL),"
+    " size = size + CASE WHEN new.expires IS NULL THEN 0 ELSE new.size END"
+    " - CASE WHEN old.expires IS NULL THEN 0 ELSE old.size END; END",
+)
+LIVE = "(expires IS NULL OR expires > ?)"
+
+
+def _encode(value):
+    # Integers are stored natively so incr can run as one UPDATE.
+    if type(value) is int and -(2 ** 63) <= value < 2 ** 63:
+        return value, 8
+    data = pickle.dumps(value, pickle.HIGHEST_PROTOCOL)
+    return data, len(data)
+
+
+def _decode(value):
+    return value if isinstance(value, int) else pickle.loads(value)
+
+
+class SQLiteCache(BaseCache):
+    """
+    LOCATION is the database path. OPTIONS: MAX_ENTRIES and CULL_FREQUENCY as for
+    Django's cache backends, MAX_SIZE in bytes (0 = unlimited), BUSY_TIMEOUT in
+    seconds and LRU_RESOLUTION, the seconds a read waits before refreshing an
+    entry's access time.
+    """
+
+    def __init__(self, location, params):
+        super().__init__(params)
+        options = params.get("OPTIONS", {})
+        self.path = os.fspath(location)
+        self._max_size = int(options.get("MAX_SIZE", 0))
+        self._busy_timeout = float(options.get("BUSY_TIMEOUT", 5))
+        self._lru_resolution = float(options.get("LRU_RESOLUTION", 1))
+        self._local = threading.local()
+
+    @property
+    def _db(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None or self._local.pid != os.getpid():
+            os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+            conn = sqlite3.connect(self.path, timeout=self._busy_timeout, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute("BEGIN IMMEDIATE")
+            for statement in SCHEMA:
+                conn.execute(statement)
+            conn.execute("COMMIT")
+            self._local.conn = conn
+            self._local.pid = os.getpid()
+        return conn
+
+    def _write(self, fn):
+        db = self._db
+        db.execute("BEGIN IMMEDIATE")
+        try:
+            result = fn(db)
+        except BaseException:
+            db.execute("ROLLBACK")
+            raise
+        db.execute("COMMIT")
+        return result
+
+    def _cull(self, db, now: float) -> None:
+        db.execute("DELETE FROM cache WHERE expires IS NOT NULL AND expires <= ?", (now,))
+        while True:
+            count, size = db.execute("SELECT entries, size FROM cache_stats").fetchone()
+            excess = 0
+            if self._max_entries and count > self._max_entries:
+                excess = count - self._max_entries + (count // self._cull_frequency if self._cull_frequency else 0)
+            if self._max_size and size > self._max_size:
+                # Entries of average size needed to get back under MAX_SIZE; rarely needs a second pass.
+                excess = max(excess, math.ceil((size - self._max_size) * count / size))
+            if not excess:
+                return
+            db.execute(
+                "DELETE FROM cache WHERE key IN "
+                "(SELECT key FROM cache WHERE expires IS NOT NULL ORDER BY accessed LIMIT ?)",
+                (excess,),
+            )
+
+    def _store(self, db, key, value, timeout, mode: str) -> bool:
+        now = time.time()
+        data, size = _encode(value)
+        expires = self.get_backend_timeout(timeout)
+        if mode == "add":
+            db.execute(f"DELETE FROM cache WHERE key = ? AND NOT {LIVE}", (key, now))
+            stored = db.execute(
+                "INSERT OR IGNORE INTO cache (key, value, expires, accessed, size) VALUES (?, ?, ?, ?, ?)",
+                (key, data, expires, now, size),
+            ).rowcount == 1
+        else:
+            # An upsert, not INSERT OR REPLACE: REPLACE's implicit delete does not fire triggers.
+            db.execute(
+                "INSERT INTO cache (key, value, expires, accessed, size) VALUES (?, ?, ?, ?, ?) "
+                "ON CONFLICT (key) DO UPDATE SET "
+                "value = excluded.value, expires = excluded.expires, accessed = excluded.accessed, size = excluded.size",
+                (key, data, expires, now, size),
+            )
+            stored = True
+        if stored:
+            self._cull(db, now)
+        return stored
+
+    def add(self, key, value, timeout=DEFAULT_TIMEOUT, version=None):
+        key = self.make_and_validate_key(key, version=version)
+        return self._write(lambda db: self._store(db, key, value, timeout, "add"))
+
+    def set(self, key, value, timeout=DEFAULT_TIMEOUT, version=None):
+        key = self.make_and_validate_key(key, version=version)
+        self._write(lambda db: self._store(db, key, value, timeout, "set"))
+
+    def set_many(self, data, timeout=DEFAULT_TIMEOUT, version=None):
+        keys = {self.make_and_validate_key(k, version=version): v for k, v in data.items()}
+
+        def store_all(db):
+            for key, value in keys.items():
+                self._store(db, key, value, timeout, "set")
+
+        self._write(store_all)
+        return []
+
+    def get(self, key, default=None, version=None):
+        key = self.make_and_validate_key(key, version=version)
+        return self._get_many([key]).get(key, default)
+
+    def get_many(self, keys, version=None):
+        made = {self.make_and_validate_key(k, version=version): k for k in keys}
+        found = self._get_many(list(made))
+        return {made[k]: v for k, v in found.items()}
+
+    def _get_many(self, keys) -> dict:
+        if not keys:
+            return {}
+        now = time.time()
+        placeholders = ",".join("?" * len(keys))
+        rows = self._db.execute(
+            f"SELECT key, value, accessed FROM cache WHERE key IN ({placeholders}) AND {LIVE}", (*keys, now)
+        ).fetchall()
+        stale = [key for key, _, accessed in rows if now - accessed >= self._lru_resolution]
+        if stale:
+            # LRU bookkeeping is best effort: give up at once instead of waiting
+            # BUSY_TIMEOUT behind a writer, and never fail a read on a busy database.
+            db = self._db
+            db.execute("PRAGMA busy_timeout = 0")
+            try:
+                db.execute(f"UPDATE cache SET accessed = ? WHERE key IN ({','.join('?' * len(stale))})", (now, *stale))
+            except sqlite3.OperationalError:
+                pass
+            finally:
+                db.execute(f"PRAGMA busy_timeout = {int(self._busy_timeout * 1000)}")
+        return {key: _decode(value) for key, value, _ in rows}
+
+    def has_key(self, key, version=None):
+        key = self.make_and_validate_key(key, version=version)
+        return self._db.execute(f"SELECT 1 FROM cache WHERE key = ? AND {LIVE}", (key, time.time())).fetchone() is not None
+
+    def touch(self, key, timeout=DEFAULT_TIMEOUT, version=None):
+        key = self.make_and_validate_key(key, version=version)
+        now = time.time()
+        return self._write(
+            lambda db: db.execute(
+                f"UPDATE cache SET expires = ?, accessed = ? WHERE key = ? AND {LIVE}",
+                (self.get_backend_timeout(timeout), now, key, now),
+            ).rowcount == 1
+        )
+
+    def incr(self, key, delta=1, version=None):
+        key = self.make_and_validate_key(key, version=version)
+        row = self._db.execute(
+            f"UPDATE cache SET value = value + ?, accessed = ? "
+            f"WHERE key = ? AND typeof(value) = 'integer' AND {LIVE} RETURNING value",
+            (delta, time.time(), key, time.time()),
+        ).fetchone()
+        if row is None:
+            raise ValueError("Key '%s' not found" % key)
+        return row[0]
+
+    def delete(self, key, version=None):
+        key = self.make_and_validate_key(key, version=version)
+        return self._db.execute("DELETE FROM cache WHERE key = ?", (key,)).rowcount == 1
+
+    def delete_many(self, keys, version=None):
+        keys = [self.make_and_validate_key(k, version=version) for k in keys]
+        if keys:
+            self._db.execute(f"DELETE FROM cache WHERE key IN ({','.join('?' * len(keys))})", keys)
+
+    def clear(self):
+        self._db.execute("DELETE FROM cache")
+
+    def close(self, **kwargs):
+        # Connections are per thread and reused across requests.
+        pass
@@ -0,0 +1,44 @@
+"""
+Metrics for Django's psycopg 3 connection pools (DATABASES[...]["OPTIONS"]["pool"]).
+
+Django keeps one pool per alias and process, created on first use; only pools
+that exist are sampled, so a scrape never opens one.
+"""
+from django.conf import settings
+
+from . import metrics
+
+# get_stats() key -> metric; the pool keeps these totals since it started.
+_COUNTERS = {
+    "requests_num": "db_pool_requests_total",
+    "requests_queued": "db_pool_requests_queued_total",
+    "requests_errors": "db_pool_timeouts_total",
+    "connections_lost": "db_pool_connections_lost_total",
+}
+
+
+def open_pools() -> dict:
+    """Map of alias to the pool Django created for it in this process."""
+    if not any(db["ENGINE"] == "django.db.backends.postgresql" for db in settings.DATABASES.values()):
+        return {}
+    from django.db.backends.postgresql.base import DatabaseWrapper
+
+    return dict(DatabaseWrapper._connection_pools)
+
+
+def record_pool_stats(alias: str, stats: dict) -> None:
+    labels = {"alias": alias}
+    size, available, minimum = stats.get("pool_size", 0), stats.get("pool_available", 0), stats.get("pool_min", 0)
+    metrics.set_value("db_pool_connections", labels, size)
+    metrics.set_value("db_pool_connections_in_use", labels, size - available)
+    metrics.set_value("db_pool_overflow_connections", labels, max(0, size - minimum))
+    metrics.set_value("db_pool_max_connections", labels, stats.get("pool_max", 0))
+    metrics.set_value("db_pool_requests_waiting", labels, stats.get("requests_waiting", 0))
+    metrics.set_value("db_pool_wait_seconds_total", labels, stats.get("requests_wait_ms", 0) / 1000)
+    for key, name in _COUNTERS.items():
+        metrics.set_value(name, labels, stats.get(key, 0))
+
+
+def collect_pool_metrics() -> None:
+    for alias, pool in open_pools().items():
+        record_pool_stats(alias, pool.get_stats())
@@ -0,0 +1,105 @@
+"""
+Read-replica routing with read-your-writes stickiness.
+
+ReplicaMiddleware lets safe-method requests read from a replica unless the client
+wrote within the last REPLICA_STICKY_SECONDS; ReplicaRouter then sends reads of
+REPLICA_APPS models to a random alias from DATABASE_REPLICAS. Writes, unsafe
+requests and everything outside a request (commands, shell, tests) use the primary.
+
+After a successful write the response carries a cookie and an X-Primary-Until
+header with the end of the sticky window (epoch seconds); clients that do not
+keep cookies send the header back.
+"""
+import math
+import random
+import time
+from contextvars import ContextVar
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+from django.core.exceptions import MiddlewareNotUsed
+from django.db import DEFAULT_DB_ALIAS
+
+REPLICA_APPS = frozenset({"core", "auth"})
+SAFE_METHODS = frozenset({"GET", "HEAD", "OPTIONS"})
+STICKY_COOKIE = "sca_primary_until"
+STICKY_HEADER = "X-Primary-Until"
+
+_replica_reads = ContextVar("replica_reads", default=False)
+
+
+def reading_from_replica() -> bool:
+    return _replica_reads.get() and bool(settings.DATABASE_REPLICAS)
+
+
+class ReplicaRouter:
+    def db_for_read(self, model, **hints):
+        if model._meta.app_label in REPLICA_APPS and reading_from_replica():
+            return random.choice(settings.DATABASE_REPLICAS)
+        return DEFAULT_DB_ALIAS
+
+    def db_for_write(self, model, **hints):
+        # Explicit: otherwise saving an instance read from a replica would write back to it.
+        return DEFAULT_DB_ALIAS
+
+    def allow_relation(self, obj1, obj2, **hints):
+        return True
+
+    def allow_migrate(self, db, app_label, model_name=None, **hints):
+        # Replicas get their schema through replication.
+        return False if db in settings.DATABASE_REPLICAS else None
+
+
+def pinned_until(request) -> float:
+    value = request.COOKIES.get(STICKY_COOKIE) or request.headers.get(STICKY_HEADER)
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return 0.0
+
+
+class ReplicaMiddleware:
+    """Route the reads of safe requests to replicas and pin recent writers to the primary."""
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        if not settings.DATABASE_REPLICAS:
+            raise MiddlewareNotUsed
+        self.get_response = get_response
+        self.async_mode = iscoroutinefunction(get_response)
+        if self.async_mode:
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if self.async_mode:
+            return self.__acall__(request)
+        token = _replica_reads.set(self._replica_eligible(request))
+        try:
+            response = self.get_response(request)
+        finally:
+            _replica_reads.reset(token)
+        return self._pin(request, response)
+
+    async def __acall__(self, request):
+        token = _replica_reads.set(self._replica_eligible(request))
+        try:
+            response = await self.get_response(request)
+        finally:
+            _replica_reads.reset(token)
+        return self._pin(request, response)
+
+    @staticmethod
+    def _replica_eligible(request) -> bool:
+        return request.method in SAFE_METHODS and pinned_until(request) <= time.time()
+
+    @staticmethod
+    def _pin(request, response):
+        if request.method in SAFE_METHODS or response.status_code >= 400:
+            return response
+        window = settings.REPLICA_STICKY_SECONDS
+        until = f"{time.time() + window:.3f}"
+        response.set_cookie(STICKY_COOKIE, until, max_age=math.ceil(window), httponly=True, samesite="Lax")
+        response[STICKY_HEADER] = until
+        return response
@@ -0,0 +1,89 @@
+"""
+Read-only row builders for the core list endpoints.
+
+They produce exactly what CatSerializer, TargetSerializer and MissionSerializer
+would return, but work on ``.values()`` rows instead of model instances and
+skip DRF's per-field ``to_representation`` machinery.
+"""
+from django.conf import settings
+from django.utils import timezone
+from rest_framework import ISO_8601, serializers
+from rest_framework.settings import api_settings
+
+from .models import Target
+
+CAT_FIELDS = ("id", "name", "years_of_experience", "breed", "salary", "created_at", "updated_at")
+TARGET_FIELDS = ("id", "name", "country", "notes", "is_complete")
+MISSION_FIELDS = (
+    "id", "assigned_cat", "is_complete", "target_count", "completed_target_count", "created_at", "updated_at",
+)
+
+_datetime = serializers.DateTimeField()
+
+
+def datetime_formatter():
+    """
+    Return a callable rendering datetimes exactly like DRF's DateTimeField.
+    The default ISO 8601 case is inlined; any other DATETIME_FORMAT falls back to the field.
+    """
+    if (api_settings.DATETIME_FORMAT or "").lower() != ISO_8601 or not settings.USE_TZ:
+        return _datetime.to_representation
+    tz = timezone.get_current_timezone()
+
+    def to_str(value):
+        if not value:
+            return None
+        value = value.astimezone(tz).isoformat()
+        if value.endswith("+00:00"):
+            return value[:-6] + "Z"
+        return value
+
+    return to_str
+
+
+def cat_rows(rows) -> list:
+    to_str = datetime_formatter()
+    for row in rows:
+        row["created_at"] = to_str(row["created_at"])
+        row["updated_at"] = to_str(row["updated_at"])
+    return rows
+
+
+def _targets_query(mission_ids):
+    qs = Target.objects.filter(mission_id__in=mission_ids).order_by("id")
+    return qs.values_list("mission_id", *TARGET_FIELDS)
+
+
+def targets_by_mission(mission_ids) -> dict:
+    """Inline targets of the given missions, grouped by mission id in one pass."""
+    grouped = {}
+    for mission_id, *values in _targets_query(mission_ids):
+        grouped.setdefault(mission_id, []).append(dict(zip(TARGET_FIELDS, values)))
+    return grouped
+
+
+async def atargets_by_mission(mission_ids) -> dict:
+    grouped = {}
+    async for mission_id, *values in _targets_query(mission_ids):
+        grouped.setdefault(mission_id, []).append(dict(zip(TARGET_FIELDS, values)))
+    return grouped
+
+
+def mission_rows(rows, grouped=None) -> list:
+    """``grouped`` is the targets_by_mission result, loaded here when not given."""
+    to_str = datetime_formatter()
+    if grouped is None:
+        grouped = targets_by_mission([row["id"] for row in rows])
+    return [
+        {
+            "id": row["id"],
+            "assigned_cat": row["assigned_cat"],
+            "is_complete": row["is_complete"],
+            "target_count": row["target_count"],
+            "completed_target_count": row["completed_target_count"],
+            "targets": grouped.get(row["id"], []),
+            "created_at": to_str(row["created_at"]),
+            "updated_at": to_str(row["updated_at"]),
+        }
+        for row in rows
+    ]
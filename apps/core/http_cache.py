@@ -0,0 +1,157 @@
+"""
+Conditional GET for the core read endpoints.
+
+Each core table has a version counter in the shared cache. Every INSERT, UPDATE or
+DELETE on a tracked table bumps it, whatever issued the statement (ORM saves,
+QuerySet.update, bulk_create, cascades, admin, management commands). A response's
+ETag is derived from the request URL and the versions of the tables it reads.
+
+Versions move when the primary commits, while a replica may still serve the old
+rows, so replica-rendered responses get their own ETag and are cached for no
+longer than the replica sticky window.
+"""
+import functools
+import hashlib
+import re
+import time
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.core.cache import cache
+from django.db import connections, transaction
+from django.http import HttpResponseNotModified
+from django.utils.http import parse_etags
+from rest_framework.response import Response
+
+from .db_router import reading_from_replica
+
+VERSION_KEY = "core:table-version:{}"
+RESPONSE_KEY = "core:response:{}"
+TRACKED_TABLES = frozenset({"core_cat", "core_mission", "core_target"})
+WRITE_STATEMENTS = ("INSERT", "UPDATE", "DELETE")
+_write_table = re.compile(r'(?:INSERT\s+INTO|UPDATE|DELETE\s+FROM)\s+"?(\w+)"?', re.IGNORECASE)
+
+
+def bump_version(table: str) -> None:
+    key = VERSION_KEY.format(table)
+    # A lost counter restarts from the clock so it never reuses a version already handed out.
+    cache.add(key, time.time_ns(), timeout=None)
+    try:
+        cache.incr(key)
+    except ValueError:
+        cache.set(key, time.time_ns(), timeout=None)
+
+
+def table_versions(tables) -> list:
+    keys = [VERSION_KEY.format(t) for t in tables]
+    found = cache.get_many(keys)
+    versions = []
+    for table, key in zip(tables, keys):
+        if key not in found:
+            bump_version(table)
+            found[key] = cache.get(key)
+        versions.append(found[key])
+    return versions
+
+
+class WriteTracker:
+    """
+    execute_wrapper bumping the version of a tracked table written by a statement.
+    The version moves when the statement runs and again on commit, so a reader
+    that raced the open transaction cannot pin pre-commit data to the new version.
+    """
+
+    def __init__(self, alias: str):
+        self.alias = alias
+
+    def __call__(self, execute, sql, params, many, context):
+        result = execute(sql, params, many, context)
+        if sql[:6].upper() in WRITE_STATEMENTS:
+            match = _write_table.match(sql)
+            if match and match.group(1) in TRACKED_TABLES:
+                table = match.group(1)
+                bump_version(table)
+                transaction.on_commit(functools.partial(bump_version, table), using=self.alias)
+        return result
+
+
+def install_write_tracker(sender=None, connection=None, **kwargs) -> None:
+    """
+    connection_created receiver; also safe to call for already open connections.
+    The tracker goes to the front: connections open lazily inside execute_wrapper()
+    blocks, which pop the last wrapper on exit.
+    """
+    if not any(isinstance(w, WriteTracker) for w in connection.execute_wrappers):
+        connection.execute_wrappers.insert(0, WriteTracker(connection.alias))
+
+
+def install_on_open_connections() -> None:
+    for conn in connections.all(initialized_only=True):
+        install_write_tracker(connection=conn)
+
+
+async def atable_versions(tables) -> list:
+    keys = [VERSION_KEY.format(t) for t in tables]
+    found = await cache.aget_many(keys)
+    if len(found) < len(keys):
+        return await sync_to_async(table_versions)(tables)
+    return [found[key] for key in keys]
+
+
+def etag_for(request, tables, versions=None) -> str:
+    if versions is None:
+        versions = table_versions(tables)
+    # Absolute URL: paginated bodies embed next/previous links built from the Host header.
+    raw = f"{request.build_absolute_uri()}|{'.'.join(map(str, versions))}"
+    if reading_from_replica():
+        raw += "|replica"
+    return '"' + hashlib.blake2b(raw.encode(), digest_size=16).hexdigest() + '"'
+
+
+def response_timeout() -> float:
+    if reading_from_replica():
+        return min(settings.RESPONSE_CACHE_TIMEOUT, settings.REPLICA_STICKY_SECONDS)
+    return settings.RESPONSE_CACHE_TIMEOUT
+
+
+def etag_matches(request, etag: str) -> bool:
+    header = request.META.get("HTTP_IF_NONE_MATCH")
+    if not header:
+        return False
+    tags = parse_etags(header)
+    return "*" in tags or etag in (t.removeprefix("W/") for t in tags)
+
+
+def precondition(request, tables, versions) -> tuple:
+    """(etag, response cache key) for a read of ``tables``, or (etag, None) when If-None-Match matches."""
+    etag = etag_for(request, tables, versions)
+    if etag_matches(request, etag):
+        return etag, None
+    return etag, RESPONSE_KEY.format(etag.strip('"'))
+
+
+def conditional_get(*models):
+    """
+    Decorate a list/retrieve handler to answer If-None-Match with 304 and to reuse
+    the response data of an unchanged resource without touching the database.
+    """
+    tables = tuple(m._meta.db_table for m in models)
+
+    def decorator(handler):
+        @functools.wraps(handler)
+        def wrapper(self, request, *args, **kwargs):
+            if not settings.RESPONSE_CACHE_ENABLED:
+                return handler(self, request, *args, **kwargs)
+            etag, key = precondition(request, tables, table_versions(tables))
+            if key is None:
+                return HttpResponseNotModified(headers={"ETag": etag})
+            data = cache.get(key)
+            if data is not None:
+                return Response(data, headers={"ETag": etag})
+            response = handler(self, request, *args, **kwargs)
+            if response.status_code == 200:
+                cache.set(key, response.data, timeout=response_timeout())
+                response["ETag"] = etag
+            return response
+        return wrapper
+    return decorator
@@ -0,0 +1,214 @@
+import math
+import random
+import threading
+import time
+from urllib.parse import urlsplit
+
+import requests
+from django.conf import settings
+from requests.adapters import HTTPAdapter
+
+from . import metrics
+
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+RETRY_STATUSES = frozenset({429, 502, 503, 504})
+
+
+class HostLimitExceeded(requests.exceptions.ConnectionError):
+    """Too many concurrent outbound requests to one host."""
+
+
+def _wait_timeout(timeout):
+    """Seconds to wait for a host slot: requests' timeout, or its connect part for a (connect, read) tuple."""
+    return timeout[0] if isinstance(timeout, tuple) else timeout
+
+
+class HostStats:
+    __slots__ = ("requests", "errors", "retries", "in_flight", "latency_total", "latency_max")
+
+    def __init__(self):
+        self.requests = 0
+        self.errors = 0
+        self.retries = 0
+        self.in_flight = 0
+        self.latency_total = 0.0
+        self.latency_max = 0.0
+
+    def as_dict(self) -> dict:
+        return {
+            "requests": self.requests,
+            "errors": self.errors,
+            "retries": self.retries,
+            "in_flight": self.in_flight,
+            "latency_total": self.latency_total,
+            "latency_max": self.latency_max,
+            "latency_avg": self.latency_total / self.requests if self.requests else 0.0,
+        }
+
+
+class HTTPClient:
+    """
+    Shared outbound HTTP client.
+    Keeps one pooled keep-alive session per process, retries idempotent requests
+    with jittered exponential backoff and caps concurrent requests per host.
+    """
+
+    def __init__(
+        self,
+        pool_connections: int = 4,
+        pool_maxsize: int = 8,
+        max_retries: int = 2,
+        backoff: float = 0.2,
+        backoff_max: float = 2.0,
+        per_host_limit: int = 8,
+        timeout: float = 10,
+    ):
+        self.pool_connections = pool_connections
+        self.pool_maxsize = pool_maxsize
+        self.max_retries = max_retries
+        self.backoff = backoff
+        self.backoff_max = backoff_max
+        self.per_host_limit = per_host_limit
+        self.timeout = timeout
+        self._session = None
+        self._adapter = None
+        self._lock = threading.Lock()
+        self._host_limits = {}
+        self._stats = {}
+
+    def _get_session(self) -> requests.Session:
+        if self._session is None:
+            with self._lock:
+                if self._session is None:
+                    adapter = HTTPAdapter(
+                        pool_connections=self.pool_connections,
+                        pool_maxsize=self.pool_maxsize,
+                        pool_block=False,
+                        max_retries=0,
+                    )
+                    session = requests.Session()
+                    session.mount("http://", adapter)
+                    session.mount("https://", adapter)
+                    self._adapter = adapter
+                    self._session = session
+        return self._session
+
+    def _host_state(self, host: str):
+        with self._lock:
+            if host not in self._host_limits:
+                self._host_limits[host] = threading.BoundedSemaphore(self.per_host_limit)
+                self._stats[host] = HostStats()
+            return self._host_limits[host], self._stats[host]
+
+    def max_duration(self, timeout) -> float:
+        """
+        Upper bound for one request with ``timeout``: the host slot wait plus every
+        attempt timing out and the longest backoff between them. requests applies the
+        read timeout per socket read, so a server trickling bytes can still exceed it.
+        """
+        if timeout is None:
+            return math.inf
+        attempt = sum(timeout) if isinstance(timeout, tuple) else timeout
+        backoff = sum(min(self.backoff_max, self.backoff * (2 ** n)) for n in range(self.max_retries))
+        return _wait_timeout(timeout) + attempt * (self.max_retries + 1) + backoff
+
+    def _sleep_before_retry(self, attempt: int) -> None:
+        time.sleep(random.uniform(0, min(self.backoff_max, self.backoff * (2 ** attempt))))
+
+    def request(self, method: str, url: str, **kwargs) -> requests.Response:
+        method = method.upper()
+        kwargs.setdefault("timeout", self.timeout)
+        session = self._get_session()
+        host = urlsplit(url).netloc
+        limit, stats = self._host_state(host)
+        retries = self.max_retries if method in IDEMPOTENT_METHODS else 0
+        if not limit.acquire(timeout=_wait_timeout(kwargs["timeout"])):
+            with self._lock:
+                stats.errors += 1
+            raise HostLimitExceeded(f"Concurrency limit reached for {host}")
+        try:
+            attempt = 0
+            while True:
+                with self._lock:
+                    stats.in_flight += 1
+                started = time.perf_counter()
+                outcome = "error"
+                failed = False
+                try:
+                    resp = session.request(method, url, **kwargs)
+                    outcome = str(resp.status_code)
+                except (requests.exceptions.ConnectionError, requests.exceptions.Timeout):
+                    failed = True
+                    if attempt >= retries:
+                        raise
+                else:
+                    if resp.status_code not in RETRY_STATUSES or attempt >= retries:
+                        return resp
+                    resp.close()
+                finally:
+                    elapsed = time.perf_counter() - started
+                    with self._lock:
+                        stats.in_flight -= 1
+                        stats.requests += 1
+                        if failed:
+                            stats.errors += 1
+                        stats.latency_total += elapsed
+                        stats.latency_max = max(stats.latency_max, elapsed)
+                    metrics.observe("outbound_request_duration_seconds", {"host": host, "status": outcome}, elapsed)
+                with self._lock:
+                    stats.retries += 1
+                self._sleep_before_retry(attempt)
+                attempt += 1
+        finally:
+            limit.release()
+
+    def get(self, url: str, **kwargs) -> requests.Response:
+        return self.request("GET", url, **kwargs)
+
+    def pool_stats(self) -> dict:
+        """Connections opened and currently checked out for every pooled host."""
+        if self._adapter is None:
+            return {}
+        result = {}
+        for key, pool in list(self._adapter.poolmanager.pools._container.items()):
+            result[f"{key.key_scheme}://{key.key_host}:{key.key_port}"] = {
+                "connections_opened": pool.num_connections,
+                "requests": pool.num_requests,
+                "in_use": pool.pool.maxsize - pool.pool.qsize() if pool.pool is not None else 0,
+                "maxsize": self.pool_maxsize,
+            }
+        return result
+
+    def stats(self) -> dict:
+        with self._lock:
+            hosts = {host: s.as_dict() for host, s in self._stats.items()}
+        return {"hosts": hosts, "pools": self.pool_stats()}
+
+    def close(self) -> None:
+        with self._lock:
+            if self._session is not None:
+                self._session.close()
+            self._session = None
+            self._adapter = None
+
+
+_client: HTTPClient | None = None
+_client_lock = threading.Lock()
+
+
+def get_client() -> HTTPClient:
+    global _client
+    if _client is None:
+        with _client_lock:
+            if _client is None:
+                conf = settings.OUTBOUND_HTTP
+                _client = HTTPClient(
+                    pool_connections=conf["POOL_CONNECTIONS"],
+                    pool_maxsize=conf["POOL_MAXSIZE"],
+                    max_retries=conf["MAX_RETRIES"],
+                    backoff=conf["BACKOFF"],
+                    backoff_max=conf["BACKOFF_MAX"],
+                    per_host_limit=conf["PER_HOST_LIMIT"],
+                    timeout=conf["TIMEOUT"],
+                )
+    return _client
@@ -0,0 +1,21 @@
+import os
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from apps.core.schema import build
+
+
+class Command(BaseCommand):
+    help = "Build the OpenAPI schema served at /api/schema/ into versioned files; run on every deploy."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--dir",
+            default=settings.SCHEMA_DIR,
+            help="Output directory (defaults to SCHEMA_DIR).",
+        )
+
+    def handle(self, *args, **options):
+        for path in build(options["dir"]):
+            self.stdout.write(self.style.SUCCESS(f"Wrote {path} ({os.path.getsize(path)} bytes)"))
@@ -0,0 +1,26 @@
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from apps.core.services import BreedsUnavailable, fetch_breeds, write_breed_snapshot
+
+
+class Command(BaseCommand):
+    help = "Export the TheCatAPI breed list to a snapshot file loaded at startup."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--output",
+            default=settings.BREEDS_SNAPSHOT_PATH,
+            help="Snapshot path (defaults to BREEDS_SNAPSHOT_PATH).",
+        )
+
+    def handle(self, *args, **options):
+        path = options["output"]
+        if not path:
+            raise CommandError("No output path given and BREEDS_SNAPSHOT_PATH is not set.")
+        try:
+            breeds = fetch_breeds()
+        except BreedsUnavailable as exc:
+            raise CommandError(str(exc)) from exc
+        count = write_breed_snapshot(path, breeds)
+        self.stdout.write(self.style.SUCCESS(f"Wrote {count} breeds to {path}"))
@@ -0,0 +1,47 @@
+import csv
+import json
+from pathlib import Path
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from apps.core.bulk import import_cats
+from apps.core.services import BreedsUnavailable
+
+
+def read_rows(path: Path, fmt: str):
+    with path.open(encoding="utf-8", newline="") as fh:
+        if fmt == "csv":
+            return list(csv.DictReader(fh))
+        rows = []
+        for number, line in enumerate(fh, start=1):
+            if not line.strip():
+                continue
+            try:
+                rows.append(json.loads(line))
+            except ValueError as exc:
+                raise CommandError(f"Line {number} is not valid JSON: {exc}") from exc
+        return rows
+
+
+class Command(BaseCommand):
+    help = "Bulk import cats from a CSV or NDJSON file (columns: name, years_of_experience, breed, salary)."
+
+    def add_arguments(self, parser):
+        parser.add_argument("path")
+        parser.add_argument("--format", choices=["csv", "ndjson"], help="Defaults to the file extension.")
+        parser.add_argument("--batch-size", type=int, default=settings.BULK_BATCH_SIZE)
+
+    def handle(self, *args, **options):
+        path = Path(options["path"])
+        if not path.exists():
+            raise CommandError(f"{path} does not exist.")
+        fmt = options["format"] or ("csv" if path.suffix.lower() == ".csv" else "ndjson")
+        rows = read_rows(path, fmt)
+        try:
+            created, rejects = import_cats(rows, batch_size=options["batch_size"])
+        except BreedsUnavailable as exc:
+            raise CommandError(str(exc)) from exc
+        for reject in rejects:
+            self.stderr.write(f"row {reject['row']}: {json.dumps(reject['errors'])}")
+        self.stdout.write(self.style.SUCCESS(f"Imported {created} cats, rejected {len(rejects)}."))
@@ -0,0 +1,67 @@
+import json
+import subprocess
+import sys
+import time
+from collections import defaultdict
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from apps.core.startup import PHASES, parse_profile
+
+
+class Command(BaseCommand):
+    help = (
+        "Start a fresh interpreter, load the WSGI application, warm it and serve one GET, "
+        "reporting the time of each phase and the import-time cost of every module."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--path", default="/api/cats/", help="Request served as the first one.")
+        parser.add_argument("--top", type=int, default=20, help="Packages and modules to list.")
+        parser.add_argument("--json", action="store_true", help="Print every module as JSON.")
+
+    def handle(self, *args, **options):
+        started = time.perf_counter()
+        proc = subprocess.run(
+            [sys.executable, "-X", "importtime", "-m", "apps.core.startup", options["path"]],
+            cwd=settings.BASE_DIR,
+            stdin=subprocess.DEVNULL,
+            capture_output=True,
+            text=True,
+        )
+        wall_ms = (time.perf_counter() - started) * 1000
+        profile = parse_profile(proc.stderr)
+        if proc.returncode or profile["status"] is None:
+            raise CommandError(f"Start-up failed:\n{proc.stderr[-4000:]}")
+        profile["process_ms"] = round(wall_ms, 1)
+        if options["json"]:
+            self.stdout.write(json.dumps(profile, indent=2))
+            return
+        self._report(profile, options["top"])
+
+    def _report(self, profile: dict, top: int) -> None:
+        out = self.stdout.write
+        out(f"First request: GET -> {profile['status']}")
+        for phase in PHASES:
+            imported = sum(m["self_ms"] for m in profile["modules"] if m["phase"] == phase)
+            out(f"  {phase:<14} {profile['phases'][phase]:8.1f} ms   imports {imported:7.1f} ms")
+        out(f"  {'process':<14} {profile['process_ms']:8.1f} ms   (interpreter start to exit)")
+
+        packages = defaultdict(lambda: defaultdict(float))
+        for module in profile["modules"]:
+            packages[module["module"].split(".")[0]][module["phase"]] += module["self_ms"]
+        ranked = sorted(packages.items(), key=lambda item: -sum(item[1].values()))[:top]
+        out("")
+        out(f"{'package':<32} {'total ms':>9}" + "".join(f" {phase:>14}" for phase in PHASES))
+        for name, by_phase in ranked:
+            row = "".join(f" {by_phase.get(phase, 0):14.1f}" for phase in PHASES)
+            out(f"{name:<32} {sum(by_phase.values()):9.1f}{row}")
+
+        out("")
+        out(f"{'module':<48} {'self ms':>8} {'cumulative':>11}  phase")
+        for module in sorted(profile["modules"], key=lambda m: -m["self_ms"])[:top]:
+            out(
+                f"{module['module']:<48} {module['self_ms']:8.1f} {module['cumulative_ms']:11.1f}"
+                f"  {module['phase'] or 'interpreter'}"
+            )
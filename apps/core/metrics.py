@@ -0,0 +1,307 @@
+"""
+Process-local metrics with a file-backed multiprocess collector.
+
+Every worker keeps counters and histograms in memory and, when METRICS_DIR is set,
+dumps them to ``<METRICS_DIR>/<pid>.json`` at most every METRICS_FLUSH_INTERVAL
+seconds and on exit. The /metrics view merges all worker files with its own live
+values and renders them in the Prometheus text exposition format.
+
+Gauges are summed across workers too, so per-process values such as pool sizes
+add up to the host total. When a worker exits, gunicorn's child_exit hook calls
+``mark_process_dead``: its gauges are dropped and its counters and histograms are
+folded into ``dead.json`` so totals never go backwards. Collectors registered with ``add_collector`` refresh
+sampled values right before each flush and scrape.
+"""
+import atexit
+import glob
+import hmac
+import json
+import os
+import threading
+import time
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+from django.core.exceptions import MiddlewareNotUsed
+from django.http import Http404, HttpResponse
+
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+COUNTER = "counter"
+GAUGE = "gauge"
+HISTOGRAM = "histogram"
+
+# Counters and histograms of workers that have exited (see mark_process_dead).
+DEAD_WORKERS_FILE = "dead.json"
+
+# name: (type, help, buckets)
+METRICS = {
+    "http_request_duration_seconds": (HISTOGRAM, "Request latency by route, method and status.", DEFAULT_BUCKETS),
+    "http_request_db_duration_seconds": (HISTOGRAM, "Time spent in SQL per request by route.", DEFAULT_BUCKETS),
+    "http_request_db_queries_total": (COUNTER, "SQL statements executed by route.", None),
+    "breed_index_lookups_total": (COUNTER, "Breed index lookups by result (hit, stale, miss).", None),
+    "outbound_request_duration_seconds": (HISTOGRAM, "Outbound HTTP latency by host and status.", DEFAULT_BUCKETS),
+    "db_pool_connections": (GAUGE, "Open connections in the database pool.", None),
+    "db_pool_connections_in_use": (GAUGE, "Pool connections checked out by requests.", None),
+    "db_pool_overflow_connections": (GAUGE, "Pool connections open above min_size.", None),
+    "db_pool_max_connections": (GAUGE, "Configured pool max_size.", None),
+    "db_pool_requests_waiting": (GAUGE, "Requests currently waiting for a pool connection.", None),
+    "db_pool_requests_total": (COUNTER, "Connections handed out by the pool.", None),
+    "db_pool_requests_queued_total": (COUNTER, "Requests that had to wait for a pool connection.", None),
+    "db_pool_wait_seconds_total": (COUNTER, "Time requests spent waiting for a pool connection.", None),
+    "db_pool_timeouts_total": (COUNTER, "Requests that timed out waiting for a pool connection.", None),
+    "db_pool_connections_lost_total": (COUNTER, "Pool connections found broken by the health check.", None),
+}
+
+_values = {}
+_collectors = []
+_lock = threading.Lock()
+_next_flush = 0.0
+_atexit_registered = False
+
+
+def _key(name: str, labels: dict) -> tuple:
+    return name, tuple(sorted(labels.items()))
+
+
+def series(name: str, labels: dict) -> tuple:
+    """Key of one labelled series, to build once for ``inc_series`` on hot paths."""
+    if name not in METRICS:
+        raise KeyError(f"Unknown metric {name!r}")
+    return _key(name, labels)
+
+
+def inc(name: str, labels: dict, amount: float = 1) -> None:
+    inc_series(_key(name, labels), amount)
+
+
+def inc_series(key: tuple, amount: float = 1) -> None:
+    with _lock:
+        _values[key] = _values.get(key, 0) + amount
+
+
+def set_value(name: str, labels: dict, value: float) -> None:
+    """Set a gauge, or a counter sampled from a source that keeps its own running total."""
+    with _lock:
+        _values[_key(name, labels)] = value
+
+
+def observe(name: str, labels: dict, value: float) -> None:
+    """Record one histogram sample; stored as per-bucket counts followed by sum and count."""
+    buckets = METRICS[name][2]
+    key = _key(name, labels)
+    with _lock:
+        sample = _values.get(key)
+        if sample is None:
+            sample = _values[key] = [0] * (len(buckets) + 2)
+        for i, bound in enumerate(buckets):
+            if value <= bound:
+                sample[i] += 1
+                break
+        sample[-2] += value
+        sample[-1] += 1
+
+
+def add_collector(callback) -> None:
+    if callback not in _collectors:
+        _collectors.append(callback)
+
+
+def run_collectors() -> None:
+    for callback in list(_collectors):
+        callback()
+
+
+def snapshot() -> dict:
+    with _lock:
+        return {key: list(v) if isinstance(v, list) else v for key, v in _values.items()}
+
+
+def reset() -> None:
+    global _next_flush
+    with _lock:
+        _values.clear()
+    _next_flush = 0.0
+
+
+def _worker_file(directory, pid=None) -> str:
+    return os.path.join(directory, f"{pid or os.getpid()}.json")
+
+
+def _dump(path: str, values: dict) -> None:
+    rows = [[name, list(labels), value] for (name, labels), value in values.items()]
+    tmp = f"{path}.tmp"
+    with open(tmp, "w", encoding="utf-8") as fh:
+        json.dump(rows, fh, separators=(",", ":"))
+    os.replace(tmp, path)
+
+
+def _load(path: str, into: dict, kinds=(COUNTER, GAUGE, HISTOGRAM)) -> None:
+    try:
+        with open(path, encoding="utf-8") as fh:
+            rows = json.load(fh)
+    except (OSError, ValueError):
+        return
+    for name, labels, value in rows:
+        if name in METRICS and METRICS[name][0] in kinds:
+            _merge(into, (name, tuple(tuple(pair) for pair in labels)), value)
+
+
+def flush(directory=None) -> None:
+    directory = directory or settings.METRICS_DIR
+    if not directory:
+        return
+    os.makedirs(directory, exist_ok=True)
+    _dump(_worker_file(directory), snapshot())
+
+
+def mark_process_dead(pid: int, directory=None) -> None:
+    """Fold an exited worker's counters and histograms into dead.json and drop its gauges."""
+    directory = directory or settings.METRICS_DIR
+    path = _worker_file(directory, pid) if directory else None
+    if path is None or not os.path.exists(path):
+        return
+    dead_path = os.path.join(directory, DEAD_WORKERS_FILE)
+    totals = {}
+    _load(dead_path, totals)
+    _load(path, totals, kinds=(COUNTER, HISTOGRAM))
+    _dump(dead_path, totals)
+    os.remove(path)
+
+
+def flush_if_due() -> None:
+    global _next_flush, _atexit_registered
+    if not settings.METRICS_DIR:
+        return
+    now = time.monotonic()
+    if now < _next_flush:
+        return
+    _next_flush = now + settings.METRICS_FLUSH_INTERVAL
+    if not _atexit_registered:
+        _atexit_registered = True
+        atexit.register(flush, settings.METRICS_DIR)
+    run_collectors()
+    flush()
+
+
+def _merge(total: dict, key: tuple, value) -> None:
+    current = total.get(key)
+    if current is None:
+        total[key] = list(value) if isinstance(value, list) else value
+    elif isinstance(current, list):
+        for i, v in enumerate(value):
+            current[i] += v
+    else:
+        total[key] = current + value
+
+
+def collect(directory=None) -> dict:
+    """Live values of this process merged with the last dump of every other worker."""
+    directory = directory or settings.METRICS_DIR
+    total = {}
+    if directory:
+        own = _worker_file(directory)
+        for path in glob.glob(os.path.join(directory, "*.json")):
+            if path != own:
+                _load(path, total)
+    for key, value in snapshot().items():
+        _merge(total, key, value)
+    return total
+
+
+def _format_labels(labels, extra=()) -> str:
+    pairs = list(labels) + list(extra)
+    if not pairs:
+        return ""
+    escaped = (
+        (k, str(v).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')) for k, v in pairs
+    )
+    return "{" + ",".join(f'{k}="{v}"' for k, v in escaped) + "}"
+
+
+def _format_value(value) -> str:
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+def render(values: dict) -> str:
+    by_name = {}
+    for (name, labels), value in values.items():
+        by_name.setdefault(name, []).append((labels, value))
+    lines = []
+    for name in sorted(by_name):
+        kind, help_text, buckets = METRICS[name]
+        lines.append(f"# HELP {name} {help_text}")
+        lines.append(f"# TYPE {name} {kind}")
+        for labels, value in sorted(by_name[name]):
+            if kind != HISTOGRAM:
+                lines.append(f"{name}{_format_labels(labels)} {_format_value(value)}")
+                continue
+            cumulative = 0
+            for bound, count in zip(buckets, value):
+                cumulative += count
+                lines.append(f"{name}_bucket{_format_labels(labels, [('le', repr(bound))])} {cumulative}")
+            lines.append(f"{name}_bucket{_format_labels(labels, [('le', '+Inf')])} {value[-1]}")
+            lines.append(f"{name}_sum{_format_labels(labels)} {_format_value(value[-2])}")
+            lines.append(f"{name}_count{_format_labels(labels)} {value[-1]}")
+    return "\n".join(lines) + "\n"
+
+
+def metrics_view(request):
+    if not settings.METRICS_ENABLED:
+        raise Http404
+    if settings.METRICS_TOKEN and not hmac.compare_digest(
+        request.headers.get("Authorization", "").encode(), f"Bearer {settings.METRICS_TOKEN}".encode()
+    ):
+        response = HttpResponse("Unauthorized.\n", status=401, content_type=CONTENT_TYPE)
+        response["WWW-Authenticate"] = 'Bearer realm="metrics"'
+        return response
+    run_collectors()
+    return HttpResponse(render(collect()), content_type=CONTENT_TYPE)
+
+
+class MetricsMiddleware:
+    """
+    Record latency per route, method and status plus SQL time and statement count.
+    Must sit before QueryBudgetMiddleware, which provides ``request.query_stats``.
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        if not settings.METRICS_ENABLED:
+            raise MiddlewareNotUsed
+        self.get_response = get_response
+        self.async_mode = iscoroutinefunction(get_response)
+        if self.async_mode:
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if self.async_mode:
+            return self.__acall__(request)
+        started = time.perf_counter()
+        response = self.get_response(request)
+        self._record(request, response, time.perf_counter() - started)
+        return response
+
+    async def __acall__(self, request):
+        started = time.perf_counter()
+        response = await self.get_response(request)
+        self._record(request, response, time.perf_counter() - started)
+        return response
+
+    @staticmethod
+    def _record(request, response, elapsed: float) -> None:
+        match = getattr(request, "resolver_match", None)
+        route = (match.view_name or match._func_path) if match is not None else "<unmatched>"
+        observe(
+            "http_request_duration_seconds",
+            {"route": route, "method": request.method, "status": str(response.status_code)},
+            elapsed,
+        )
+        stats = getattr(request, "query_stats", None)
+        if stats is not None:
+            observe("http_request_db_duration_seconds", {"route": route}, stats.duration)
+            inc("http_request_db_queries_total", {"route": route}, stats.count)
+        flush_if_due()
@@ -0,0 +1,29 @@
+# Generated by Django 5.2.18 on 2026-10-18 01:38
+
+from django.db import migrations, models
+from django.db.models import Exists, OuterRef, Q
+
+
+def unassign_duplicate_active_missions(apps, schema_editor):
+    # A cat keeps its newest active mission (latest created_at, then highest id);
+    # its other active missions are unassigned so the constraint can be added.
+    Mission = apps.get_model("core", "Mission")
+    newer = Mission.objects.filter(assigned_cat=OuterRef("assigned_cat"), is_complete=False).filter(
+        Q(created_at__gt=OuterRef("created_at")) | Q(created_at=OuterRef("created_at"), id__gt=OuterRef("id"))
+    )
+    Mission.objects.filter(is_complete=False, assigned_cat__isnull=False).filter(Exists(newer)).update(assigned_cat=None)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.RunPython(unassign_duplicate_active_missions, migrations.RunPython.noop),
+        migrations.AddConstraint(
+            model_name='mission',
+            constraint=models.UniqueConstraint(condition=models.Q(('is_complete', False)), fields=('assigned_cat',), name='uniq_active_mission_per_cat'),
+        ),
+    ]
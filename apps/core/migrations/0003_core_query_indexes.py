@@ -0,0 +1,37 @@
+# Generated by Django 5.2.18 on 2026-10-18 01:40
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0002_mission_uniq_active_mission_per_cat'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='cat',
+            index=models.Index(fields=['breed', '-id'], name='cat_breed_id_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='mission',
+            index=models.Index(condition=models.Q(('is_complete', False)), fields=['-id'], include=('assigned_cat',), name='mission_active_id_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='mission',
+            index=models.Index(condition=models.Q(('is_complete', True)), fields=['-id'], name='mission_done_id_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='target',
+            index=models.Index(condition=models.Q(('is_complete', False)), fields=['-id'], name='target_open_id_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='target',
+            index=models.Index(condition=models.Q(('is_complete', True)), fields=['-id'], name='target_done_id_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='target',
+            index=models.Index(fields=['country', '-id'], name='target_country_id_idx'),
+        ),
+    ]
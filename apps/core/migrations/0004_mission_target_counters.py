@@ -0,0 +1,44 @@
+# Generated by Django 5.2.18 on 2026-10-18 01:43
+
+from django.db import migrations, models
+from django.db.models import Count, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+
+
+def backfill_counters(apps, schema_editor):
+    Mission = apps.get_model("core", "Mission")
+    Target = apps.get_model("core", "Target")
+
+    def count(**filters):
+        return Coalesce(
+            Subquery(
+                Target.objects.filter(mission=OuterRef("pk"), **filters)
+                .values("mission")
+                .annotate(n=Count("id"))
+                .values("n")
+            ),
+            0,
+        )
+
+    Mission.objects.update(target_count=count(), completed_target_count=count(is_complete=True))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0003_core_query_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='mission',
+            name='completed_target_count',
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='mission',
+            name='target_count',
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.RunPython(backfill_counters, migrations.RunPython.noop),
+    ]
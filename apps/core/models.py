@@ -7,12 +7,33 @@ class Cat(models.Model):
     salary = models.PositiveIntegerField()
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
+    class Meta:
+        indexes = [models.Index(fields=["breed", "-id"], name="cat_breed_id_idx")]
 
 class Mission(models.Model):
     assigned_cat = models.ForeignKey(Cat, null=True, blank=True, on_delete=models.SET_NULL, related_name="missions")
     is_complete = models.BooleanField(default=False)
+    target_count = models.PositiveIntegerField(default=0)
+    completed_target_count = models.PositiveIntegerField(default=0)
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=["assigned_cat"],
+                condition=models.Q(is_complete=False),
+                name="uniq_active_mission_per_cat",
+            )
+        ]
+        indexes = [
+            models.Index(
+                fields=["-id"],
+                include=["assigned_cat"],
+                condition=models.Q(is_complete=False),
+                name="mission_active_id_idx",
+            ),
+            models.Index(fields=["-id"], condition=models.Q(is_complete=True), name="mission_done_id_idx"),
+        ]
 
 class Target(models.Model):
     mission = models.ForeignKey(Mission, on_delete=models.CASCADE, related_name="targets")
@@ -23,3 +44,8 @@ class Target(models.Model):
     updated_at = models.DateTimeField(auto_now=True)
     class Meta:
         constraints = [models.UniqueConstraint(fields=["mission", "name"], name="uniq_target_name_in_mission")]
+        indexes = [
+            models.Index(fields=["-id"], condition=models.Q(is_complete=False), name="target_open_id_idx"),
+            models.Index(fields=["-id"], condition=models.Q(is_complete=True), name="target_done_id_idx"),
+            models.Index(fields=["country", "-id"], name="target_country_id_idx"),
+        ]
@@ -0,0 +1,60 @@
+from django.conf import settings
+from rest_framework.pagination import CursorPagination, _positive_int
+
+
+class IdCursorPagination(CursorPagination):
+    """
+    Keyset pagination over the "-id" ordering of the core list endpoints.
+    Each page is a "WHERE id < <cursor>" range scan on the primary key, so deep pages
+    cost the same as the first one.
+    """
+    ordering = "-id"
+    page_size_query_param = "page_size"
+
+    def get_page_size(self, request):
+        try:
+            return _positive_int(
+                request.query_params[self.page_size_query_param],
+                strict=True,
+                cutoff=settings.CORE_MAX_PAGE_SIZE,
+            )
+        except (KeyError, ValueError):
+            return settings.CORE_PAGE_SIZE
+
+    async def apaginate_queryset(self, queryset, request) -> list:
+        """
+        Async twin of paginate_queryset for the "-id" ordering, fetching the page with
+        the async ORM. It sets the same state, so get_next_link/get_previous_link apply.
+        """
+        self.request = request
+        self.page_size = self.get_page_size(request)
+        self.base_url = request.build_absolute_uri()
+        self.ordering = (self.ordering,) if isinstance(self.ordering, str) else tuple(self.ordering)
+        self.cursor = self.decode_cursor(request)
+        offset, reverse, current_position = self.cursor or (0, False, None)
+
+        queryset = queryset.order_by("id" if reverse else "-id")
+        if current_position is not None:
+            queryset = queryset.filter(**{"id__gt" if reverse else "id__lt": current_position})
+        results = [row async for row in queryset[offset:offset + self.page_size + 1]]
+        self.page = results[:self.page_size]
+
+        has_following_position = len(results) > len(self.page)
+        following_position = (
+            self._get_position_from_instance(results[-1], self.ordering) if has_following_position else None
+        )
+        if reverse:
+            self.page.reverse()
+            self.has_next = current_position is not None or offset > 0
+            self.has_previous = has_following_position
+            self.next_position = current_position
+            self.previous_position = following_position
+        else:
+            self.has_next = has_following_position
+            self.has_previous = current_position is not None or offset > 0
+            self.next_position = following_position
+            self.previous_position = current_position
+        return self.page
+
+    def paginated_data(self, data) -> dict:
+        return {"next": self.get_next_link(), "previous": self.get_previous_link(), "results": data}
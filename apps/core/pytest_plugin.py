@@ -0,0 +1,25 @@
+"""
+Pytest plugin failing any test whose requests exceed a view's query budget.
+
+Enable it with ``pytest_plugins = ["apps.core.pytest_plugin"]`` in the root conftest.
+Mark a test with ``@pytest.mark.allow_query_budget_overrun`` to opt out.
+"""
+import pytest
+
+from apps.core import querybudget
+
+
+def pytest_configure(config):
+    config.addinivalue_line(
+        "markers", "allow_query_budget_overrun: do not fail the test when a view exceeds its query budget"
+    )
+
+
+@pytest.fixture(autouse=True)
+def query_budget_violations(request):
+    violations = []
+    querybudget.add_listener(violations.append)
+    yield violations
+    querybudget.remove_listener(violations.append)
+    if violations and request.node.get_closest_marker("allow_query_budget_overrun") is None:
+        pytest.fail("Query budget exceeded:\n" + "\n".join(f"  {v}" for v in violations), pytrace=False)
@@ -0,0 +1,175 @@
+import logging
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+from django.db import connections
+
+logger = logging.getLogger(__name__)
+
+_listeners = []
+
+# QueryStats of the request being served. A context variable rather than a wrapper on the
+# request thread's connections: under ASGI the ORM runs in sync_to_async threads, each with
+# its own connections, and the context (this variable included) is copied into them.
+_current_stats = ContextVar("query_stats", default=None)
+
+# Transaction bookkeeping depends on how deeply the request is nested in atomic blocks
+# (pytest wraps every test in one; SQLite issues BEGIN for the outermost), so it is
+# timed but not counted against budgets.
+TRANSACTION_STATEMENTS = ("BEGIN", "SAVEPOINT", "RELEASE SAVEPOINT", "ROLLBACK TO SAVEPOINT")
+
+
+class QueryStats:
+    """execute_wrapper that counts SQL statements and the time spent running them."""
+
+    __slots__ = ("count", "duration", "counting")
+
+    def __init__(self):
+        self.count = 0
+        self.duration = 0.0
+        self.counting = True
+
+    def __call__(self, execute, sql, params, many, context):
+        started = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            if self.counting and not sql.startswith(TRANSACTION_STATEMENTS):
+                self.count += 1
+            self.duration += time.perf_counter() - started
+
+
+@contextmanager
+def uncounted():
+    """Time but do not count the current request's queries inside the block (e.g. authentication)."""
+    stats = _current_stats.get()
+    if stats is None:
+        yield
+        return
+    counting, stats.counting = stats.counting, False
+    try:
+        yield
+    finally:
+        stats.counting = counting
+
+
+def count_queries(execute, sql, params, many, context):
+    """execute_wrapper installed on every connection; reports into the current request's QueryStats."""
+    stats = _current_stats.get()
+    if stats is None:
+        return execute(sql, params, many, context)
+    return stats(execute, sql, params, many, context)
+
+
+def install_query_counter(sender=None, connection=None, **kwargs) -> None:
+    """connection_created receiver; also safe to call for already open connections (see install_write_tracker)."""
+    if count_queries not in connection.execute_wrappers:
+        connection.execute_wrappers.insert(0, count_queries)
+
+
+def install_on_open_connections() -> None:
+    for conn in connections.all(initialized_only=True):
+        install_query_counter(connection=conn)
+
+
+class BudgetViolation:
+    __slots__ = ("view", "method", "path", "count", "budget")
+
+    def __init__(self, view, method, path, count, budget):
+        self.view = view
+        self.method = method
+        self.path = path
+        self.count = count
+        self.budget = budget
+
+    def __str__(self):
+        return f"{self.view} ({self.method} {self.path}) ran {self.count} queries, budget is {self.budget}"
+
+
+def query_budget(max_queries: int):
+    """Declare the maximum number of SQL queries a view function or viewset action may run."""
+    def decorator(func):
+        func.query_budget = max_queries
+        return func
+    return decorator
+
+
+def add_listener(callback) -> None:
+    _listeners.append(callback)
+
+
+def remove_listener(callback) -> None:
+    _listeners.remove(callback)
+
+
+def resolve_budget(request) -> tuple:
+    """
+    Return (view name, budget) for the resolved view. Lookup order: QUERY_BUDGETS
+    setting, the view class' ``query_budgets`` mapping, then a @query_budget handler.
+    """
+    match = getattr(request, "resolver_match", None)
+    if match is None:
+        return None, None
+    func = match.func
+    cls = getattr(func, "cls", None) or getattr(func, "view_class", None)
+    if cls is None:
+        name = f"{func.__module__}.{func.__name__}"
+        return name, settings.QUERY_BUDGETS.get(name, getattr(func, "query_budget", None))
+    method = request.method.lower()
+    handler = (getattr(func, "actions", None) or {}).get(method, method)
+    name = f"{cls.__module__}.{cls.__name__}.{handler}"
+    budget = settings.QUERY_BUDGETS.get(name)
+    if budget is None:
+        budget = getattr(cls, "query_budgets", {}).get(handler)
+    if budget is None:
+        budget = getattr(getattr(cls, handler, None), "query_budget", None)
+    return name, budget
+
+
+class QueryBudgetMiddleware:
+    """Record query count and DB time per request and report views that exceed their budget."""
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.async_mode = iscoroutinefunction(get_response)
+        if self.async_mode:
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if self.async_mode:
+            return self.__acall__(request)
+        stats = QueryStats()
+        token = _current_stats.set(stats)
+        try:
+            response = self.get_response(request)
+        finally:
+            _current_stats.reset(token)
+        return self._finish(request, response, stats)
+
+    async def __acall__(self, request):
+        stats = QueryStats()
+        token = _current_stats.set(stats)
+        try:
+            response = await self.get_response(request)
+        finally:
+            _current_stats.reset(token)
+        return self._finish(request, response, stats)
+
+    def _finish(self, request, response, stats):
+        request.query_stats = stats
+        if settings.QUERY_BUDGET_HEADERS:
+            response["X-Query-Count"] = str(stats.count)
+            response["X-DB-Time-ms"] = f"{stats.duration * 1000:.2f}"
+        view, budget = resolve_budget(request)
+        if budget is not None and stats.count > budget:
+            violation = BudgetViolation(view, request.method, request.path, stats.count, budget)
+            logger.warning("Query budget exceeded: %s", violation)
+            for callback in list(_listeners):
+                callback(violation)
+        return response
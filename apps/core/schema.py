@@ -0,0 +1,163 @@
+"""
+The OpenAPI document, built once at deploy time instead of on every request.
+
+``manage.py build_schema`` writes openapi-<VERSION>.yaml and .json, each with a
+gzip copy, to SCHEMA_DIR (VERSION from SPECTACULAR_SETTINGS). /api/schema/ serves
+the file for the negotiated format with a content-hash ETag, gzipped when the client
+accepts it. Only with DEBUG does a missing file fall back to generating the document.
+"""
+import gzip
+import hashlib
+import logging
+import os
+
+from django.conf import settings
+from django.http import Http404, HttpResponse, HttpResponseNotModified, JsonResponse
+from django.utils.cache import patch_vary_headers
+from django.views.decorators.http import require_safe
+
+from .http_cache import etag_matches
+
+logger = logging.getLogger(__name__)
+
+# Same media types and order as drf_spectacular's SpectacularAPIView: YAML unless JSON is asked for.
+MEDIA_TYPES = {
+    "application/vnd.oai.openapi": "yaml",
+    "application/yaml": "yaml",
+    "application/vnd.oai.openapi+json": "json",
+    "application/json": "json",
+}
+FORMATS = ("yaml", "json")
+
+
+class Artifact:
+    """One rendering of the schema with its gzip copy and their ETags."""
+
+    __slots__ = ("body", "gzipped", "etag", "gzip_etag")
+
+    def __init__(self, body: bytes, gzipped: bytes | None = None):
+        if gzipped is None or gzip.decompress(gzipped) != body:
+            gzipped = gzip.compress(body, compresslevel=9, mtime=0)
+        digest = hashlib.sha256(body).hexdigest()[:32]
+        self.body = body
+        self.gzipped = gzipped
+        self.etag = f'"{digest}"'
+        self.gzip_etag = f'"{digest}-gzip"'
+
+
+_loaded = {}  # path -> (mtime_ns, Artifact)
+
+
+def accepts_gzip(header: str) -> bool:
+    """Whether an Accept-Encoding header allows gzip: listed, or covered by ``*``, with q > 0."""
+    qualities = {}
+    for item in header.split(","):
+        coding, *params = (part.strip() for part in item.split(";"))
+        quality = 1.0
+        for param in params:
+            name, _, value = param.partition("=")
+            if name.strip().lower() == "q":
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        if coding:
+            qualities[coding.lower()] = quality
+    return qualities.get("gzip", qualities.get("x-gzip", qualities.get("*", 0.0))) > 0
+
+
+def artifact_path(fmt: str, directory=None) -> str:
+    version = settings.SPECTACULAR_SETTINGS.get("VERSION") or "0"
+    return os.path.join(directory or settings.SCHEMA_DIR, f"openapi-{version}.{fmt}")
+
+
+def generate_schema() -> dict:
+    from drf_spectacular.settings import spectacular_settings
+
+    from . import schema_extensions  # noqa: F401
+
+    generator = spectacular_settings.DEFAULT_GENERATOR_CLASS(urlconf=spectacular_settings.SERVE_URLCONF)
+    return generator.get_schema(request=None, public=spectacular_settings.SERVE_PUBLIC)
+
+
+def render(schema: dict, fmt: str) -> bytes:
+    from drf_spectacular.renderers import OpenApiJsonRenderer, OpenApiYamlRenderer
+
+    renderer = OpenApiJsonRenderer() if fmt == "json" else OpenApiYamlRenderer()
+    return renderer.render(schema, renderer_context={})
+
+
+def _write(path: str, data: bytes) -> None:
+    tmp = f"{path}.tmp"
+    with open(tmp, "wb") as fh:
+        fh.write(data)
+    os.replace(tmp, path)
+
+
+def build(directory=None) -> list:
+    """Generate the schema and write every format with its gzip copy; returns the paths written."""
+    directory = directory or settings.SCHEMA_DIR
+    os.makedirs(directory, exist_ok=True)
+    schema = generate_schema()
+    paths = []
+    for fmt in FORMATS:
+        path = artifact_path(fmt, directory)
+        body = render(schema, fmt)
+        _write(f"{path}.gz", gzip.compress(body, compresslevel=9, mtime=0))
+        _write(path, body)
+        paths += [path, f"{path}.gz"]
+    return paths
+
+
+def load_artifact(fmt: str) -> Artifact | None:
+    """The built artifact for ``fmt``, read once per file version; None when it was not built."""
+    path = artifact_path(fmt)
+    try:
+        mtime = os.stat(path).st_mtime_ns
+    except FileNotFoundError:
+        return None
+    loaded = _loaded.get(path)
+    if loaded is None or loaded[0] != mtime:
+        with open(path, "rb") as fh:
+            body = fh.read()
+        try:
+            with open(f"{path}.gz", "rb") as fh:
+                gzipped = fh.read()
+        except FileNotFoundError:
+            gzipped = None
+        loaded = _loaded[path] = (mtime, Artifact(body, gzipped))
+    return loaded[1]
+
+
+@require_safe
+def schema_view(request):
+    fmt = request.GET.get("format")
+    candidates = [media_type for media_type, f in MEDIA_TYPES.items() if fmt in (None, f)]
+    if not candidates:
+        raise Http404(f"Unknown schema format {fmt!r}.")
+    media_type = request.get_preferred_type(candidates) or (candidates[0] if fmt else None)
+    if media_type is None:
+        return JsonResponse({"detail": "Accept application/vnd.oai.openapi or application/json."}, status=406)
+    fmt = MEDIA_TYPES[media_type]
+
+    artifact = load_artifact(fmt)
+    if artifact is None:
+        if not settings.DEBUG:
+            logger.error("OpenAPI schema %s is missing; run manage.py build_schema", artifact_path(fmt))
+            return JsonResponse({"detail": "Schema is not available."}, status=503)
+        artifact = Artifact(render(generate_schema(), fmt))
+
+    gzipped = accepts_gzip(request.headers.get("Accept-Encoding", ""))
+    etag = artifact.gzip_etag if gzipped else artifact.etag
+    if etag_matches(request, artifact.etag) or etag_matches(request, artifact.gzip_etag):
+        response = HttpResponseNotModified()
+    else:
+        response = HttpResponse(artifact.gzipped if gzipped else artifact.body, content_type=media_type)
+        if gzipped:
+            response["Content-Encoding"] = "gzip"
+        title = settings.SPECTACULAR_SETTINGS.get("TITLE") or "schema"
+        response["Content-Disposition"] = f'inline; filename="{title}.{fmt}"'
+    response["ETag"] = etag
+    response["Cache-Control"] = "no-cache"
+    patch_vary_headers(response, ("Accept", "Accept-Encoding"))
+    return response
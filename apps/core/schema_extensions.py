@@ -0,0 +1,11 @@
+"""drf_spectacular security schemes for apps.core.authentication (imported before generating the schema)."""
+from drf_spectacular.authentication import SessionScheme
+from drf_spectacular.contrib.rest_framework_simplejwt import SimpleJWTScheme
+
+
+class UncountedJWTScheme(SimpleJWTScheme):
+    target_class = "apps.core.authentication.UncountedJWTAuthentication"
+
+
+class UncountedSessionScheme(SessionScheme):
+    target_class = "apps.core.authentication.UncountedSessionAuthentication"
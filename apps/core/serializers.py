@@ -1,6 +1,8 @@
+from django.conf import settings
 from django.db import transaction
 from rest_framework import serializers
 from .models import Cat, Mission, Target
+from .targets import add_target, complete_target
 
 
 
@@ -41,26 +43,13 @@ class TargetSerializer(serializers.ModelSerializer):
 
 
 class TargetCreateSerializer(serializers.ModelSerializer):
-    """Create a new target inside a mission."""
+    """Create a new target inside a mission; limit and uniqueness are checked on insert."""
     class Meta:
         model = Target
         fields = ["name", "country", "notes"]
 
-    def validate(self, attrs):
-        mission: Mission = self.context["mission"]
-        if Target.objects.filter(mission=mission, name=attrs["name"]).exists():
-            raise serializers.ValidationError(
-                {"name": "Target name must be unique within this mission."}
-            )
-        if mission.targets.count() >= 3:
-            raise serializers.ValidationError(
-                {"detail": "You can assign up to 3 targets per mission."}
-            )
-        return attrs
-
     def create(self, validated_data):
-        mission: Mission = self.context["mission"]
-        return Target.objects.create(mission=mission, **validated_data)
+        return add_target(self.context["mission_id"], **validated_data)
 
 
 class TargetUpdateSerializer(serializers.ModelSerializer):
@@ -85,6 +74,11 @@ class TargetUpdateSerializer(serializers.ModelSerializer):
             )
         return attrs
 
+    def update(self, instance, validated_data):
+        if validated_data.get("is_complete") and not instance.is_complete:
+            complete_target(instance)
+        return super().update(instance, validated_data)
+
 
 class MissionTargetInlineSerializer(serializers.ModelSerializer):
     """Inline target representation used inside Mission serializer."""
@@ -103,10 +97,13 @@ class MissionSerializer(serializers.ModelSerializer):
             "id",
             "assigned_cat",
             "is_complete",
+            "target_count",
+            "completed_target_count",
             "targets",
             "created_at",
             "updated_at",
         ]
+        read_only_fields = ["target_count", "completed_target_count"]
 
 
 class MissionCreateTargetItemSerializer(serializers.ModelSerializer):
@@ -143,7 +140,55 @@ class MissionCreateSerializer(serializers.ModelSerializer):
     @transaction.atomic
     def create(self, validated_data):
         targets_data = validated_data.pop("targets", [])
-        mission = Mission.objects.create(**validated_data)
+        mission = Mission.objects.create(target_count=len(targets_data), **validated_data)
         Target.objects.bulk_create([Target(mission=mission, **t) for t in targets_data])
         mission.refresh_from_db()
         return mission
+
+
+class BulkItemsField(serializers.ListField):
+    """
+    A non-empty list of at most BULK_MAX_ITEMS items, documented as ``child``. Items
+    are left to the bulk helpers, which validate them one by one and report each
+    failure instead of rejecting the whole batch.
+    """
+
+    def __init__(self, **kwargs):
+        kwargs.setdefault("allow_empty", False)
+        super().__init__(**kwargs)
+
+    def to_internal_value(self, data):
+        if not isinstance(data, list):
+            self.fail("not_a_list", input_type=type(data).__name__)
+        if not data and not self.allow_empty:
+            self.fail("empty")
+        if len(data) > settings.BULK_MAX_ITEMS:
+            self.fail("max_length", max_length=settings.BULK_MAX_ITEMS)
+        return data
+
+
+class MissionBulkCreateSerializer(serializers.Serializer):
+    """Request body of the bulk mission endpoint; every item is validated on its own."""
+    missions = BulkItemsField(child=MissionCreateSerializer())
+
+
+class CatBulkImportSerializer(serializers.Serializer):
+    """Request body of the bulk cat import endpoint; rows are validated one by one."""
+    cats = BulkItemsField(child=CatCreateSerializer())
+
+
+class AssignmentPairSerializer(serializers.Serializer):
+    mission = serializers.IntegerField()
+    cat = serializers.IntegerField()
+
+
+class BulkAssignSerializer(serializers.Serializer):
+    """Either explicit (mission, cat) pairs or auto=true to match idle cats to unassigned missions."""
+    pairs = BulkItemsField(child=AssignmentPairSerializer(), required=False)
+    auto = serializers.BooleanField(required=False, default=False)
+    limit = serializers.IntegerField(required=False, min_value=1)
+
+    def validate(self, attrs):
+        if not attrs["auto"] and not attrs.get("pairs"):
+            raise serializers.ValidationError("Provide a non-empty 'pairs' list or 'auto': true.")
+        return attrs
@@ -1,23 +1,314 @@
-import requests
+import json
+import logging
+import os
+import threading
+import time
+import uuid
+
 from django.core.cache import cache
 from django.conf import settings
 
+from . import metrics
+
+logger = logging.getLogger(__name__)
+
 BREEDS_CACHE_KEY = "thecatapi_breeds_v1"
+BREEDS_VERSION_KEY = f"{BREEDS_CACHE_KEY}:version"
+BREEDS_SEQUENCE_KEY = f"{BREEDS_CACHE_KEY}:sequence"
+BREEDS_LOCK_KEY = f"{BREEDS_CACHE_KEY}:lock"
+BREEDS_URL = "https://api.thecatapi.com/v1/breeds"
+
+LOOKUP_HIT = metrics.series("breed_index_lookups_total", {"result": "hit"})
+LOOKUP_STALE = metrics.series("breed_index_lookups_total", {"result": "stale"})
+LOOKUP_MISS = metrics.series("breed_index_lookups_total", {"result": "miss"})
+
+
+class BreedsUnavailable(RuntimeError):
+    """No breed list could be obtained from TheCatAPI and none is cached."""
+
+
+class BreedIndex:
+    """Immutable lookup set of normalized breed names and ids for one published version."""
+
+    __slots__ = ("version", "keys", "fetched_at")
+
+    def __init__(self, version: int, keys: frozenset, fetched_at: float):
+        self.version = version
+        self.keys = keys
+        self.fetched_at = fetched_at
+
+    def __contains__(self, name: str) -> bool:
+        return name in self.keys
+
+    def __len__(self) -> int:
+        return len(self.keys)
+
+    def is_stale(self) -> bool:
+        return time.time() - self.fetched_at > settings.BREEDS_TTL
+
+
+class SingleFlight:
+    """Collapse concurrent calls for the same key into one execution shared by all callers."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls = {}
+
+    def in_flight(self, key: str) -> bool:
+        return key in self._calls
+
+    def do(self, key: str, fn):
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = {"done": threading.Event(), "result": None, "error": None}
+        if not leader:
+            call["done"].wait()
+        else:
+            try:
+                call["result"] = fn()
+            except Exception as exc:
+                call["error"] = exc
+            finally:
+                with self._lock:
+                    del self._calls[key]
+                call["done"].set()
+        if call["error"] is not None:
+            raise call["error"]
+        return call["result"]
+
+
+_index: BreedIndex | None = None
+_index_checked_at = 0.0
+_next_background_refresh = 0.0
+_index_lock = threading.Lock()
+_flight = SingleFlight()
+
+
+def normalize_breed(value) -> str:
+    return str(value or "").strip().lower()
+
+
+def build_breed_keys(breeds) -> frozenset:
+    keys = set()
+    for b in breeds:
+        keys.add(normalize_breed(b.get("name")))
+        keys.add(normalize_breed(b.get("id")))
+    keys.discard("")
+    return frozenset(keys)
+
+
+def _data_key(version: int) -> str:
+    return f"{BREEDS_CACHE_KEY}:{version}"
+
+
+def fetch_breeds():
+    # Outbound HTTP is only needed on a refresh, not to serve requests.
+    from .http_client import get_client
+
+    headers = {}
+    if settings.THECATAPI_API_KEY:
+        headers["x-api-key"] = settings.THECATAPI_API_KEY
+    try:
+        resp = get_client().get(BREEDS_URL, headers=headers, timeout=settings.BREEDS_FETCH_TIMEOUT)
+    except Exception as exc:
+        raise BreedsUnavailable(f"TheCatAPI request failed: {exc}") from exc
+    if resp.status_code != 200:
+        raise BreedsUnavailable(f"TheCatAPI responded with {resp.status_code}")
+    return resp.json()
+
+
+def _set_local_index(index: BreedIndex) -> BreedIndex:
+    global _index, _index_checked_at
+    with _index_lock:
+        _index = index
+        _index_checked_at = time.monotonic()
+    return index
+
+
+def publish_breed_keys(keys: frozenset, fetched_at: float | None = None) -> BreedIndex:
+    """Store a new breed set under a fresh version and make it current for every worker."""
+    fetched_at = time.time() if fetched_at is None else fetched_at
+    cache.add(BREEDS_SEQUENCE_KEY, 0, timeout=None)
+    version = cache.incr(BREEDS_SEQUENCE_KEY)
+    cache.set(_data_key(version), (keys, fetched_at), timeout=None)
+    cache.set(BREEDS_VERSION_KEY, version, timeout=None)
+    # Permanent entries are never evicted: let the superseded list expire instead of piling up.
+    cache.touch(_data_key(version - 1), settings.BREEDS_TTL)
+    return _set_local_index(BreedIndex(version, keys, fetched_at))
+
+
+def _load_shared_index() -> BreedIndex | None:
+    version = cache.get(BREEDS_VERSION_KEY)
+    if version is None:
+        return None
+    if _index is not None and _index.version == version:
+        return _index
+    entry = cache.get(_data_key(version))
+    if entry is None:
+        return None
+    keys, fetched_at = entry
+    return BreedIndex(version, keys, fetched_at)
+
+
+def _lock_timeout() -> float:
+    """How long the refresh lock is held: the worst case of the fetch, retries included, plus BREEDS_LOCK_MARGIN."""
+    from .http_client import get_client
+
+    return get_client().max_duration(settings.BREEDS_FETCH_TIMEOUT) + settings.BREEDS_LOCK_MARGIN
+
+
+def _wait_for_other_process(previous_version, timeout: float) -> BreedIndex | None:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        time.sleep(0.05)
+        index = _load_shared_index()
+        if index is not None and index.version != previous_version:
+            return index
+        if cache.get(BREEDS_LOCK_KEY) is None:
+            break
+    return None
+
+
+def _refresh() -> BreedIndex:
+    """Fetch and publish the breed list; only one process fetches at a time."""
+    current = _load_shared_index()
+    token = uuid.uuid4().hex
+    lock_timeout = _lock_timeout()
+    if not cache.add(BREEDS_LOCK_KEY, token, timeout=lock_timeout):
+        index = _wait_for_other_process(current.version if current else None, lock_timeout)
+        if index is not None:
+            return _set_local_index(index)
+        if current is not None:
+            return _set_local_index(current)
+    try:
+        index = publish_breed_keys(build_breed_keys(fetch_breeds()))
+    finally:
+        if cache.get(BREEDS_LOCK_KEY) == token:
+            cache.delete(BREEDS_LOCK_KEY)
+    return index
+
+
+def refresh_breed_index() -> BreedIndex:
+    return _flight.do(BREEDS_CACHE_KEY, _refresh)
+
+
+def _background_refresh() -> None:
+    try:
+        refresh_breed_index()
+    except BreedsUnavailable as exc:
+        logger.warning("Breed list refresh failed, serving stale data: %s", exc)
+
+
+def schedule_breed_refresh() -> bool:
+    """Start a background refresh unless one is already running or recently failed."""
+    global _next_background_refresh
+    now = time.monotonic()
+    if not settings.BREEDS_REMOTE_REFRESH:
+        return False
+    if _flight.in_flight(BREEDS_CACHE_KEY) or now < _next_background_refresh:
+        return False
+    _next_background_refresh = now + settings.BREEDS_REFRESH_RETRY_INTERVAL
+    threading.Thread(target=_background_refresh, name="breeds-refresh", daemon=True).start()
+    return True
+
+
+def get_breed_index() -> BreedIndex:
+    """
+    Return the process-local breed index.
+    The shared cache is consulted at most once per BREEDS_INDEX_CHECK_INTERVAL seconds
+    to pick up versions published by other workers. A stale index keeps being served
+    while a background refresh runs; only a cold start blocks on TheCatAPI.
+    """
+    global _index_checked_at
+    index = _index
+    now = time.monotonic()
+    if index is None or now - _index_checked_at >= settings.BREEDS_INDEX_CHECK_INTERVAL:
+        shared = _load_shared_index()
+        if shared is not None:
+            index = _set_local_index(shared)
+        elif index is not None:
+            _index_checked_at = now
+    if index is None:
+        metrics.inc_series(LOOKUP_MISS)
+        if not settings.BREEDS_REMOTE_REFRESH:
+            raise BreedsUnavailable("No breed snapshot loaded and remote refresh is disabled")
+        return refresh_breed_index()
+    if index.is_stale():
+        metrics.inc_series(LOOKUP_STALE)
+        schedule_breed_refresh()
+    else:
+        metrics.inc_series(LOOKUP_HIT)
+    return index
+
+
+def unknown_breeds(names) -> set:
+    """Normalized breeds among ``names`` that are not in the breed index, in one set operation."""
+    return {normalize_breed(n) for n in names} - get_breed_index().keys
+
+
+def write_breed_snapshot(path, breeds, fetched_at: float | None = None) -> int:
+    """Write the breed list as a compact JSON snapshot; returns the number of breeds."""
+    rows = sorted(
+        {(normalize_breed(b.get("id")), str(b.get("name") or "").strip()) for b in breeds}
+    )
+    payload = {
+        "format": 1,
+        "fetched_at": time.time() if fetched_at is None else fetched_at,
+        "breeds": [list(row) for row in rows],
+    }
+    path = os.fspath(path)
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    tmp = f"{path}.tmp"
+    with open(tmp, "w", encoding="utf-8") as fh:
+        json.dump(payload, fh, separators=(",", ":"), ensure_ascii=False)
+    os.replace(tmp, path)
+    return len(rows)
+
+
+def load_breed_snapshot(path) -> BreedIndex:
+    """
+    Install the breed list from a snapshot file.
+    A version already published in the shared cache wins over the snapshot,
+    so restarting a pod never rolls back a fresher list fetched by another worker.
+    """
+    with open(path, encoding="utf-8") as fh:
+        payload = json.load(fh)
+    shared = _load_shared_index()
+    if shared is not None:
+        return _set_local_index(shared)
+    breeds = [{"id": breed_id, "name": name} for breed_id, name in payload["breeds"]]
+    return publish_breed_keys(build_breed_keys(breeds), fetched_at=payload["fetched_at"])
+
+
+def preload_breed_snapshot() -> BreedIndex | None:
+    path = settings.BREEDS_SNAPSHOT_PATH
+    if not path or not os.path.exists(path):
+        return None
+    try:
+        return load_breed_snapshot(path)
+    except (OSError, ValueError, KeyError, TypeError) as exc:
+        logger.warning("Could not load breed snapshot %s: %s", path, exc)
+        return None
+    except Exception:
+        # Runs in every worker's AppConfig.ready(): a shared cache that is down or locked
+        # (sqlite3.OperationalError, a backend's connection error) must not stop the boot.
+        # The index is then built by the first lookup's remote refresh.
+        logger.exception("Could not publish breed snapshot %s to the shared cache", path)
+        return None
+
+
+def reset_breed_index() -> None:
+    global _index, _index_checked_at, _next_background_refresh
+    with _index_lock:
+        _index = None
+        _index_checked_at = 0.0
+        _next_background_refresh = 0.0
+
 
 def is_valid_breed(breed_name: str) -> bool:
     name = (breed_name or "").strip().lower()
     if not name:
         return False
-    breeds = cache.get(BREEDS_CACHE_KEY)
-    if breeds is None:
-        headers = {}
-        if settings.THECATAPI_API_KEY:
-            headers["x-api-key"] = settings.THECATAPI_API_KEY
-        resp = requests.get("https://api.thecatapi.com/v1/breeds", headers=headers, timeout=10)
-        if resp.status_code != 200:
-            return False
-        breeds = resp.json()
-        cache.set(BREEDS_CACHE_KEY, breeds, timeout=None)
-    names = {b.get("name", "").strip().lower() for b in breeds}
-    ids = {b.get("id", "").strip().lower() for b in breeds}
-    return name in names or name in ids
+    return name in get_breed_index().keys
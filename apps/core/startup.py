@@ -0,0 +1,100 @@
+"""
+Process start-up: warming a worker before it serves traffic, and profiling where
+the time to the first served request goes.
+
+    python -X importtime -m apps.core.startup /api/cats/
+
+loads the WSGI application, warms it and serves one GET through it, writing a
+``phase: <name> <ms>`` line to stderr after each step; ``manage.py profile_startup``
+runs it and attributes every import to the phase that paid for it.
+"""
+import sys
+import time
+
+PHASES = ("setup", "warm_up", "first_request")
+
+
+def warm_up() -> None:
+    """
+    Import what the first request would otherwise pay for: the URLconf with every
+    view and DRF's authentication, permission, parser and renderer classes. With
+    gunicorn's preload_app this runs once in the master and workers fork with it
+    in place. Leaves no database connection open to be inherited.
+    """
+    from django.db import connections
+    from django.urls import get_resolver
+    from rest_framework.settings import api_settings
+
+    get_resolver().reverse_dict  # imports the URLconf, views and serializers
+    for name in (
+        "DEFAULT_AUTHENTICATION_CLASSES",
+        "DEFAULT_PERMISSION_CLASSES",
+        "DEFAULT_PARSER_CLASSES",
+        "DEFAULT_RENDERER_CLASSES",
+    ):
+        getattr(api_settings, name)
+    connections.close_all()
+
+
+def parse_profile(text: str) -> dict:
+    """Phases and per-module import times from the stderr of a profiled start-up."""
+    phases, modules, pending, status = {}, [], [], None
+    for line in text.splitlines():
+        if line.startswith("phase: "):
+            name, ms = line[len("phase: "):].rsplit(" ", 1)
+            phases[name] = float(ms)
+            for module in pending:
+                module["phase"] = name
+            modules.extend(pending)
+            pending = []
+        elif line.startswith("status: "):
+            status = line[len("status: "):]
+        elif line.startswith("import time:") and "[us]" not in line:
+            self_us, cumulative_us, name = line[len("import time:"):].split("|")
+            pending.append({
+                "module": name.strip(),
+                "self_ms": int(self_us) / 1000,
+                "cumulative_ms": int(cumulative_us) / 1000,
+                "phase": None,
+            })
+    return {"phases": phases, "status": status, "modules": modules + pending}
+
+
+def _profile(path: str) -> None:
+    last = time.perf_counter()
+
+    def mark(phase):
+        nonlocal last
+        now = time.perf_counter()
+        sys.stderr.write(f"phase: {phase} {(now - last) * 1000:.1f}\n")
+        last = now
+
+    from django.core.wsgi import get_wsgi_application
+
+    application = get_wsgi_application()
+    mark("setup")
+    warm_up()
+    mark("warm_up")
+    path, _, query = path.partition("?")
+    environ = {
+        "REQUEST_METHOD": "GET",
+        "PATH_INFO": path,
+        "QUERY_STRING": query,
+        "SERVER_NAME": "localhost",
+        "SERVER_PORT": "80",
+        "HTTP_HOST": "localhost",
+        "HTTP_ACCEPT": "application/json",
+        "wsgi.url_scheme": "http",
+        "wsgi.input": sys.stdin.buffer,
+        "wsgi.errors": sys.stderr,
+    }
+    statuses = []
+    response = application(environ, lambda status, headers, exc_info=None: statuses.append(status))
+    b"".join(response)
+    response.close()
+    mark("first_request")
+    sys.stderr.write(f"status: {statuses[0]}\n")
+
+
+if __name__ == "__main__":
+    _profile(sys.argv[1] if len(sys.argv) > 1 else "/api/cats/")
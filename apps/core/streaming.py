@@ -0,0 +1,68 @@
+import json
+from itertools import islice
+
+from django.conf import settings
+from django.http import StreamingHttpResponse
+from rest_framework.utils.encoders import JSONEncoder
+
+from .fast_serializers import CAT_FIELDS, MISSION_FIELDS, TARGET_FIELDS, datetime_formatter, mission_rows
+from .models import Cat, Mission, Target
+
+EXPORT_FORMATS = {
+    "json": "application/json",
+    "ndjson": "application/x-ndjson",
+}
+
+_encode = JSONEncoder(ensure_ascii=False, separators=(",", ":")).encode
+
+
+def iter_cat_rows(chunk_size: int):
+    to_str = datetime_formatter()
+    for row in Cat.objects.order_by("-id").values(*CAT_FIELDS).iterator(chunk_size=chunk_size):
+        row["created_at"] = to_str(row["created_at"])
+        row["updated_at"] = to_str(row["updated_at"])
+        yield row
+
+
+def iter_target_rows(chunk_size: int):
+    return Target.objects.order_by("-id").values(*TARGET_FIELDS).iterator(chunk_size=chunk_size)
+
+
+def iter_mission_rows(chunk_size: int):
+    """Missions with inline targets; targets are fetched once per chunk of missions."""
+    rows = Mission.objects.order_by("-id").values(*MISSION_FIELDS).iterator(chunk_size=chunk_size)
+    while chunk := list(islice(rows, chunk_size)):
+        yield from mission_rows(chunk)
+
+
+def stream_json(rows):
+    """Yield a JSON array one row at a time, rendered like the compact JSONRenderer output."""
+    yield b"["
+    first = True
+    for row in rows:
+        if first:
+            first = False
+            yield _encode(row).encode()
+        else:
+            yield b"," + _encode(row).encode()
+    yield b"]"
+
+
+def stream_ndjson(rows):
+    for row in rows:
+        yield _encode(row).encode() + b"\n"
+
+
+EXPORTERS = {
+    "cats": iter_cat_rows,
+    "missions": iter_mission_rows,
+    "targets": iter_target_rows,
+}
+
+
+def export_response(resource: str, output: str = "json") -> StreamingHttpResponse:
+    rows = EXPORTERS[resource](settings.EXPORT_CHUNK_SIZE)
+    body = stream_ndjson(rows) if output == "ndjson" else stream_json(rows)
+    response = StreamingHttpResponse(body, content_type=EXPORT_FORMATS[output])
+    response["Content-Disposition"] = f'attachment; filename="{resource}.{output}"'
+    return response
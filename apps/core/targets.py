@@ -0,0 +1,95 @@
+from django.db import IntegrityError, transaction
+from django.db.models import Case, Count, F, Q, Value, When
+from django.utils import timezone
+from rest_framework import serializers
+from rest_framework.exceptions import NotFound
+
+from .models import Mission, Target
+
+MAX_TARGETS_PER_MISSION = 3
+
+
+def _unique_name_error() -> serializers.ValidationError:
+    return serializers.ValidationError({"name": "Target name must be unique within this mission."})
+
+
+def _rollup(total_delta: int, done_delta: int) -> dict:
+    """
+    UPDATE assignments that shift a mission's target counters and complete it once
+    every remaining target is complete. All conditions read the pre-update row.
+    """
+    return {
+        "target_count": F("target_count") + total_delta,
+        "completed_target_count": F("completed_target_count") + done_delta,
+        "is_complete": Case(
+            When(
+                completed_target_count__gte=F("target_count") + total_delta - done_delta,
+                target_count__gt=-total_delta,
+                then=Value(True),
+            ),
+            default=F("is_complete"),
+        ),
+        "updated_at": timezone.now(),
+    }
+
+
+def add_target(mission_id: int, name: str, country: str, notes: str = "") -> Target:
+    """
+    Add a target in two round trips. The first is a conditional UPDATE that bumps
+    target_count only while the mission has room; it row-locks the mission, so
+    parallel adds cannot overshoot the limit. The second inserts the target; a
+    duplicate name trips uniq_target_name_in_mission and rolls both back.
+    """
+    try:
+        with transaction.atomic():
+            reserved = Mission.objects.filter(
+                pk=mission_id, target_count__lt=MAX_TARGETS_PER_MISSION
+            ).update(target_count=F("target_count") + 1, updated_at=timezone.now())
+            if reserved:
+                return Target.objects.create(mission_id=mission_id, name=name, country=country, notes=notes)
+    except IntegrityError:
+        raise _unique_name_error()
+    if not Mission.objects.filter(pk=mission_id).exists():
+        raise NotFound("No Mission matches the given query.")
+    if Target.objects.filter(mission_id=mission_id, name=name).exists():
+        raise _unique_name_error()
+    raise serializers.ValidationError(
+        {"detail": f"You can assign up to {MAX_TARGETS_PER_MISSION} targets per mission."}
+    )
+
+
+def complete_target(target: Target) -> bool:
+    """
+    Mark a target complete and roll the change up into its mission. The conditional
+    UPDATE makes only one of several concurrent completions count.
+    """
+    with transaction.atomic():
+        flipped = Target.objects.filter(pk=target.pk, is_complete=False).update(
+            is_complete=True, updated_at=timezone.now()
+        )
+        if flipped:
+            Mission.objects.filter(pk=target.mission_id).update(**_rollup(0, 1))
+    return bool(flipped)
+
+
+def delete_target(target: Target) -> None:
+    with transaction.atomic():
+        deleted, _ = Target.objects.filter(pk=target.pk).delete()
+        if deleted:
+            Mission.objects.filter(pk=target.mission_id).update(
+                **_rollup(-1, -1 if target.is_complete else 0)
+            )
+
+
+def recount_targets(mission_id: int) -> None:
+    """
+    Recompute a mission's counters from its targets, for paths that bypass the helpers
+    above, and complete it when every target is complete, as _rollup does.
+    """
+    counts = Target.objects.filter(mission=mission_id).aggregate(
+        total=Count("id"), done=Count("id", filter=Q(is_complete=True))
+    )
+    fields = {"target_count": counts["total"], "completed_target_count": counts["done"]}
+    if 0 < counts["total"] == counts["done"]:
+        fields.update(is_complete=True, updated_at=timezone.now())
+    Mission.objects.filter(pk=mission_id).update(**fields)
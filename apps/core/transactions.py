@@ -0,0 +1,46 @@
+"""
+Per-view transaction policy, used instead of ATOMIC_REQUESTS.
+
+Safe methods and actions that are a single statement, or that manage their own
+atomic block in a service (assign_cat, add_target, apply_plan, bulk imports), run
+in autocommit. Actions in ``atomic_actions`` run in one atomic block on the
+primary that is rolled back when the response is an error. Actions in
+``locking_actions`` also fetch their object with SELECT ... FOR UPDATE, so
+concurrent read-modify-write requests on the same row apply one after the other
+instead of overwriting each other.
+"""
+from django.db import DEFAULT_DB_ALIAS, transaction
+
+SAFE_METHODS = ("GET", "HEAD", "OPTIONS")
+
+
+class TransactionPolicyMixin:
+    """
+    For DRF views. Actions are viewset action names, or lowercase handler names
+    ("patch", "delete") on plain API views, as in ``query_budgets``.
+    """
+
+    atomic_actions = frozenset({"update", "partial_update", "destroy"})
+    locking_actions = frozenset({"update", "partial_update", "destroy"})
+    _locking = False
+
+    def _policy_action(self, request) -> str:
+        method = request.method.lower()
+        return (getattr(self, "action_map", None) or {}).get(method, method)
+
+    def dispatch(self, request, *args, **kwargs):
+        action = self._policy_action(request)
+        if request.method in SAFE_METHODS or action not in self.atomic_actions:
+            return super().dispatch(request, *args, **kwargs)
+        with transaction.atomic(using=DEFAULT_DB_ALIAS):
+            self._locking = action in self.locking_actions
+            response = super().dispatch(request, *args, **kwargs)
+            if response.status_code >= 400:
+                transaction.set_rollback(True, using=DEFAULT_DB_ALIAS)
+        return response
+
+    def get_queryset(self):
+        queryset = super().get_queryset()
+        if self._locking:
+            queryset = queryset.select_for_update(of=("self",))
+        return queryset
@@ -1,12 +1,36 @@
 from django.urls import path, include
 from rest_framework.routers import DefaultRouter
-from .views import CatViewSet, MissionViewSet, TargetUpdateView
+from . import async_views
+from .views import CatViewSet, MissionViewSet, MissionTargetCreateView, TargetViewSet, TargetUpdateView
 
 router = DefaultRouter()
 router.register(r"cats", CatViewSet, basename="cats")
 router.register(r"missions", MissionViewSet, basename="missions")
+router.register(r"targets", TargetViewSet, basename="targets")
+
+# Native async views for ASGI deployments; same payloads as the DRF endpoints above.
+async_urlpatterns = [
+    path("cats/", async_views.cat_list, name="async-cats-list"),
+    path("cats/<int:pk>/", async_views.cat_detail, name="async-cats-detail"),
+    path("missions/", async_views.mission_list, name="async-missions-list"),
+    path("missions/<int:pk>/", async_views.mission_detail, name="async-missions-detail"),
+    path("missions/<int:pk>/assign/", async_views.mission_assign, name="async-missions-assign"),
+    path(
+        "missions/<int:mission_id>/targets/<int:target_id>/",
+        async_views.target_patch,
+        name="async-target-update",
+    ),
+    path("targets/", async_views.target_list, name="async-targets-list"),
+    path("targets/<int:pk>/", async_views.target_detail, name="async-targets-detail"),
+]
 
 urlpatterns = [
     path("", include(router.urls)),
+    path(
+        "missions/<int:mission_id>/targets/",
+        MissionTargetCreateView.as_view({"post": "create"}),
+        name="mission-targets-create",
+    ),
     path("missions/<int:mission_id>/targets/<int:target_id>/", TargetUpdateView.as_view(), name="target-update"),
+    path("async/", include(async_urlpatterns)),
 ]
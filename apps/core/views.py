@@ -1,4 +1,4 @@
-from django.db import transaction
+from django.db import IntegrityError, transaction
 from rest_framework import viewsets, status, permissions
 from rest_framework.decorators import action
 from rest_framework.response import Response
@@ -6,21 +6,56 @@ from rest_framework.generics import get_object_or_404, UpdateAPIView
 from drf_spectacular.utils import extend_schema, extend_schema_view
 
 from .models import Cat, Mission, Target
+from .pagination import IdCursorPagination
+from .fast_serializers import CAT_FIELDS, MISSION_FIELDS, TARGET_FIELDS, cat_rows, mission_rows
+from .streaming import EXPORT_FORMATS, export_response
+from .bulk import create_missions_bulk, import_cats
+from .targets import delete_target
+from .assignment import AssignmentConflict, AssignmentError, apply_plan, assign_cat, plan_auto, plan_pairs
+from .services import BreedsUnavailable
+from .http_cache import conditional_get
+from .transactions import TransactionPolicyMixin
 from .serializers import (
     CatSerializer,
     CatCreateSerializer,
+    CatBulkImportSerializer,
     MissionSerializer,
     MissionCreateSerializer,
+    MissionBulkCreateSerializer,
+    BulkAssignSerializer,
     TargetSerializer,
     TargetCreateSerializer,
     TargetUpdateSerializer,
 )
 
 
+def bulk_status(created: int, total: int) -> int:
+    if created == total:
+        return status.HTTP_201_CREATED
+    if created:
+        return status.HTTP_207_MULTI_STATUS
+    return status.HTTP_400_BAD_REQUEST
+
+
+class ExportMixin:
+    """Adds GET <resource>/export/?output=json|ndjson streaming the whole table."""
+    export_resource = None
+
+    @action(detail=False, methods=["get"])
+    def export(self, request):
+        output = request.query_params.get("output", "json")
+        if output not in EXPORT_FORMATS:
+            return Response(
+                {"detail": f"output must be one of: {', '.join(EXPORT_FORMATS)}"},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+        return export_response(self.export_resource, output)
+
+
 @extend_schema_view(
     list=extend_schema(
         tags=["cats"],
-        description="Retrieve a list of all cats."
+        description="Retrieve cats, newest first, one cursor page at a time."
     ),
     retrieve=extend_schema(
         tags=["cats"],
@@ -38,10 +73,19 @@ from .serializers import (
         tags=["cats"],
         description="Delete a cat by ID."
     ),
+    export=extend_schema(
+        tags=["cats"],
+        description="Stream every cat as a JSON array or NDJSON (?output=ndjson)."
+    ),
 )
-class CatViewSet(viewsets.ModelViewSet):
+class CatViewSet(TransactionPolicyMixin, ExportMixin, viewsets.ModelViewSet):
     queryset = Cat.objects.all().order_by("-id")
+    pagination_class = IdCursorPagination
     http_method_names = ["get", "post", "patch", "delete", "head", "options"]
+    export_resource = "cats"
+    query_budgets = {
+        "list": 1, "retrieve": 1, "create": 1, "partial_update": 2, "destroy": 3, "bulk": 5,
+    }
 
     def get_serializer_class(self):
         if self.action == "create":
@@ -50,11 +94,39 @@ class CatViewSet(viewsets.ModelViewSet):
             return CatSerializer
         return CatSerializer
 
+    @conditional_get(Cat)
+    def list(self, request, *args, **kwargs):
+        page = self.paginate_queryset(Cat.objects.values(*CAT_FIELDS))
+        return self.get_paginated_response(cat_rows(page))
+
+    @conditional_get(Cat)
+    def retrieve(self, request, *args, **kwargs):
+        return super().retrieve(request, *args, **kwargs)
+
+    @extend_schema(
+        tags=["cats"],
+        request=CatBulkImportSerializer,
+        description="Import many cats at once; breeds are checked against the breed index and rejects are reported per row."
+    )
+    @action(detail=False, methods=["post"], url_path="bulk")
+    def bulk(self, request):
+        serializer = CatBulkImportSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        items = serializer.validated_data["cats"]
+        try:
+            created, rejects = import_cats(items)
+        except BreedsUnavailable:
+            return Response(
+                {"detail": "Breed list is unavailable, try again later."},
+                status=status.HTTP_503_SERVICE_UNAVAILABLE,
+            )
+        return Response({"created": created, "rejected": rejects}, status=bulk_status(created, len(items)))
+
 
 @extend_schema_view(
     list=extend_schema(
         tags=["missions"],
-        description="Retrieve all missions with related targets."
+        description="Retrieve missions with related targets, newest first, one cursor page at a time."
     ),
     retrieve=extend_schema(
         tags=["missions"],
@@ -72,16 +144,35 @@ class CatViewSet(viewsets.ModelViewSet):
         tags=["missions"],
         description="Delete a mission unless it has an assigned cat."
     ),
+    export=extend_schema(
+        tags=["missions"],
+        description="Stream every mission with its targets as a JSON array or NDJSON (?output=ndjson)."
+    ),
 )
-class MissionViewSet(viewsets.ModelViewSet):
+class MissionViewSet(TransactionPolicyMixin, ExportMixin, viewsets.ModelViewSet):
     queryset = Mission.objects.all().prefetch_related("targets").order_by("-id")
+    pagination_class = IdCursorPagination
     http_method_names = ["get", "post", "patch", "delete", "head", "options"]
+    export_resource = "missions"
+    query_budgets = {
+        "list": 2, "retrieve": 2, "create": 4, "partial_update": 5, "destroy": 6,
+        "assign": 3, "assign_bulk": 12, "bulk": 6,
+    }
 
     def get_serializer_class(self):
         if self.action == "create":
             return MissionCreateSerializer
         return MissionSerializer
 
+    @conditional_get(Mission, Target)
+    def list(self, request, *args, **kwargs):
+        page = self.paginate_queryset(Mission.objects.values(*MISSION_FIELDS))
+        return self.get_paginated_response(mission_rows(page))
+
+    @conditional_get(Mission, Target)
+    def retrieve(self, request, *args, **kwargs):
+        return super().retrieve(request, *args, **kwargs)
+
     def destroy(self, request, *args, **kwargs):
         instance = self.get_object()
         if instance.assigned_cat_id is not None:
@@ -91,48 +182,83 @@ class MissionViewSet(viewsets.ModelViewSet):
             )
         return super().destroy(request, *args, **kwargs)
 
-    @transaction.atomic
     def partial_update(self, request, *args, **kwargs):
         mission = self.get_object()
         serializer = self.get_serializer(mission, data=request.data, partial=True)
         serializer.is_valid(raise_exception=True)
-        serializer.save()
+        try:
+            with transaction.atomic():
+                serializer.save()
+        except IntegrityError:
+            return Response(
+                {"detail": "Cat already has an active mission"},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
         return Response(serializer.data, status=status.HTTP_200_OK)
 
+    @extend_schema(
+        tags=["missions"],
+        request=MissionBulkCreateSerializer,
+        description="Create many missions with their 1–3 targets at once; returns a result or errors per item."
+    )
+    @action(detail=False, methods=["post"], url_path="bulk")
+    def bulk(self, request):
+        serializer = MissionBulkCreateSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        items = serializer.validated_data["missions"]
+        results = create_missions_bulk(items)
+        created = sum(1 for r in results if r["status"] == 201)
+        return Response({"created": created, "results": results}, status=bulk_status(created, len(results)))
+
     @extend_schema(
         tags=["missions"],
         description="Assign a cat to a mission if the cat has no other active mission."
     )
     @action(detail=True, methods=["post"])
-    @transaction.atomic
     def assign(self, request, pk=None):
-        mission = self.get_object()
-        if mission.is_complete:
-            return Response(
-                {"detail": "Cannot assign cat to completed mission"},
-                status=status.HTTP_400_BAD_REQUEST,
-            )
         cat_id = request.data.get("cat_id")
         if not cat_id:
             return Response(
                 {"detail": "cat_id is required"},
                 status=status.HTTP_400_BAD_REQUEST,
             )
-        cat = get_object_or_404(Cat, pk=cat_id)
-        if Mission.objects.filter(assigned_cat=cat, is_complete=False).exclude(pk=mission.pk).exists():
-            return Response(
-                {"detail": "Cat already has an active mission"},
-                status=status.HTTP_400_BAD_REQUEST,
-            )
-        mission.assigned_cat = cat
-        mission.save(update_fields=["assigned_cat", "updated_at"])
-        return Response(MissionSerializer(mission).data, status=status.HTTP_200_OK)
+        try:
+            assign_cat(pk, cat_id)
+        except AssignmentError as exc:
+            return Response({"detail": exc.detail}, status=exc.status_code)
+        return Response(MissionSerializer(self.get_object()).data, status=status.HTTP_200_OK)
+
+    @extend_schema(
+        tags=["missions"],
+        request=BulkAssignSerializer,
+        description="Assign many cats at once from explicit pairs or by auto-matching idle cats to unassigned missions."
+    )
+    @action(detail=False, methods=["post"], url_path="assign-bulk")
+    def assign_bulk(self, request):
+        serializer = BulkAssignSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        data = serializer.validated_data
+        if data["auto"]:
+            plan, rejects = plan_auto(data.get("limit")), []
+        else:
+            plan, rejects = plan_pairs(data["pairs"])
+        try:
+            apply_plan(plan)
+        except AssignmentConflict as exc:
+            return Response({"detail": str(exc)}, status=status.HTTP_409_CONFLICT)
+        return Response(
+            {
+                "assigned": [{"mission": m, "cat": c} for m, c in plan.items()],
+                "rejected": rejects,
+            },
+            status=status.HTTP_200_OK,
+        )
 
 
 @extend_schema_view(
     list=extend_schema(
         tags=["targets"],
-        description="List all targets."
+        description="List targets, newest first, one cursor page at a time."
     ),
     retrieve=extend_schema(
         tags=["targets"],
@@ -150,23 +276,42 @@ class MissionViewSet(viewsets.ModelViewSet):
         tags=["targets"],
         description="Delete a target."
     ),
+    export=extend_schema(
+        tags=["targets"],
+        description="Stream every target as a JSON array or NDJSON (?output=ndjson)."
+    ),
 )
-class TargetViewSet(viewsets.ModelViewSet):
+class TargetViewSet(TransactionPolicyMixin, ExportMixin, viewsets.ModelViewSet):
     queryset = Target.objects.select_related("mission").all().order_by("-id")
+    pagination_class = IdCursorPagination
     http_method_names = ["get", "patch", "delete", "head", "options"]
+    export_resource = "targets"
+    query_budgets = {"list": 1, "retrieve": 1, "partial_update": 4, "destroy": 3}
 
     def get_serializer_class(self):
         if self.action in {"partial_update"}:
             return TargetUpdateSerializer
         return TargetSerializer
 
+    @conditional_get(Target)
+    def list(self, request, *args, **kwargs):
+        page = self.paginate_queryset(Target.objects.values(*TARGET_FIELDS))
+        return self.get_paginated_response(page)
+
+    @conditional_get(Target)
+    def retrieve(self, request, *args, **kwargs):
+        return super().retrieve(request, *args, **kwargs)
 
-class TargetUpdateView(UpdateAPIView):
+    def perform_destroy(self, instance):
+        delete_target(instance)
+
+
+class TargetUpdateView(TransactionPolicyMixin, UpdateAPIView):
+    queryset = Target.objects.select_related("mission")
     serializer_class = TargetUpdateSerializer
     http_method_names = ["patch", "delete", "head", "options"]
-
-    def get_queryset(self):
-        return Target.objects.select_related("mission").all()
+    query_budgets = {"patch": 4, "delete": 3}
+    atomic_actions = locking_actions = frozenset({"patch", "delete"})
 
     def get_object(self):
         return get_object_or_404(
@@ -193,7 +338,7 @@ class TargetUpdateView(UpdateAPIView):
                 {"detail": "Cannot delete target from completed mission"},
                 status=status.HTTP_400_BAD_REQUEST,
             )
-        target.delete()
+        delete_target(target)
         return Response(status=status.HTTP_204_NO_CONTENT)
 
 
@@ -203,12 +348,12 @@ class TargetUpdateView(UpdateAPIView):
 )
 class MissionTargetCreateView(viewsets.ViewSet):
     http_method_names = ["post", "head", "options"]
+    query_budgets = {"create": 3}
 
     def create(self, request, mission_id=None):
-        mission = get_object_or_404(Mission, pk=mission_id)
         serializer = TargetCreateSerializer(
             data=request.data,
-            context={"mission": mission}
+            context={"mission_id": mission_id}
         )
         serializer.is_valid(raise_exception=True)
         target = serializer.save()
@@ -5,6 +5,8 @@ from rest_framework.decorators import action
 from drf_spectacular.utils import extend_schema, extend_schema_view
 from django.shortcuts import get_object_or_404
 
+from apps.core.transactions import TransactionPolicyMixin
+
 from .serializers import (
     UserPublicSerializer,
     UserCreateSerializer,
@@ -47,13 +49,18 @@ class IsSelfOrAdmin(permissions.BasePermission):
         description="Deactivate a user (soft delete)."
     ),
 )
-class UserViewSet(viewsets.ModelViewSet):
+class UserViewSet(TransactionPolicyMixin, viewsets.ModelViewSet):
     queryset = User.objects.all().order_by("-date_joined")
     http_method_names = ["get", "post", "patch", "delete", "head", "options"]  
     filter_backends = [filters.SearchFilter, filters.OrderingFilter]
     search_fields = ["username", "email", "first_name", "last_name"]
     ordering_fields = ["date_joined", "username", "email", "id"]
     ordering = ["-date_joined"]
+    query_budgets = {
+        "list": 2, "retrieve": 1, "create": 3, "partial_update": 3, "destroy": 5,
+        "me": 0, "change_password": 2, "restore": 2,
+    }
+    atomic_actions = locking_actions = frozenset({"partial_update", "destroy", "change_password"})
 
     def get_permissions(self):
         if self.action == "create":
@@ -74,7 +81,7 @@ class UserViewSet(viewsets.ModelViewSet):
         return UserPublicSerializer
 
     def get_queryset(self):
-        queryset = self.queryset
+        queryset = super().get_queryset()
         is_active = self.request.query_params.get("is_active")
         if is_active is not None:
             queryset = queryset.filter(is_active=is_active.lower() in ["true", "1"])
@@ -0,0 +1,13 @@
+import os
+
+import django
+
+
+def setup(settings_module: str = "config.settings.test"):
+    """Configure Django and create a throwaway test database for a benchmark run."""
+    os.environ.setdefault("DJANGO_SETTINGS_MODULE", settings_module)
+    django.setup()
+    from django.db import connection
+
+    connection.creation.create_test_db(verbosity=0, autoclobber=True)
+    return connection
@@ -0,0 +1,79 @@
+"""
+Compare the sync DRF endpoints under gunicorn (WSGI) with the native async
+endpoints under uvicorn (ASGI) at high concurrency.
+
+Spawn both servers on a throwaway SQLite database seeded here:
+
+    python -m benchmarks.bench_asgi --concurrency 200 --duration 15
+
+or point it at servers that are already running (e.g. docker compose --profile asgi up):
+
+    python -m benchmarks.bench_asgi --wsgi-url http://127.0.0.1:8000 --asgi-url http://127.0.0.1:8001
+"""
+import argparse
+
+from benchmarks import server
+from benchmarks.loadgen import load
+from benchmarks.results import emit
+
+ENDPOINTS = {
+    "cats": ("/api/cats/", "/api/async/cats/"),
+    "missions": ("/api/missions/", "/api/async/missions/"),
+    "mission": ("/api/missions/{mission}/", "/api/async/missions/{mission}/"),
+    "targets": ("/api/targets/", "/api/async/targets/"),
+}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--wsgi-url")
+    parser.add_argument("--asgi-url")
+    parser.add_argument("--mission-id", type=int, default=1)
+    parser.add_argument("--concurrency", type=int, default=200)
+    parser.add_argument("--duration", type=float, default=10)
+    parser.add_argument("--warmup", type=float, default=2)
+    parser.add_argument("--endpoints", default=",".join(ENDPOINTS))
+    parser.add_argument("--cats", type=int, default=1000, help="rows to seed when spawning servers")
+    parser.add_argument("--missions", type=int, default=2000, help="rows to seed when spawning servers")
+    parser.add_argument("--workers", type=int, default=2)
+    parser.add_argument("--threads", type=int, default=4, help="gunicorn threads per worker")
+    parser.add_argument("--wsgi-port", type=int, default=8100)
+    parser.add_argument("--asgi-port", type=int, default=8101)
+    parser.add_argument("--response-cache", action="store_true", help="keep ETag/response caching on")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--output")
+    args = parser.parse_args(argv)
+
+    procs = []
+    mission_id = args.mission_id
+    try:
+        if not (args.wsgi_url and args.asgi_url):
+            env = server.bench_env(args.response_cache)
+            mission_id = server.prepare_database(env, args.cats, args.missions, args.seed)["mission_id"]
+            procs = [
+                server.gunicorn(env, args.wsgi_port, args.workers, args.threads),
+                server.uvicorn(env, args.asgi_port, args.workers),
+            ]
+            args.wsgi_url = f"http://127.0.0.1:{args.wsgi_port}"
+            args.asgi_url = f"http://127.0.0.1:{args.asgi_port}"
+        server.wait_until_up(args.wsgi_url + "/api/cats/")
+        server.wait_until_up(args.asgi_url + "/api/async/cats/")
+
+        results = {}
+        for name in args.endpoints.split(","):
+            sync_path, async_path = (p.format(mission=mission_id) for p in ENDPOINTS[name])
+            results[name] = {}
+            for kind, url, path in (("wsgi", args.wsgi_url, sync_path), ("asgi", args.asgi_url, async_path)):
+                if args.warmup:
+                    load(url, [path], args.concurrency, args.warmup)
+                results[name][kind] = load(url, [path], args.concurrency, args.duration)
+    finally:
+        server.stop(procs)
+
+    params = {k: v for k, v in vars(args).items() if k not in ("output", "wsgi_url", "asgi_url")}
+    emit("asgi", params, results, args.output)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
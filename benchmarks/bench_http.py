@@ -0,0 +1,152 @@
+"""
+HTTP load driver for the main API flows, run closed-loop against a real server.
+
+Flows:
+  list            GET the mission, cat and target list endpoints
+  create_mission  POST a mission with 1..3 targets
+  assign          assign an idle cat to an unassigned mission, then unassign it
+  patch_target    PATCH the notes of an open target
+  mixed           one of each of the above per iteration
+
+Create responses carry no ids, so before the run the driver walks the list
+endpoints and hands every worker its own idle cat, unassigned mission and open
+target; the flows leave them as they found them, so long runs never run dry.
+
+Spawn gunicorn on a throwaway SQLite database seeded with benchmarks.dataset:
+
+    python -m benchmarks.bench_http --concurrency 50 --duration 10 --output before.json
+
+or drive a server that is already running (seed it with python -m benchmarks.dataset):
+
+    python -m benchmarks.bench_http --url http://127.0.0.1:8000 --flows list,assign
+"""
+import argparse
+import asyncio
+from urllib.parse import urlsplit
+
+from benchmarks import server
+from benchmarks.loadgen import Session, flows
+from benchmarks.results import emit
+
+# Per-worker (cat id, mission id, (mission id, target id)) filled in by ``scan``.
+_resources = []
+
+
+async def _walk(session, path: str) -> list:
+    rows = []
+    while path:
+        page = await session.request("scan", "GET", path)
+        rows.extend(page["results"])
+        path = None
+        if page.get("next"):
+            parts = urlsplit(page["next"])
+            path = f"{parts.path}?{parts.query}"
+    return rows
+
+
+async def scan(base_url: str, workers: int) -> dict:
+    parts = urlsplit(base_url)
+    session = Session(parts.hostname, parts.port or 80, {})
+    try:
+        missions = await _walk(session, "/api/missions/?page_size=500")
+        cats = await _walk(session, "/api/cats/?page_size=500")
+    finally:
+        session.close()
+    active = [m for m in missions if not m["is_complete"]]
+    busy = {m["assigned_cat"] for m in active}
+    idle_cats = [c["id"] for c in cats if c["id"] not in busy]
+    free_missions = [m["id"] for m in active if m["assigned_cat"] is None]
+    open_targets = [(m["id"], t["id"]) for m in active for t in m["targets"] if not t["is_complete"]]
+    if min(len(idle_cats), len(free_missions), len(open_targets)) < workers:
+        raise SystemExit(f"dataset too small for {workers} workers; seed more cats and missions")
+    _resources[:] = list(zip(idle_cats, free_missions, open_targets))[:workers]
+    return {"missions": len(missions), "cats": len(cats), "idle_cats": len(idle_cats)}
+
+
+async def list_flow(session, worker, iteration):
+    await session.request("list_missions", "GET", "/api/missions/")
+    await session.request("list_cats", "GET", "/api/cats/")
+    await session.request("list_targets", "GET", "/api/targets/")
+
+
+async def create_mission_flow(session, worker, iteration):
+    targets = [{"name": f"w{worker}-{iteration}-{n}", "country": "DE"} for n in range(1 + iteration % 3)]
+    await session.request("create_mission", "POST", "/api/missions/", {"targets": targets}, expect=(201,))
+
+
+async def assign_flow(session, worker, iteration):
+    cat_id, mission_id, _ = _resources[worker]
+    await session.request("assign", "POST", f"/api/missions/{mission_id}/assign/", {"cat_id": cat_id})
+    await session.request("unassign", "PATCH", f"/api/missions/{mission_id}/", {"assigned_cat": None})
+
+
+async def patch_target_flow(session, worker, iteration):
+    mission_id, target_id = _resources[worker][2]
+    path = f"/api/missions/{mission_id}/targets/{target_id}/"
+    await session.request("patch_target", "PATCH", path, {"notes": f"iteration {iteration}"})
+
+
+async def mixed_flow(session, worker, iteration):
+    await session.request("list_missions", "GET", "/api/missions/")
+    await create_mission_flow(session, worker, iteration)
+    await assign_flow(session, worker, iteration)
+    await patch_target_flow(session, worker, iteration)
+
+
+FLOWS = {
+    "list": list_flow,
+    "create_mission": create_mission_flow,
+    "assign": assign_flow,
+    "patch_target": patch_target_flow,
+    "mixed": mixed_flow,
+}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--url", help="drive this server instead of spawning one")
+    parser.add_argument("--flows", default=",".join(FLOWS))
+    parser.add_argument("--concurrency", type=int, default=50)
+    parser.add_argument("--duration", type=float, default=10)
+    parser.add_argument("--warmup", type=float, default=2)
+    parser.add_argument("--cats", type=int, default=1000, help="rows to seed when spawning a server")
+    parser.add_argument("--missions", type=int, default=2000, help="rows to seed when spawning a server")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--server", choices=("gunicorn", "uvicorn"), default="gunicorn")
+    parser.add_argument("--workers", type=int, default=2)
+    parser.add_argument("--threads", type=int, default=4, help="gunicorn threads per worker")
+    parser.add_argument("--port", type=int, default=8100)
+    parser.add_argument("--response-cache", action="store_true", help="keep ETag/response caching on")
+    parser.add_argument("--output")
+    args = parser.parse_args(argv)
+
+    procs = []
+    dataset = None
+    try:
+        if not args.url:
+            env = server.bench_env(args.response_cache)
+            dataset = server.prepare_database(env, args.cats, args.missions, args.seed)
+            if args.server == "uvicorn":
+                procs = [server.uvicorn(env, args.port, args.workers)]
+            else:
+                procs = [server.gunicorn(env, args.port, args.workers, args.threads)]
+            args.url = f"http://127.0.0.1:{args.port}"
+        server.wait_until_up(args.url + "/api/cats/")
+        scanned = asyncio.run(scan(args.url, args.concurrency))
+
+        results = {}
+        for name in args.flows.split(","):
+            if args.warmup:
+                flows(args.url, FLOWS[name], args.concurrency, args.warmup)
+            results[name] = flows(args.url, FLOWS[name], args.concurrency, args.duration)
+    finally:
+        server.stop(procs)
+
+    params = {k: v for k, v in vars(args).items() if k not in ("output", "url")}
+    params["dataset"] = dataset or scanned
+    emit("http", params, results, args.output)
+    return 0 if all(r["steps"] and not r["failed_iterations"] for r in results.values()) else 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
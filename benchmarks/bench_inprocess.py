@@ -0,0 +1,166 @@
+"""
+In-process benchmarks of every core serializer and the main views, on the seeded dataset.
+
+Views go through the full middleware stack with the DRF test client, so the numbers
+include URL resolution, authentication, pagination and rendering but no network.
+
+    python -m benchmarks.bench_inprocess --cats 1000 --missions 5000 --output before.json
+"""
+import argparse
+import statistics
+import time
+
+from benchmarks._django import setup
+from benchmarks.dataset import generate
+from benchmarks.results import emit
+
+PAGE = 100
+
+
+def measure(op, iterations: int, warmup: int) -> dict:
+    from django.db import connection
+
+    from apps.core.querybudget import QueryStats
+
+    for i in range(warmup):
+        op(i)
+    stats = QueryStats()
+    timings = []
+    with connection.execute_wrapper(stats):
+        for i in range(warmup, warmup + iterations):
+            started = time.perf_counter()
+            op(i)
+            timings.append(time.perf_counter() - started)
+    timings.sort()
+    return {
+        "iterations": iterations,
+        "mean_ms": round(statistics.fmean(timings) * 1000, 3),
+        "p50_ms": round(timings[len(timings) // 2] * 1000, 3),
+        "p95_ms": round(timings[min(len(timings) - 1, int(len(timings) * 0.95))] * 1000, 3),
+        "ops_per_second": round(len(timings) / sum(timings), 1),
+        "queries_per_op": round(stats.count / iterations, 2),
+    }
+
+
+def serializer_cases() -> dict:
+    from apps.core.fast_serializers import CAT_FIELDS, MISSION_FIELDS, TARGET_FIELDS, cat_rows, mission_rows
+    from apps.core.models import Cat, Mission, Target
+    from apps.core.serializers import (
+        CatCreateSerializer,
+        CatSerializer,
+        MissionCreateSerializer,
+        MissionSerializer,
+        TargetSerializer,
+        TargetUpdateSerializer,
+    )
+
+    cats = list(Cat.objects.order_by("-id")[:PAGE])
+    missions = list(Mission.objects.prefetch_related("targets").order_by("-id")[:PAGE])
+    targets = list(Target.objects.order_by("-id")[:PAGE])
+    open_target = Target.objects.select_related("mission").filter(mission__is_complete=False).first()
+    cat_values = list(Cat.objects.order_by("-id").values(*CAT_FIELDS)[:PAGE])
+    mission_values = list(Mission.objects.order_by("-id").values(*MISSION_FIELDS)[:PAGE])
+    mission_payload = {"targets": [{"name": f"t{n}", "country": "DE", "notes": "x"} for n in range(3)]}
+    cat_payload = {"name": "bench", "years_of_experience": 3, "breed": "Siamese", "salary": 1000}
+
+    return {
+        "cat_page": lambda i: CatSerializer(cats, many=True).data,
+        # The row builders convert values() dicts in place, so each call gets fresh copies.
+        "cat_page_fast": lambda i: cat_rows([dict(row) for row in cat_values]),
+        "mission_page": lambda i: MissionSerializer(missions, many=True).data,
+        "mission_page_fast": lambda i: mission_rows([dict(row) for row in mission_values]),
+        "target_page": lambda i: TargetSerializer(targets, many=True).data,
+        "target_page_fast": lambda i: list(Target.objects.order_by("-id").values(*TARGET_FIELDS)[:PAGE]),
+        "cat_create_validate": lambda i: CatCreateSerializer(data=cat_payload).is_valid(raise_exception=True),
+        "mission_create_validate": lambda i: MissionCreateSerializer(data=mission_payload).is_valid(
+            raise_exception=True
+        ),
+        "target_update_validate": lambda i: TargetUpdateSerializer(
+            open_target, data={"notes": f"n{i}"}, partial=True
+        ).is_valid(raise_exception=True),
+    }
+
+
+def view_cases(iterations: int, warmup: int) -> dict:
+    from django.urls import reverse
+    from rest_framework.test import APIClient
+
+    from apps.core.models import Cat, Mission, Target
+
+    client = APIClient()
+    total = iterations + warmup
+    cat_id = Cat.objects.order_by("id").values_list("id", flat=True).first()
+    mission_id = Mission.objects.order_by("id").values_list("id", flat=True).first()
+    open_targets = list(
+        Target.objects.filter(mission__is_complete=False).order_by("id").values_list("mission_id", "id")[:total]
+    )
+    # assign needs a fresh idle cat and an unassigned mission per call; create them up front.
+    idle_cats = Cat.objects.bulk_create(
+        [Cat(name=f"idle-{n}", years_of_experience=1, breed="Siamese", salary=100) for n in range(total)]
+    )
+    free_missions = Mission.objects.bulk_create([Mission() for _ in range(total)])
+
+    def check(response, status=200):
+        assert response.status_code == status, (response.status_code, getattr(response, "data", None))
+
+    def create_mission(i):
+        body = {"targets": [{"name": f"t{n}", "country": "DE"} for n in range(1 + i % 3)]}
+        check(client.post(reverse("missions-list"), body, format="json"), 201)
+
+    def assign(i):
+        url = reverse("missions-assign", args=[free_missions[i].pk])
+        check(client.post(url, {"cat_id": idle_cats[i].pk}, format="json"))
+
+    def patch_target(i):
+        mission, target = open_targets[i % len(open_targets)]
+        url = reverse("target-update", args=[mission, target])
+        check(client.patch(url, {"notes": f"bench {i}"}, format="json"))
+
+    return {
+        "cats_list": lambda i: check(client.get(reverse("cats-list"))),
+        "cat_detail": lambda i: check(client.get(reverse("cats-detail", args=[cat_id]))),
+        "missions_list": lambda i: check(client.get(reverse("missions-list"))),
+        "mission_detail": lambda i: check(client.get(reverse("missions-detail", args=[mission_id]))),
+        "targets_list": lambda i: check(client.get(reverse("targets-list"))),
+        "create_mission": create_mission,
+        "assign": assign,
+        "patch_target": patch_target,
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--cats", type=int, default=1000)
+    parser.add_argument("--missions", type=int, default=2000)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--iterations", type=int, default=200)
+    parser.add_argument("--warmup", type=int, default=20)
+    parser.add_argument("--only", help="comma-separated case names")
+    parser.add_argument("--response-cache", action="store_true", help="keep ETag/response caching on")
+    parser.add_argument("--output")
+    args = parser.parse_args(argv)
+
+    setup()
+    from django.test.utils import override_settings
+
+    dataset = generate(args.cats, args.missions, args.seed)
+    only = set(args.only.split(",")) if args.only else None
+    results = {}
+    with override_settings(RESPONSE_CACHE_ENABLED=args.response_cache, ALLOWED_HOSTS=["*"]):
+        for section, cases in (
+            ("serializers", serializer_cases()),
+            ("views", view_cases(args.iterations, args.warmup)),
+        ):
+            results[section] = {
+                name: measure(op, args.iterations, args.warmup)
+                for name, op in cases.items()
+                if only is None or name in only
+            }
+    params = dict(vars(args), dataset=dataset)
+    del params["output"]
+    emit("inprocess", params, results, args.output)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,70 @@
+"""
+Compare the DRF serializers with the fast row builders used by the list endpoints.
+
+    python -m benchmarks.bench_serializers --missions 5000
+"""
+import argparse
+import time
+
+from benchmarks._django import setup
+from benchmarks.dataset import generate
+from benchmarks.results import emit
+
+
+def best_of(fn, repeat: int):
+    timings, result = [], None
+    for _ in range(repeat):
+        started = time.perf_counter()
+        result = fn()
+        timings.append(time.perf_counter() - started)
+    return min(timings), result
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--missions", type=int, default=2000)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--output")
+    args = parser.parse_args(argv)
+
+    setup()
+    from rest_framework.renderers import JSONRenderer
+
+    from apps.core.fast_serializers import CAT_FIELDS, MISSION_FIELDS, TARGET_FIELDS, cat_rows, mission_rows
+    from apps.core.models import Cat, Mission, Target
+    from apps.core.serializers import CatSerializer, MissionSerializer, TargetSerializer
+
+    dataset = generate(max(1, args.missions // 2), args.missions, args.seed)
+    render = JSONRenderer().render
+    cases = {
+        "cats": (
+            lambda: render(CatSerializer(Cat.objects.order_by("-id"), many=True).data),
+            lambda: render(cat_rows(list(Cat.objects.order_by("-id").values(*CAT_FIELDS)))),
+        ),
+        "missions": (
+            lambda: render(MissionSerializer(Mission.objects.prefetch_related("targets").order_by("-id"), many=True).data),
+            lambda: render(mission_rows(list(Mission.objects.order_by("-id").values(*MISSION_FIELDS)))),
+        ),
+        "targets": (
+            lambda: render(TargetSerializer(Target.objects.order_by("-id"), many=True).data),
+            lambda: render(list(Target.objects.order_by("-id").values(*TARGET_FIELDS))),
+        ),
+    }
+    results = {}
+    for name, (drf, fast) in cases.items():
+        drf_time, drf_body = best_of(drf, args.repeat)
+        fast_time, fast_body = best_of(fast, args.repeat)
+        results[name] = {
+            "identical": drf_body == fast_body,
+            "bytes": len(fast_body),
+            "drf_seconds": round(drf_time, 5),
+            "fast_seconds": round(fast_time, 5),
+            "speedup": round(drf_time / fast_time, 2),
+        }
+    emit("serializers", {"missions": args.missions, "repeat": args.repeat, "dataset": dataset}, results, args.output)
+    return 0 if all(r["identical"] for r in results.values()) else 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,106 @@
+"""
+Cold start of gunicorn: time from launching it to the first served request, and the
+memory (PSS) of the master plus workers once every worker has served traffic.
+
+    python -m benchmarks.bench_startup --workers 4 --runs 5
+
+Modes: gunicorn's defaults; config/gunicorn.conf.py with GUNICORN_PRELOAD=0 (each
+worker imports and warms the app after the fork); config/gunicorn.conf.py (the
+master imports and warms it once and forks warm workers).
+For where the time inside one process goes: python manage.py profile_startup.
+"""
+import argparse
+import statistics
+import subprocess
+import time
+import urllib.request
+
+from benchmarks import server
+from benchmarks.results import emit
+
+CONFIG = "config/gunicorn.conf.py"
+MODES = {
+    "defaults": (None, {}),
+    "warm_workers": (CONFIG, {"GUNICORN_PRELOAD": "0"}),
+    "preload": (CONFIG, {"GUNICORN_PRELOAD": "1"}),
+}
+
+
+def pss_mb(pid: int) -> float | None:
+    """Proportional set size of a process and its children (Linux only)."""
+    try:
+        with open(f"/proc/{pid}/task/{pid}/children") as fh:
+            pids = [pid, *map(int, fh.read().split())]
+        total_kb = 0
+        for p in pids:
+            with open(f"/proc/{p}/smaps_rollup") as fh:
+                total_kb += next(int(line.split()[1]) for line in fh if line.startswith("Pss:"))
+        return round(total_kb / 1024, 1)
+    except (OSError, StopIteration):
+        return None
+
+
+def first_response(url: str, proc: subprocess.Popen, timeout: float = 60) -> None:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if proc.poll() is not None:
+            raise RuntimeError(f"gunicorn exited with {proc.returncode}")
+        try:
+            urllib.request.urlopen(url, timeout=timeout).read()
+            return
+        except OSError:
+            time.sleep(0.01)
+    raise RuntimeError(f"no response from {url}")
+
+
+def cold_start(env: dict, port: int, args, config: str | None) -> dict:
+    url = f"http://127.0.0.1:{port}{args.path}"
+    started = time.perf_counter()
+    proc = server.gunicorn(env, port, args.workers, args.threads, config)
+    try:
+        first_response(url, proc)
+        elapsed = time.perf_counter() - started
+        for _ in range(args.requests):
+            urllib.request.urlopen(url, timeout=30).read()
+        time.sleep(1)
+        return {"cold_start_ms": elapsed * 1000, "pss_mb": pss_mb(proc.pid)}
+    finally:
+        server.stop([proc])
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--workers", type=int, default=2)
+    parser.add_argument("--threads", type=int, default=4)
+    parser.add_argument("--runs", type=int, default=3)
+    parser.add_argument("--requests", type=int, default=50, help="requests served before measuring memory")
+    parser.add_argument("--path", default="/api/cats/")
+    parser.add_argument("--modes", default=",".join(MODES))
+    parser.add_argument("--cats", type=int, default=200)
+    parser.add_argument("--missions", type=int, default=200)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--port", type=int, default=8300)
+    parser.add_argument("--output")
+    args = parser.parse_args(argv)
+
+    env = server.bench_env()
+    dataset = server.prepare_database(env, args.cats, args.missions, args.seed)
+    results = {}
+    for mode in args.modes.split(","):
+        config, extra_env = MODES[mode]
+        runs = [cold_start(dict(env, **extra_env), args.port, args, config) for _ in range(args.runs)]
+        cold = [run["cold_start_ms"] for run in runs]
+        memory = [run["pss_mb"] for run in runs if run["pss_mb"] is not None]
+        results[mode] = {
+            "cold_start_ms": round(statistics.median(cold), 1),
+            "cold_start_max_ms": round(max(cold), 1),
+            "pss_mb": round(statistics.median(memory), 1) if memory else None,
+        }
+    params = dict(vars(args), dataset=dataset)
+    del params["output"]
+    emit("startup", params, results, args.output)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
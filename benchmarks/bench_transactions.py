@@ -0,0 +1,148 @@
+"""
+Round trips and transaction time per request with ATOMIC_REQUESTS versus the
+per-view transaction policy (autocommit reads, atomic only for listed writes).
+
+    python -m benchmarks.bench_transactions --missions 2000
+    python -m benchmarks.bench_transactions --settings config.settings.dev   # against Postgres
+
+round_trips counts SQL statements, COMMIT/ROLLBACK and, on backends where the
+driver sends BEGIN implicitly (Postgres), BEGIN. lock_held_ms is how long the
+request kept a transaction open on the primary: BEGIN to COMMIT inside an atomic
+block, the statement itself in autocommit. In atomic_requests mode the policy's
+own atomic blocks still run, as savepoints, so only the read rows compare the two
+designs one to one.
+"""
+import argparse
+import statistics
+import time
+
+from benchmarks._django import setup
+from benchmarks.dataset import generate
+from benchmarks.results import emit
+
+ENDPOINTS = {
+    "cats_list": ("get", "cats-list", None),
+    "missions_list": ("get", "missions-list", None),
+    "targets_list": ("get", "targets-list", None),
+    "mission_detail": ("get", "missions-detail", "mission"),
+    "cat_patch": ("patch", "cats-detail", "cat"),
+}
+
+
+class TransactionProbe:
+    """Count statements, transactions and the time a transaction is open on one connection."""
+
+    def __init__(self, connection):
+        self.connection = connection
+        self.implicit_begin = connection.vendor != "sqlite"
+        self.statements = self.begins = self.ends = 0
+        self.lock_held = 0.0
+        self._opened = None
+
+    def __call__(self, execute, sql, params, many, context):
+        started = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.statements += 1
+            if self._opened is None and not self.connection.in_atomic_block and sql != "BEGIN":
+                self.lock_held += time.perf_counter() - started
+
+    def install(self):
+        conn = self.connection
+        original_set_autocommit, original_commit, original_rollback = conn.set_autocommit, conn._commit, conn._rollback
+
+        def set_autocommit(autocommit, *args, **kwargs):
+            if not autocommit and self._opened is None:
+                self.begins += 1
+                self._opened = time.perf_counter()
+            return original_set_autocommit(autocommit, *args, **kwargs)
+
+        def end(original):
+            def wrapper():
+                try:
+                    return original()
+                finally:
+                    self.ends += 1
+                    if self._opened is not None:
+                        self.lock_held += time.perf_counter() - self._opened
+                        self._opened = None
+            return wrapper
+
+        conn.set_autocommit, conn._commit, conn._rollback = set_autocommit, end(original_commit), end(original_rollback)
+
+        def uninstall():
+            conn.set_autocommit, conn._commit, conn._rollback = original_set_autocommit, original_commit, original_rollback
+        return uninstall
+
+    def round_trips(self) -> int:
+        return self.statements + self.ends + (self.begins if self.implicit_begin else 0)
+
+
+def run(endpoint, client, ids: dict, iterations: int) -> dict:
+    from django.db import connection
+    from django.urls import reverse
+
+    method, name, arg = ENDPOINTS[endpoint]
+    url = reverse(name, args=[ids[arg]] if arg else None)
+    probe = TransactionProbe(connection)
+    uninstall = probe.install()
+    timings = []
+    try:
+        with connection.execute_wrapper(probe):
+            for i in range(iterations):
+                started = time.perf_counter()
+                if method == "get":
+                    response = client.get(url)
+                else:
+                    response = client.patch(url, {"salary": 100 + i}, format="json")
+                timings.append(time.perf_counter() - started)
+                assert response.status_code == 200, response.status_code
+    finally:
+        uninstall()
+    return {
+        "mean_ms": round(statistics.fmean(timings) * 1000, 3),
+        "statements_per_request": round(probe.statements / iterations, 2),
+        "transactions_per_request": round(probe.begins / iterations, 2),
+        "round_trips_per_request": round(probe.round_trips() / iterations, 2),
+        "lock_held_ms": round(probe.lock_held / iterations * 1000, 3),
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--cats", type=int, default=1000)
+    parser.add_argument("--missions", type=int, default=2000)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--iterations", type=int, default=200)
+    parser.add_argument("--settings", default="config.settings.test")
+    parser.add_argument("--output")
+    args = parser.parse_args(argv)
+
+    connection = setup(args.settings)
+    from django.test.utils import override_settings
+    from rest_framework.test import APIClient
+
+    from apps.core.models import Cat, Mission
+
+    dataset = generate(args.cats, args.missions, args.seed)
+    ids = {
+        "cat": Cat.objects.values_list("id", flat=True).first(),
+        "mission": Mission.objects.values_list("id", flat=True).first(),
+    }
+    client = APIClient()
+    results = {}
+    with override_settings(RESPONSE_CACHE_ENABLED=False, ALLOWED_HOSTS=["*"], DATABASE_REPLICAS=[]):
+        for mode, atomic_requests in (("atomic_requests", True), ("policy", False)):
+            connection.settings_dict["ATOMIC_REQUESTS"] = atomic_requests
+            run("cats_list", client, ids, 10)
+            results[mode] = {name: run(name, client, ids, args.iterations) for name in ENDPOINTS}
+    connection.settings_dict["ATOMIC_REQUESTS"] = False
+    params = dict(vars(args), dataset=dataset, vendor=connection.vendor)
+    del params["output"]
+    emit("transactions", params, results, args.output)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,97 @@
+"""
+Reproducible benchmark dataset: N cats, M missions with 1..3 targets each.
+
+The same (cats, missions, seed) always produces the same rows, so numbers from
+different commits are measured against identical data. Seed the configured
+database directly with:
+
+    python -m benchmarks.dataset --cats 1000 --missions 5000 --seed 42
+"""
+import argparse
+import json
+import os
+import random
+
+BREEDS = ("Siamese", "Bengal", "Persian", "Sphynx", "Maine Coon", "Ragdoll")
+COUNTRIES = ("DE", "UA", "PL", "FR", "GB", "US")
+BATCH_SIZE = 1000
+
+
+def generate(cats: int, missions: int, seed: int = 42) -> dict:
+    """
+    Insert the dataset into the default database and return row counts.
+
+    About 30% of missions are led by a cat (never more than one active mission
+    per cat) and 20% are complete with every target complete; target counters
+    are filled in as the API would leave them.
+    """
+    from apps.core.models import Cat, Mission, Target
+
+    rng = random.Random(seed)
+    cat_objs = Cat.objects.bulk_create(
+        [
+            Cat(
+                name=f"cat-{i}",
+                years_of_experience=rng.randint(0, 20),
+                breed=rng.choice(BREEDS),
+                salary=rng.randint(100, 5000),
+            )
+            for i in range(cats)
+        ],
+        batch_size=BATCH_SIZE,
+    )
+    idle = list(cat_objs)
+    rng.shuffle(idle)
+
+    plans = []
+    for _ in range(missions):
+        done = rng.random() < 0.2
+        cat = None
+        if rng.random() < 0.3 and cat_objs:
+            cat = rng.choice(cat_objs) if done else (idle.pop() if idle else None)
+        plans.append((done, cat, rng.randint(1, 3)))
+
+    mission_objs = Mission.objects.bulk_create(
+        [
+            Mission(
+                assigned_cat=cat,
+                is_complete=done,
+                target_count=count,
+                completed_target_count=count if done else 0,
+            )
+            for done, cat, count in plans
+        ],
+        batch_size=BATCH_SIZE,
+    )
+    targets = [
+        Target(
+            mission=mission,
+            name=f"t-{i}-{n}",
+            country=rng.choice(COUNTRIES),
+            notes="n" * rng.randint(0, 40),
+            is_complete=done,
+        )
+        for i, (mission, (done, _, count)) in enumerate(zip(mission_objs, plans))
+        for n in range(count)
+    ]
+    Target.objects.bulk_create(targets, batch_size=BATCH_SIZE)
+    return {"seed": seed, "cats": len(cat_objs), "missions": len(mission_objs), "targets": len(targets)}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--cats", type=int, default=1000)
+    parser.add_argument("--missions", type=int, default=2000)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args(argv)
+
+    import django
+
+    os.environ.setdefault("DJANGO_SETTINGS_MODULE", "config.settings.dev")
+    django.setup()
+    print(json.dumps(generate(args.cats, args.missions, args.seed)))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,210 @@
+"""
+Closed-loop HTTP/1.1 load generator with keep-alive connections and no dependencies.
+
+Each of ``concurrency`` workers keeps one connection open and issues GET requests
+back to back, cycling through the given paths, until the duration elapses.
+``run_flows`` does the same with a scripted sequence of requests per iteration
+(e.g. create a mission, then assign it) and reports latency per step.
+"""
+import asyncio
+import json
+import time
+from urllib.parse import urlsplit
+
+
+class LoadStats:
+    __slots__ = ("latencies", "errors", "statuses")
+
+    def __init__(self):
+        self.latencies = []
+        self.errors = 0
+        self.statuses = {}
+
+    def summary(self, elapsed: float) -> dict:
+        ordered = sorted(self.latencies)
+
+        def pct(p):
+            if not ordered:
+                return None
+            return round(ordered[min(len(ordered) - 1, int(len(ordered) * p))] * 1000, 2)
+
+        return {
+            "requests": len(ordered),
+            "errors": self.errors,
+            "statuses": {str(k): v for k, v in sorted(self.statuses.items())},
+            "rps": round(len(ordered) / elapsed, 1) if elapsed else 0.0,
+            "p50_ms": pct(0.50),
+            "p90_ms": pct(0.90),
+            "p99_ms": pct(0.99),
+            "max_ms": round(ordered[-1] * 1000, 2) if ordered else None,
+        }
+
+
+async def _read_response(reader) -> tuple:
+    status_line = await reader.readline()
+    if not status_line:
+        raise ConnectionError("connection closed by server")
+    status = int(status_line.split()[1])
+    length, chunked, close, body = None, False, False, b""
+    while True:
+        line = await reader.readline()
+        if line in (b"\r\n", b""):
+            break
+        name, _, value = line.decode("latin-1").partition(":")
+        name, value = name.strip().lower(), value.strip().lower()
+        if name == "content-length":
+            length = int(value)
+        elif name == "transfer-encoding" and "chunked" in value:
+            chunked = True
+        elif name == "connection" and value == "close":
+            close = True
+    if chunked:
+        chunks = []
+        while True:
+            size = int((await reader.readline()).split(b";")[0], 16)
+            chunks.append((await reader.readexactly(size + 2))[:-2])
+            if size == 0:
+                break
+        body = b"".join(chunks)
+    elif length is not None:
+        body = await reader.readexactly(length)
+    elif status not in (204, 304):
+        body = await reader.read()
+        close = True
+    return status, close, body
+
+
+async def _worker(host: str, port: int, paths: list, offset: int, deadline: float, stats: LoadStats, headers: str):
+    reader = writer = None
+    i = offset
+    while time.perf_counter() < deadline:
+        if writer is None:
+            try:
+                reader, writer = await asyncio.open_connection(host, port)
+            except OSError:
+                stats.errors += 1
+                await asyncio.sleep(0.01)
+                continue
+        path = paths[i % len(paths)]
+        i += 1
+        started = time.perf_counter()
+        try:
+            writer.write(f"GET {path} HTTP/1.1\r\nHost: {host}:{port}\r\n{headers}\r\n".encode())
+            await writer.drain()
+            status, close, _ = await _read_response(reader)
+        except (OSError, ConnectionError, ValueError, asyncio.IncompleteReadError):
+            stats.errors += 1
+            writer.close()
+            reader = writer = None
+            continue
+        stats.latencies.append(time.perf_counter() - started)
+        stats.statuses[status] = stats.statuses.get(status, 0) + 1
+        if status >= 400:
+            stats.errors += 1
+        if close:
+            writer.close()
+            reader = writer = None
+    if writer is not None:
+        writer.close()
+
+
+async def run_load(base_url: str, paths: list, concurrency: int, duration: float, headers: dict | None = None) -> dict:
+    parts = urlsplit(base_url)
+    host, port = parts.hostname, parts.port or 80
+    extra = "".join(f"{k}: {v}\r\n" for k, v in (headers or {}).items())
+    stats = LoadStats()
+    started = time.perf_counter()
+    deadline = started + duration
+    await asyncio.gather(
+        *(_worker(host, port, paths, n, deadline, stats, extra) for n in range(concurrency))
+    )
+    return stats.summary(time.perf_counter() - started)
+
+
+def load(base_url: str, paths: list, concurrency: int, duration: float, headers: dict | None = None) -> dict:
+    return asyncio.run(run_load(base_url, paths, concurrency, duration, headers))
+
+
+class FlowError(Exception):
+    """Raised by a flow when a step's response does not let the iteration continue."""
+
+
+class Session:
+    """A keep-alive connection handed to a flow; records every request under its step name."""
+
+    def __init__(self, host: str, port: int, steps: dict):
+        self.host = host
+        self.port = port
+        self.steps = steps
+        self.reader = self.writer = None
+
+    async def request(self, step: str, method: str, path: str, body=None, expect=(200,)):
+        """Send one request and return the decoded JSON body; raise FlowError on an unexpected status."""
+        stats = self.steps.get(step)
+        if stats is None:
+            stats = self.steps[step] = LoadStats()
+        payload = b"" if body is None else json.dumps(body).encode()
+        head = f"{method} {path} HTTP/1.1\r\nHost: {self.host}:{self.port}\r\nContent-Length: {len(payload)}\r\n"
+        if body is not None:
+            head += "Content-Type: application/json\r\n"
+        started = time.perf_counter()
+        try:
+            if self.writer is None:
+                self.reader, self.writer = await asyncio.open_connection(self.host, self.port)
+            self.writer.write(head.encode() + b"\r\n" + payload)
+            await self.writer.drain()
+            status, close, data = await _read_response(self.reader)
+        except (OSError, ConnectionError, ValueError, asyncio.IncompleteReadError) as exc:
+            stats.errors += 1
+            self.close()
+            raise FlowError(f"{step}: {exc}") from exc
+        stats.latencies.append(time.perf_counter() - started)
+        stats.statuses[status] = stats.statuses.get(status, 0) + 1
+        if close:
+            self.close()
+        if status not in expect:
+            stats.errors += 1
+            raise FlowError(f"{step}: HTTP {status}")
+        return json.loads(data) if data else None
+
+    def close(self):
+        if self.writer is not None:
+            self.writer.close()
+        self.reader = self.writer = None
+
+
+async def _flow_worker(host, port, flow, worker: int, deadline: float, steps: dict, counters: dict):
+    session = Session(host, port, steps)
+    iteration = 0
+    while time.perf_counter() < deadline:
+        try:
+            await flow(session, worker, iteration)
+            counters["iterations"] += 1
+        except FlowError:
+            counters["failed"] += 1
+            await asyncio.sleep(0.01)
+        iteration += 1
+    session.close()
+
+
+async def run_flows(base_url: str, flow, concurrency: int, duration: float) -> dict:
+    """Run ``await flow(session, worker, iteration)`` in a closed loop on ``concurrency`` connections."""
+    parts = urlsplit(base_url)
+    host, port = parts.hostname, parts.port or 80
+    steps, counters = {}, {"iterations": 0, "failed": 0}
+    started = time.perf_counter()
+    deadline = started + duration
+    await asyncio.gather(
+        *(_flow_worker(host, port, flow, n, deadline, steps, counters) for n in range(concurrency))
+    )
+    elapsed = time.perf_counter() - started
+    return {
+        "iterations": counters["iterations"],
+        "failed_iterations": counters["failed"],
+        "iterations_per_second": round(counters["iterations"] / elapsed, 1) if elapsed else 0.0,
+        "steps": {name: stats.summary(elapsed) for name, stats in sorted(steps.items())},
+    }
+
+
+def flows(base_url: str, flow, concurrency: int, duration: float) -> dict:
+    return asyncio.run(run_flows(base_url, flow, concurrency, duration))
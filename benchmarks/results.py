@@ -0,0 +1,116 @@
+"""
+JSON result files shared by the benchmarks, and a diff between two of them.
+
+Every benchmark accepts ``--output PATH``; the file carries the benchmark name,
+its parameters, the commit it ran on and the measured numbers. Compare runs
+from two commits with:
+
+    python -m benchmarks.results before.json after.json --threshold 0.1
+
+which lists every timing that moved and exits 1 if any got worse by more than
+the threshold.
+"""
+import argparse
+import datetime
+import json
+import platform
+import subprocess
+import sys
+
+# ``diff`` compares throughput leaves (higher is better) and latency leaves (lower is better).
+HIGHER_IS_BETTER = {"rps", "ops_per_second", "iterations_per_second", "speedup"}
+LOWER_IS_BETTER_SUFFIXES = ("_ms", "_seconds")
+
+
+def git_revision() -> str | None:
+    try:
+        out = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, timeout=5, check=True
+        )
+    except (OSError, subprocess.SubprocessError):
+        return None
+    return out.stdout.strip() or None
+
+
+def document(benchmark: str, params: dict, results: dict) -> dict:
+    import django
+
+    return {
+        "benchmark": benchmark,
+        "revision": git_revision(),
+        "created_at": datetime.datetime.now(datetime.timezone.utc).isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "django": django.get_version(),
+        "params": params,
+        "results": results,
+    }
+
+
+def emit(benchmark: str, params: dict, results: dict, output: str | None = None) -> dict:
+    """Print the result document and, with ``output``, also write it there."""
+    doc = document(benchmark, params, results)
+    text = json.dumps(doc, indent=2, sort_keys=True)
+    if output:
+        with open(output, "w", encoding="utf-8") as fh:
+            fh.write(text + "\n")
+    print(text)
+    return doc
+
+
+def _direction(key: str) -> int:
+    """1 when higher is better, -1 when lower is better, 0 when the leaf is not a timing."""
+    if key in HIGHER_IS_BETTER:
+        return 1
+    if key.endswith(LOWER_IS_BETTER_SUFFIXES):
+        return -1
+    return 0
+
+
+def _leaves(node, path=()):
+    if isinstance(node, dict):
+        for key, value in node.items():
+            yield from _leaves(value, path + (key,))
+    elif isinstance(node, (int, float)) and not isinstance(node, bool) and path:
+        yield path, node
+
+
+def diff(before: dict, after: dict) -> list:
+    """Return [(path, before, after, change)] for timings in both runs; change > 0 means better."""
+    old = dict(_leaves(before.get("results", {})))
+    rows = []
+    for path, new_value in _leaves(after.get("results", {})):
+        direction = _direction(path[-1])
+        old_value = old.get(path)
+        if not direction or old_value is None or not old_value:
+            continue
+        rows.append((".".join(map(str, path)), old_value, new_value, direction * (new_value - old_value) / old_value))
+    return rows
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("before")
+    parser.add_argument("after")
+    parser.add_argument("--threshold", type=float, default=0.1, help="relative change that counts as a regression")
+    args = parser.parse_args(argv)
+
+    with open(args.before, encoding="utf-8") as fh:
+        before = json.load(fh)
+    with open(args.after, encoding="utf-8") as fh:
+        after = json.load(fh)
+    if before.get("params") != after.get("params"):
+        print("warning: runs used different parameters", file=sys.stderr)
+
+    regressions = 0
+    for path, old_value, new_value, change in diff(before, after):
+        flag = ""
+        if change < -args.threshold:
+            flag = "  REGRESSION"
+            regressions += 1
+        print(f"{path:<60} {old_value:>12} -> {new_value:<12} {change:+.1%}{flag}")
+    print(f"{before.get('revision')} -> {after.get('revision')}: {regressions} regression(s)")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
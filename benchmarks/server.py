@@ -0,0 +1,80 @@
+"""Spawn gunicorn/uvicorn on a throwaway, seeded SQLite database for the HTTP benchmarks."""
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+import urllib.request
+
+
+def bench_env(response_cache: bool = False) -> dict:
+    """Environment for servers using benchmarks.settings in a fresh BENCH_DIR."""
+    return dict(
+        os.environ,
+        BENCH_DIR=tempfile.mkdtemp(prefix="sca-bench-"),
+        DJANGO_SETTINGS_MODULE="benchmarks.settings",
+        RESPONSE_CACHE_ENABLED="1" if response_cache else "0",
+    )
+
+
+def prepare_database(env: dict, cats: int, missions: int, seed: int) -> dict:
+    """Migrate and seed the benchmark database; returns the dataset counts plus ``mission_id`` to fetch."""
+    subprocess.run([sys.executable, "manage.py", "migrate", "--noinput", "-v", "0"], env=env, check=True)
+    script = (
+        "import django, json; django.setup()\n"
+        "from benchmarks.dataset import generate\n"
+        "from apps.core.models import Mission\n"
+        f"dataset = generate({cats}, {missions}, {seed})\n"
+        "dataset['mission_id'] = Mission.objects.order_by('id').values_list('id', flat=True).first()\n"
+        "print(json.dumps(dataset))\n"
+    )
+    out = subprocess.run([sys.executable, "-c", script], env=env, check=True, capture_output=True, text=True)
+    return json.loads(out.stdout.strip().splitlines()[-1])
+
+
+def wait_until_up(url: str, timeout: float = 30) -> None:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            urllib.request.urlopen(url, timeout=1).read()
+            return
+        except OSError:
+            time.sleep(0.2)
+    raise RuntimeError(f"server at {url} did not start")
+
+
+def gunicorn(env: dict, port: int, workers: int, threads: int, config: str | None = None) -> subprocess.Popen:
+    """gunicorn with its defaults, or with ``config`` (e.g. config/gunicorn.conf.py) as well."""
+    return subprocess.Popen(
+        [
+            sys.executable, "-m", "gunicorn", "config.wsgi:application",
+            *(["--config", config] if config else []),
+            "--bind", f"127.0.0.1:{port}",
+            "--workers", str(workers), "--threads", str(threads), "--log-level", "warning",
+        ],
+        env=env,
+    )
+
+
+def uvicorn(env: dict, port: int, workers: int) -> subprocess.Popen:
+    return subprocess.Popen(
+        [
+            sys.executable, "-m", "uvicorn", "config.asgi:application",
+            "--host", "127.0.0.1", "--port", str(port),
+            "--workers", str(workers), "--no-access-log", "--log-level", "warning",
+        ],
+        env=env,
+    )
+
+
+def stop(procs) -> None:
+    for proc in procs:
+        proc.terminate()
+    for proc in procs:
+        try:
+            proc.wait(10)
+        except subprocess.TimeoutExpired:
+            # gunicorn's graceful shutdown waits out idle keep-alive connections.
+            proc.kill()
+            proc.wait()
@@ -0,0 +1,40 @@
+"""Settings for servers spawned by the HTTP benchmarks: a file SQLite database and cache in BENCH_DIR."""
+import os
+
+from config.settings.base import *  # noqa: F401,F403
+
+BENCH_DIR = os.environ["BENCH_DIR"]
+
+DEBUG = False
+ALLOWED_HOSTS = ["*"]
+
+DATABASES = {
+    "default": {
+        "ENGINE": "django.db.backends.sqlite3",
+        "NAME": os.path.join(BENCH_DIR, "db.sqlite3"),
+        # IMMEDIATE takes the write lock at BEGIN: a deferred transaction that reads and then
+        # writes fails at once with "database is locked" when another writer got there first.
+        "OPTIONS": {"timeout": 20, "transaction_mode": "IMMEDIATE", "init_command": "PRAGMA journal_mode=WAL;"},
+    }
+}
+
+CACHES = {
+    "default": {
+        "BACKEND": "apps.core.cache_backends.SQLiteCache",
+        "LOCATION": os.path.join(BENCH_DIR, "cache.sqlite3"),
+        "TIMEOUT": 900,
+        "OPTIONS": {"MAX_ENTRIES": 20000},
+    }
+}
+
+BREEDS_SNAPSHOT_PATH = None
+BREEDS_REMOTE_REFRESH = False
+METRICS_DIR = None
+
+# Surface server errors on the console; a benchmark full of 500s measures nothing.
+LOGGING = {
+    "version": 1,
+    "disable_existing_loggers": False,
+    "handlers": {"console": {"class": "logging.StreamHandler"}},
+    "loggers": {"django.request": {"handlers": ["console"], "level": "ERROR", "propagate": False}},
+}
@@ -0,0 +1,44 @@
+"""
+gunicorn -c config/gunicorn.conf.py config.wsgi:application
+
+With preload_app the master sets Django up, imports the URLconf and views and loads
+the breed snapshot once, then forks the workers: they start warm and share those
+pages copy-on-write instead of each importing everything again. A preloaded app
+is not reloaded on HUP; deploy code changes with a restart.
+GUNICORN_CMD_ARGS and command-line options override anything here.
+"""
+import os
+import shutil
+
+bind = os.getenv("GUNICORN_BIND", "0.0.0.0:8000")
+preload_app = os.getenv("GUNICORN_PRELOAD", "1") == "1"
+
+
+def on_starting(server):
+    # Per-worker metric files of the previous run would be summed with this one's.
+    directory = os.getenv("METRICS_DIR")
+    if directory:
+        shutil.rmtree(directory, ignore_errors=True)
+
+
+def child_exit(server, worker):
+    # Drop the dead worker's gauges from /metrics; its counters live on in dead.json.
+    directory = os.getenv("METRICS_DIR")
+    if directory:
+        from apps.core.metrics import mark_process_dead
+
+        mark_process_dead(worker.pid, directory)
+
+
+def when_ready(server):
+    if server.cfg.preload_app:
+        from apps.core.startup import warm_up
+
+        warm_up()
+
+
+def post_worker_init(worker):
+    if not worker.cfg.preload_app:
+        from apps.core.startup import warm_up
+
+        warm_up()
@@ -25,6 +25,9 @@ INSTALLED_APPS = [
 ]
 
 MIDDLEWARE = [
+    "apps.core.metrics.MetricsMiddleware",
+    "apps.core.querybudget.QueryBudgetMiddleware",
+    "apps.core.db_router.ReplicaMiddleware",
     "django.middleware.security.SecurityMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
     "django.middleware.common.CommonMiddleware",
@@ -63,10 +66,45 @@ DATABASES = {
         "HOST": os.getenv("DB_HOST", "127.0.0.1"),
         "PORT": int(os.getenv("DB_PORT", "5432")),
         "CONN_MAX_AGE": int(os.getenv("DB_CONN_MAX_AGE", "60")),
-        "ATOMIC_REQUESTS": True,
+        # Views choose their own transactions: see apps/core/transactions.py.
+        "ATOMIC_REQUESTS": False,
     }
 }
 
+# ───────────── DATABASE POOL ─────────────
+# DB_POOL=1: one psycopg pool per worker process, shared by its threads. Backend connections
+# stay within workers × DB_POOL_MAX_SIZE, shrink to DB_POOL_MIN_SIZE when idle and are
+# recycled with jitter after DB_POOL_MAX_LIFETIME instead of all expiring together.
+# Connections are health-checked on checkout (or on reuse, with persistent ones).
+DATABASES["default"]["CONN_HEALTH_CHECKS"] = True
+if os.getenv("DB_POOL", "1") == "1":
+    DATABASES["default"]["CONN_MAX_AGE"] = 0
+    DATABASES["default"]["OPTIONS"] = {
+        "pool": {
+            "min_size": int(os.getenv("DB_POOL_MIN_SIZE", "1")),
+            "max_size": int(os.getenv("DB_POOL_MAX_SIZE", "4")),
+            "timeout": float(os.getenv("DB_POOL_TIMEOUT", "10")),
+            "max_idle": float(os.getenv("DB_POOL_MAX_IDLE", "60")),
+            "max_lifetime": float(os.getenv("DB_POOL_MAX_LIFETIME", "1800")),
+        }
+    }
+
+# ───────────── READ REPLICAS ─────────────
+# DB_REPLICA_HOSTS="r1,r2" adds aliases replica1, replica2 with the primary's credentials.
+# Safe requests read core and auth models from a random replica; a client that wrote in
+# the last REPLICA_STICKY_SECONDS (longer than the worst replication lag) reads the primary.
+DATABASE_REPLICAS = []
+for _n, _host in enumerate(filter(None, os.getenv("DB_REPLICA_HOSTS", "").split(",")), start=1):
+    DATABASES[f"replica{_n}"] = {
+        **DATABASES["default"],
+        "HOST": _host.strip(),
+        "ATOMIC_REQUESTS": False,
+        "TEST": {"MIRROR": "default"},
+    }
+    DATABASE_REPLICAS.append(f"replica{_n}")
+DATABASE_ROUTERS = ["apps.core.db_router.ReplicaRouter"]
+REPLICA_STICKY_SECONDS = float(os.getenv("REPLICA_STICKY_SECONDS", "5"))
+
 LANGUAGE_CODE = "en-us"
 TIME_ZONE = "UTC"
 USE_I18N = True
@@ -80,12 +118,41 @@ REST_FRAMEWORK = {
     "DEFAULT_SCHEMA_CLASS": "drf_spectacular.openapi.AutoSchema",
     "DEFAULT_RENDERER_CLASSES": ["rest_framework.renderers.JSONRenderer"],
     "DEFAULT_PARSER_CLASSES": ["rest_framework.parsers.JSONParser"],
+    # simplejwt's and DRF's classes, minus their queries in query budgets (apps/core/authentication.py).
     "DEFAULT_AUTHENTICATION_CLASSES": [
-        "rest_framework_simplejwt.authentication.JWTAuthentication",  # +++
-        "rest_framework.authentication.SessionAuthentication",
+        "apps.core.authentication.UncountedJWTAuthentication",
+        "apps.core.authentication.UncountedSessionAuthentication",
     ],
 }
 
+# ───────────── PAGINATION ─────────────
+CORE_PAGE_SIZE = int(os.getenv("CORE_PAGE_SIZE", "50"))
+CORE_MAX_PAGE_SIZE = int(os.getenv("CORE_MAX_PAGE_SIZE", "500"))
+EXPORT_CHUNK_SIZE = int(os.getenv("EXPORT_CHUNK_SIZE", "2000"))
+
+# ───────────── RESPONSE CACHE ─────────────
+# ETag/304 and cached response data for core list/detail reads. Table versions live
+# in the default cache, which must be shared by all workers.
+RESPONSE_CACHE_ENABLED = os.getenv("RESPONSE_CACHE_ENABLED", "1") == "1"
+RESPONSE_CACHE_TIMEOUT = int(os.getenv("RESPONSE_CACHE_TIMEOUT", "300"))
+
+# ───────────── BULK OPERATIONS ─────────────
+BULK_BATCH_SIZE = int(os.getenv("BULK_BATCH_SIZE", "1000"))
+BULK_MAX_ITEMS = int(os.getenv("BULK_MAX_ITEMS", "5000"))
+
+# ───────────── QUERY BUDGETS ─────────────
+# "<module>.<View>.<action>": max SQL queries; overrides budgets declared on the views.
+QUERY_BUDGETS = {}
+QUERY_BUDGET_HEADERS = DEBUG
+
+# ───────────── METRICS ─────────────
+# Set METRICS_DIR to a directory shared by all gunicorn workers and emptied on start.
+# Off by default; with METRICS_TOKEN set, scrapes must send "Authorization: Bearer <token>".
+METRICS_ENABLED = os.getenv("METRICS_ENABLED", "0") == "1"
+METRICS_TOKEN = os.getenv("METRICS_TOKEN", "")
+METRICS_DIR = os.getenv("METRICS_DIR") or None
+METRICS_FLUSH_INTERVAL = float(os.getenv("METRICS_FLUSH_INTERVAL", "5"))
+
 # ───────────── SPECTACULAR ─────────────
 SPECTACULAR_SETTINGS = {
     "TITLE": "Spy Cat Agency API",
@@ -93,15 +160,46 @@ SPECTACULAR_SETTINGS = {
     "VERSION": "1.0.0",
     "SERVE_INCLUDE_SCHEMA": False,
 }
+# manage.py build_schema writes openapi-<VERSION>.{yaml,json} and their .gz copies here.
+# /api/schema/ serves them; without them it answers 503, or generates the document with DEBUG.
+SCHEMA_DIR = os.getenv("SCHEMA_DIR", str(BASE_DIR / "var" / "schema"))
 
 # ───────────── CACHE ─────────────
+# Shared by all workers on the host by default; CACHE_BACKEND/CACHE_LOCATION select another
+# backend (e.g. django.core.cache.backends.locmem.LocMemCache for a single process).
 CACHES = {
     "default": {
-        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
-        "LOCATION": "sca-cache",
+        "BACKEND": os.getenv("CACHE_BACKEND", "apps.core.cache_backends.SQLiteCache"),
+        "LOCATION": os.getenv("CACHE_LOCATION", str(BASE_DIR / "var" / "cache.sqlite3")),
         "TIMEOUT": 900,
+        "OPTIONS": {
+            "MAX_ENTRIES": int(os.getenv("CACHE_MAX_ENTRIES", "20000")),
+            "MAX_SIZE": int(os.getenv("CACHE_MAX_SIZE", str(64 * 1024 * 1024))),
+        },
     }
 }
 
 # ───────────── EXTERNAL API KEYS ─────────────
 THECATAPI_API_KEY = os.getenv("THECATAPI_API_KEY", "")
+
+# ───────────── OUTBOUND HTTP ─────────────
+OUTBOUND_HTTP = {
+    "POOL_CONNECTIONS": int(os.getenv("OUTBOUND_HTTP_POOL_CONNECTIONS", "4")),
+    "POOL_MAXSIZE": int(os.getenv("OUTBOUND_HTTP_POOL_MAXSIZE", "8")),
+    "MAX_RETRIES": int(os.getenv("OUTBOUND_HTTP_MAX_RETRIES", "2")),
+    "BACKOFF": float(os.getenv("OUTBOUND_HTTP_BACKOFF", "0.2")),
+    "BACKOFF_MAX": float(os.getenv("OUTBOUND_HTTP_BACKOFF_MAX", "2")),
+    "PER_HOST_LIMIT": int(os.getenv("OUTBOUND_HTTP_PER_HOST_LIMIT", "8")),
+    "TIMEOUT": float(os.getenv("OUTBOUND_HTTP_TIMEOUT", "10")),
+}
+
+# ───────────── BREED INDEX ─────────────
+BREEDS_INDEX_CHECK_INTERVAL = float(os.getenv("BREEDS_INDEX_CHECK_INTERVAL", "30"))
+BREEDS_TTL = int(os.getenv("BREEDS_TTL", "86400"))
+BREEDS_FETCH_TIMEOUT = float(os.getenv("BREEDS_FETCH_TIMEOUT", "10"))
+# The refresh lock lasts as long as the fetch can (OUTBOUND_HTTP retries and backoff
+# included) plus this many seconds to build and publish the index.
+BREEDS_LOCK_MARGIN = float(os.getenv("BREEDS_LOCK_MARGIN", "5"))
+BREEDS_REFRESH_RETRY_INTERVAL = float(os.getenv("BREEDS_REFRESH_RETRY_INTERVAL", "60"))
+BREEDS_SNAPSHOT_PATH = os.getenv("BREEDS_SNAPSHOT_PATH", str(BASE_DIR / "var" / "breeds.snapshot.json"))
+BREEDS_REMOTE_REFRESH = os.getenv("BREEDS_REMOTE_REFRESH", "1") == "1"
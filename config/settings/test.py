@@ -1,6 +1,8 @@
 from .base import *
 
 DEBUG = True
+# Long enough for HS256-signed JWTs in tests.
+SECRET_KEY = "test-secret-key-not-for-production-use-0123456789"
 
 DATABASES = {
     "default": {
@@ -20,3 +22,10 @@ CACHES = {
 }
 
 THECATAPI_API_KEY = ""
+BREEDS_SNAPSHOT_PATH = None
+METRICS_ENABLED = True
+
+# Mirror of default for the replica routing tests, which opt in with
+# override_settings(DATABASE_REPLICAS=["replica"]); everything else reads the primary.
+DATABASES["replica"] = {**DATABASES["default"], "TEST": {"MIRROR": "default"}}
+DATABASE_REPLICAS = []
@@ -1,10 +1,6 @@
 from django.contrib import admin
 from django.urls import path, include
-from drf_spectacular.views import (
-    SpectacularAPIView,
-    SpectacularSwaggerView,
-    SpectacularRedocView,
-)
+from django.views.decorators.csrf import csrf_exempt
 from rest_framework_simplejwt.views import (
     TokenObtainPairView,
     TokenRefreshView,
@@ -12,11 +8,31 @@ from rest_framework_simplejwt.views import (
 )
 from drf_spectacular.utils import extend_schema
 
+from apps.core.metrics import metrics_view
+from apps.core.schema import schema_view
+
 # Tag "auth" for JWT endpoints
 AuthTokenObtainPairView = extend_schema(tags=["auth"])(TokenObtainPairView)
 AuthTokenRefreshView = extend_schema(tags=["auth"])(TokenRefreshView)
 AuthTokenVerifyView = extend_schema(tags=["auth"])(TokenVerifyView)
 
+
+def docs_view(name: str, **initkwargs):
+    """drf_spectacular's view ``name``, imported on the first request to it."""
+    view = None
+
+    @csrf_exempt
+    def lazy_view(request, *args, **kwargs):
+        nonlocal view
+        if view is None:
+            from drf_spectacular import views
+
+            view = getattr(views, name).as_view(**initkwargs)
+        return view(request, *args, **kwargs)
+
+    return lazy_view
+
+
 urlpatterns = [
     path("admin/", admin.site.urls),
 
@@ -27,12 +43,15 @@ urlpatterns = [
     path("api/", include("apps.users.urls")),
 
     # API schema and documentation
-    path("api/schema/", SpectacularAPIView.as_view(), name="schema"),
-    path("api/docs/", SpectacularSwaggerView.as_view(url_name="schema"), name="swagger-ui"),
-    path("api/redoc/", SpectacularRedocView.as_view(url_name="schema"), name="redoc"),
+    path("api/schema/", schema_view, name="schema"),
+    path("api/docs/", docs_view("SpectacularSwaggerView", url_name="schema"), name="swagger-ui"),
+    path("api/redoc/", docs_view("SpectacularRedocView", url_name="schema"), name="redoc"),
 
     # JWT Auth
     path("api/auth/jwt/create/", AuthTokenObtainPairView.as_view(), name="jwt-create"),
     path("api/auth/jwt/refresh/", AuthTokenRefreshView.as_view(), name="jwt-refresh"),
     path("api/auth/jwt/verify/", AuthTokenVerifyView.as_view(), name="jwt-verify"),
+
+    # Prometheus metrics
+    path("metrics", metrics_view, name="metrics"),
 ]
@@ -1,4 +1,9 @@
 import pytest
+from django.core.cache import cache
+from apps.core import services
+
+pytest_plugins = ["apps.core.pytest_plugin"]
+
 
 @pytest.fixture(autouse=True)
 def catapi_ok(monkeypatch):
@@ -6,4 +11,6 @@ def catapi_ok(monkeypatch):
         status_code = 200
         def json(self):
             return [{"id":"siam","name":"Siamese"},{"id":"norw","name":"Norwegian Forest Cat"}]
-    monkeypatch.setattr("apps.core.services.requests.get", lambda *a, **k: Resp())
+    cache.clear()
+    services.reset_breed_index()
+    monkeypatch.setattr("apps.core.http_client.HTTPClient.get", lambda *a, **k: Resp())
@@ -0,0 +1,79 @@
+import threading
+import time
+import pytest
+from django.db import OperationalError, connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework import serializers
+from rest_framework.test import APIClient
+from apps.core.models import Mission, Target
+from apps.core.targets import add_target
+
+
+def _url(mission_id):
+    return reverse("mission-targets-create", args=[mission_id])
+
+
+@pytest.mark.django_db
+def test_add_target_endpoint_rules():
+    c = APIClient()
+    m = Mission.objects.create()
+    r = c.post(_url(m.pk), {"name": "A", "country": "DE", "notes": "n"}, format="json")
+    assert r.status_code == 201
+    assert r.json() == {"id": Target.objects.get().pk, "name": "A", "country": "DE", "notes": "n", "is_complete": False}
+
+    r = c.post(_url(m.pk), {"name": "A", "country": "DE"}, format="json")
+    assert r.status_code == 400 and "name" in r.json()
+
+    for name in ("B", "C"):
+        assert c.post(_url(m.pk), {"name": name, "country": "DE"}, format="json").status_code == 201
+    r = c.post(_url(m.pk), {"name": "D", "country": "DE"}, format="json")
+    assert r.status_code == 400 and "detail" in r.json()
+    assert m.targets.count() == 3
+
+
+@pytest.mark.django_db
+def test_add_target_unknown_mission_is_404():
+    r = APIClient().post(_url(999999), {"name": "A", "country": "DE"}, format="json")
+    assert r.status_code == 404
+
+
+@pytest.mark.django_db
+def test_add_target_two_round_trips():
+    m = Mission.objects.create()
+    with CaptureQueriesContext(connection) as ctx:
+        add_target(m.pk, "A", "DE")
+    statements = [q["sql"] for q in ctx.captured_queries if not q["sql"].upper().startswith(("SAVEPOINT", "RELEASE"))]
+    assert len(statements) == 2
+
+
+@pytest.mark.django_db(transaction=True)
+def test_concurrent_adds_respect_limit():
+    m = Mission.objects.create()
+    barrier = threading.Barrier(8)
+    outcomes = []
+
+    def worker(i):
+        barrier.wait()
+        try:
+            for _ in range(200):
+                try:
+                    add_target(m.pk, f"T{i}", "DE")
+                    outcomes.append("ok")
+                    return
+                except serializers.ValidationError:
+                    outcomes.append("rejected")
+                    return
+                except OperationalError:
+                    # SQLite's shared-cache test database reports lock contention instead of waiting.
+                    time.sleep(0.005)
+        finally:
+            connection.close()
+
+    threads = [threading.Thread(target=worker, args=(i,)) for i in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert outcomes.count("ok") == 3 and outcomes.count("rejected") == 5
+    assert Target.objects.filter(mission=m).count() == 3
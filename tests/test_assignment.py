@@ -0,0 +1,117 @@
+import threading
+import time
+import pytest
+from django.db import OperationalError, connection
+from django.urls import reverse
+from rest_framework.test import APIClient
+from apps.core.assignment import AssignmentError, assign_cat
+from apps.core.models import Cat, Mission
+
+
+def _cat(name="A"):
+    return Cat.objects.create(name=name, years_of_experience=1, breed="Siamese", salary=100)
+
+
+@pytest.mark.django_db
+def test_assign_rules():
+    cat = _cat()
+    m1, m2 = Mission.objects.create(), Mission.objects.create()
+    done = Mission.objects.create(is_complete=True)
+    assign_cat(m1.pk, cat.pk)
+    assign_cat(m1.pk, cat.pk)
+    with pytest.raises(AssignmentError, match="already has an active mission"):
+        assign_cat(m2.pk, cat.pk)
+    with pytest.raises(AssignmentError, match="completed mission"):
+        assign_cat(done.pk, cat.pk)
+    with pytest.raises(AssignmentError) as exc:
+        assign_cat(m2.pk, 999999)
+    assert exc.value.status_code == 404
+    with pytest.raises(AssignmentError) as exc:
+        assign_cat(999999, cat.pk)
+    assert exc.value.status_code == 404
+    assert Mission.objects.get(pk=m1.pk).assigned_cat_id == cat.pk
+    assert Mission.objects.get(pk=m2.pk).assigned_cat_id is None
+
+
+@pytest.mark.django_db
+def test_assign_endpoint_conflict_and_completed_cat_is_free_again():
+    c = APIClient()
+    cat = _cat()
+    m1, m2 = Mission.objects.create(), Mission.objects.create()
+    assert c.post(reverse("missions-assign", args=[m1.pk]), {"cat_id": cat.pk}, format="json").status_code == 200
+    r = c.post(reverse("missions-assign", args=[m2.pk]), {"cat_id": cat.pk}, format="json")
+    assert r.status_code == 400 and r.json()["detail"] == "Cat already has an active mission"
+    Mission.objects.filter(pk=m1.pk).update(is_complete=True)
+    r = c.post(reverse("missions-assign", args=[m2.pk]), {"cat_id": cat.pk}, format="json")
+    assert r.status_code == 200 and r.json()["assigned_cat"] == cat.pk
+
+
+@pytest.mark.django_db
+def test_patch_assigned_cat_conflict_is_400():
+    c = APIClient()
+    cat = _cat()
+    m1, m2 = Mission.objects.create(assigned_cat=cat), Mission.objects.create()
+    r = c.patch(reverse("missions-detail", args=[m2.pk]), {"assigned_cat": cat.pk}, format="json")
+    assert r.status_code == 400
+    assert list(Mission.objects.filter(assigned_cat=cat).values_list("pk", flat=True)) == [m1.pk]
+
+
+@pytest.mark.django_db(transaction=True)
+def test_concurrent_assignments_never_double_assign():
+    cats = [_cat(f"C{i}") for i in range(3)]
+    missions = [Mission.objects.create() for _ in range(12)]
+    barrier = threading.Barrier(len(missions))
+    outcomes = []
+
+    def worker(mission, cat):
+        barrier.wait()
+        try:
+            for _ in range(200):
+                try:
+                    assign_cat(mission.pk, cat.pk)
+                    outcomes.append("ok")
+                    return
+                except AssignmentError:
+                    outcomes.append("conflict")
+                    return
+                except OperationalError:
+                    # SQLite's shared-cache test database reports lock contention instead of waiting.
+                    time.sleep(0.005)
+        finally:
+            connection.close()
+
+    threads = [
+        threading.Thread(target=worker, args=(m, cats[i % len(cats)])) for i, m in enumerate(missions)
+    ]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert len(outcomes) == len(missions)
+    assert outcomes.count("ok") == len(cats)
+    for cat in cats:
+        assert Mission.objects.filter(assigned_cat=cat, is_complete=False).count() == 1
+
+
+@pytest.mark.django_db(transaction=True)
+def test_constraint_migration_keeps_newest_active_mission():
+    from django.db.migrations.executor import MigrationExecutor
+
+    executor = MigrationExecutor(connection)
+    latest = executor.loader.graph.leaf_nodes("core")
+    executor.migrate([("core", "0001_initial")])
+    apps = executor.loader.project_state([("core", "0001_initial")]).apps
+    OldCat, OldMission = apps.get_model("core", "Cat"), apps.get_model("core", "Mission")
+    a, b = (OldCat.objects.create(name=n, years_of_experience=1, breed="Siamese", salary=100) for n in "AB")
+    newest, older, done = (OldMission.objects.create(assigned_cat=a) for _ in range(3))
+    OldMission.objects.filter(pk=older.pk).update(created_at=newest.created_at.replace(year=2000))
+    OldMission.objects.filter(pk=done.pk).update(is_complete=True)
+    # Same created_at: the higher id wins.
+    first, second = (OldMission.objects.create(assigned_cat=b) for _ in range(2))
+    OldMission.objects.filter(assigned_cat=b).update(created_at=first.created_at)
+
+    MigrationExecutor(connection).migrate(latest)
+    assert dict(Mission.objects.values_list("pk", "assigned_cat")) == {
+        newest.pk: a.pk, older.pk: None, done.pk: a.pk, first.pk: None, second.pk: b.pk,
+    }
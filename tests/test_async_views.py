@@ -0,0 +1,107 @@
+import pytest
+from asgiref.sync import async_to_sync
+from django.test import AsyncClient
+from django.urls import reverse
+from rest_framework.test import APIClient
+
+from apps.core.async_views import _target_for_update
+from apps.core.models import Cat, Mission, Target
+
+pytestmark = pytest.mark.django_db
+
+
+def aget(url, headers=None):
+    return async_to_sync(AsyncClient().get)(url, headers=headers)
+
+
+def seed():
+    cats = [Cat.objects.create(name=f"C{i}", years_of_experience=i, breed="Siamese", salary=i) for i in range(5)]
+    missions = []
+    for i in range(4):
+        m = Mission.objects.create(target_count=2)
+        Target.objects.create(mission=m, name=f"A{i}", country="DE")
+        Target.objects.create(mission=m, name=f"B{i}", country="FR", is_complete=i % 2 == 0)
+        missions.append(m)
+    return cats, missions
+
+
+@pytest.mark.parametrize("resource", ["cats", "missions", "targets"])
+def test_async_pages_match_sync_pages(resource):
+    seed()
+    sync_page = APIClient().get(reverse(f"{resource}-list") + "?page_size=2").json()
+    async_page = aget(reverse(f"async-{resource}-list") + "?page_size=2").json()
+    assert async_page["results"] == sync_page["results"]
+    assert async_page["previous"] is None and async_page["next"]
+
+    second = aget(async_page["next"]).json()
+    sync_second = APIClient().get(sync_page["next"]).json()
+    assert second["results"] == sync_second["results"]
+    back = aget(second["previous"]).json()
+    assert back["results"] == async_page["results"]
+
+
+@pytest.mark.parametrize("resource", ["cats", "missions", "targets"])
+def test_async_detail_matches_sync(resource):
+    seed()
+    pk = {"cats": Cat, "missions": Mission, "targets": Target}[resource].objects.first().pk
+    assert aget(reverse(f"async-{resource}-detail", args=[pk])).json() == (
+        APIClient().get(reverse(f"{resource}-detail", args=[pk])).json()
+    )
+    missing = aget(reverse(f"async-{resource}-detail", args=[10 ** 6]))
+    assert missing.status_code == 404
+    assert missing.json() == APIClient().get(reverse(f"{resource}-detail", args=[10 ** 6])).json()
+
+
+def test_async_conditional_get():
+    seed()
+    url = reverse("async-missions-list")
+    etag = aget(url)["ETag"]
+    assert aget(url, {"If-None-Match": etag}).status_code == 304
+    Target.objects.update(notes="changed")
+    assert aget(url, {"If-None-Match": etag}).status_code == 200
+
+
+def test_invalid_cursor_is_404():
+    r = aget(reverse("async-cats-list") + "?cursor=abc")
+    assert r.status_code == 404 and r.json() == APIClient().get(reverse("cats-list") + "?cursor=abc").json()
+
+
+def test_async_assign():
+    cats, missions = seed()
+    post = async_to_sync(AsyncClient().post)
+    url = reverse("async-missions-assign", args=[missions[0].pk])
+    r = post(url, {"cat_id": cats[0].pk}, content_type="application/json")
+    assert r.status_code == 200 and r.json()["assigned_cat"] == cats[0].pk
+    r = post(reverse("async-missions-assign", args=[missions[1].pk]), {"cat_id": cats[0].pk}, content_type="application/json")
+    assert r.status_code == 400 and r.json() == {"detail": "Cat already has an active mission"}
+    assert post(url, {}, content_type="application/json").status_code == 400
+
+
+def test_async_target_patch_completes_mission():
+    m = Mission.objects.create(target_count=1)
+    t = Target.objects.create(mission=m, name="A", country="DE")
+    patch = async_to_sync(AsyncClient().patch)
+    url = reverse("async-target-update", args=[m.pk, t.pk])
+    r = patch(url, {"is_complete": True, "notes": "done"}, content_type="application/json")
+    assert r.status_code == 200 and r.json() == {"notes": "done", "is_complete": True}
+    m.refresh_from_db()
+    assert m.is_complete and m.completed_target_count == 1
+    r = patch(url, {"notes": "again"}, content_type="application/json")
+    assert r.status_code == 400
+    assert patch(reverse("async-target-update", args=[m.pk, 999]), {}, content_type="application/json").status_code == 404
+
+
+def test_async_target_patch_locks_the_row_like_the_sync_view():
+    query = _target_for_update(1, 2).query
+    assert query.select_for_update and query.select_for_update_of == ("self",)
+
+
+def test_async_views_count_queries_run_in_orm_threads(settings):
+    settings.QUERY_BUDGET_HEADERS = True
+    settings.RESPONSE_CACHE_ENABLED = False
+    seed()
+    for name in ("async-cats-list", "async-missions-list"):
+        response = aget(reverse(name))
+        assert response.status_code == 200
+        assert int(response["X-Query-Count"]) > 0
+        assert float(response["X-DB-Time-ms"]) > 0
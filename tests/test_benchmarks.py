@@ -0,0 +1,48 @@
+import pytest
+from django.db.models import Count, Q
+
+from apps.core.models import Cat, Mission, Target
+from apps.core.targets import recount_targets
+from benchmarks.dataset import generate
+from benchmarks.results import diff
+
+pytestmark = pytest.mark.django_db
+
+
+def _snapshot():
+    return (
+        list(Cat.objects.order_by("id").values_list("name", "breed", "salary")),
+        list(Mission.objects.order_by("id").values_list("assigned_cat__name", "is_complete", "target_count")),
+        list(Target.objects.order_by("id").values_list("name", "country", "notes")),
+    )
+
+
+def test_dataset_is_reproducible_and_consistent():
+    counts = generate(20, 60, seed=7)
+    assert counts["cats"] == 20 and counts["missions"] == 60
+    assert Target.objects.count() == counts["targets"]
+    per_mission = Mission.objects.annotate(n=Count("targets")).values_list("n", flat=True)
+    assert set(per_mission) <= {1, 2, 3}
+    active = Mission.objects.filter(is_complete=False, assigned_cat__isnull=False)
+    assert active.values("assigned_cat").distinct().count() == active.count()
+
+    before = list(Mission.objects.values_list("target_count", "completed_target_count", "is_complete"))
+    for mission in Mission.objects.all():
+        recount_targets(mission.pk)
+    assert list(Mission.objects.values_list("target_count", "completed_target_count", "is_complete")) == before
+    assert not Target.objects.filter(Q(mission__is_complete=True) & Q(is_complete=False)).exists()
+
+    first = _snapshot()
+    Mission.objects.all().delete()
+    Cat.objects.all().delete()
+    generate(20, 60, seed=7)
+    assert _snapshot() == first
+
+
+def test_results_diff_scores_throughput_and_latency():
+    before = {"results": {"list": {"rps": 100.0, "p99_ms": 50.0, "requests": 10}}}
+    after = {"results": {"list": {"rps": 80.0, "p99_ms": 25.0, "requests": 99}}}
+    assert sorted(diff(before, after)) == [
+        ("list.p99_ms", 50.0, 25.0, 0.5),
+        ("list.rps", 100.0, 80.0, -0.2),
+    ]
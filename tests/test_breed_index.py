@@ -0,0 +1,114 @@
+import threading
+import time
+import pytest
+from django.core.cache import cache
+from apps.core import services
+
+
+def test_index_is_built_once_and_reused(monkeypatch):
+    calls = []
+
+    class Resp:
+        status_code = 200
+        def json(self): return [{"id": "siam", "name": " Siamese "}]
+
+    def fake_get(*a, **k):
+        calls.append(1)
+        return Resp()
+
+    monkeypatch.setattr("apps.core.http_client.HTTPClient.get", fake_get)
+    assert services.is_valid_breed("siamese")
+    assert services.is_valid_breed("SIAM")
+    assert not services.is_valid_breed("Bengal")
+    assert len(calls) == 1
+    assert isinstance(services.get_breed_index().keys, frozenset)
+
+
+def test_other_worker_picks_up_published_version(settings):
+    settings.BREEDS_INDEX_CHECK_INTERVAL = 0
+    first = services.get_breed_index()
+    assert "siamese" in first
+
+    services.publish_breed_keys(frozenset({"bengal"}))
+    services.reset_breed_index()
+    assert services.is_valid_breed("Bengal")
+    assert not services.is_valid_breed("Siamese")
+
+
+def test_stale_local_index_invalidated_by_version_bump(settings):
+    settings.BREEDS_INDEX_CHECK_INTERVAL = 0
+    local = services.get_breed_index()
+    version = cache.incr(services.BREEDS_SEQUENCE_KEY)
+    cache.set(f"{services.BREEDS_CACHE_KEY}:{version}", (frozenset({"bengal"}), time.time()), timeout=None)
+    cache.set(services.BREEDS_VERSION_KEY, version, timeout=None)
+
+    assert services.get_breed_index().version == version != local.version
+    assert services.is_valid_breed("bengal")
+
+
+@pytest.mark.parametrize("value", ["", "   ", None])
+def test_blank_breed_is_invalid(value):
+    assert services.is_valid_breed(value) is False
+
+
+def test_concurrent_cold_start_fetches_once(monkeypatch):
+    calls = []
+
+    class Resp:
+        status_code = 200
+        def json(self): return [{"id": "siam", "name": "Siamese"}]
+
+    def slow_get(*a, **k):
+        calls.append(1)
+        time.sleep(0.2)
+        return Resp()
+
+    monkeypatch.setattr("apps.core.http_client.HTTPClient.get", slow_get)
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(services.is_valid_breed("siam"))) for _ in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert results == [True] * 8
+    assert len(calls) == 1
+
+
+def test_stale_index_served_when_refresh_fails(monkeypatch):
+    services.publish_breed_keys(frozenset({"siamese"}), fetched_at=0)
+
+    class Resp:
+        status_code = 503
+        def json(self): return {}
+
+    monkeypatch.setattr("apps.core.http_client.HTTPClient.get", lambda *a, **k: Resp())
+    monkeypatch.setattr("apps.core.services.schedule_breed_refresh", lambda: services._background_refresh())
+    assert services.is_valid_breed("Siamese")
+    assert services.get_breed_index().fetched_at == 0
+
+
+def test_stale_index_refreshed_in_background():
+    services.publish_breed_keys(frozenset({"bengal"}), fetched_at=0)
+    assert services.is_valid_breed("bengal")
+    for _ in range(100):
+        if services.get_breed_index().fetched_at:
+            break
+        time.sleep(0.01)
+    assert services.is_valid_breed("siamese")
+    assert not services.is_valid_breed("bengal")
+
+
+def test_cold_start_upstream_error_raises(monkeypatch):
+    class Resp:
+        status_code = 500
+        def json(self): return {}
+
+    monkeypatch.setattr("apps.core.http_client.HTTPClient.get", lambda *a, **k: Resp())
+    with pytest.raises(services.BreedsUnavailable):
+        services.is_valid_breed("Siamese")
+    assert cache.get(services.BREEDS_LOCK_KEY) is None
+
+
+def test_refresh_lock_outlasts_a_fetch_with_retries(settings):
+    retries = settings.OUTBOUND_HTTP["MAX_RETRIES"]
+    assert services._lock_timeout() > settings.BREEDS_FETCH_TIMEOUT * (retries + 1) + settings.BREEDS_LOCK_MARGIN
@@ -0,0 +1,57 @@
+import json
+import sqlite3
+
+import pytest
+from django.core.management import call_command
+from apps.core import services
+
+
+def test_export_command_writes_compact_snapshot(tmp_path):
+    path = tmp_path / "breeds.json"
+    call_command("export_breeds", output=str(path))
+    payload = json.loads(path.read_text())
+    assert payload["format"] == 1
+    assert payload["breeds"] == [["norw", "Norwegian Forest Cat"], ["siam", "Siamese"]]
+    assert ": " not in path.read_text()
+
+
+def test_snapshot_preload_serves_without_network(tmp_path, settings, monkeypatch):
+    path = tmp_path / "breeds.json"
+    services.write_breed_snapshot(path, [{"id": "beng", "name": "Bengal"}])
+    settings.BREEDS_SNAPSHOT_PATH = str(path)
+    settings.BREEDS_REMOTE_REFRESH = False
+
+    def offline(*a, **k):
+        raise AssertionError("network must not be used")
+
+    monkeypatch.setattr("apps.core.http_client.HTTPClient.get", offline)
+    services.preload_breed_snapshot()
+    assert services.is_valid_breed("bengal")
+    assert services.is_valid_breed("BENG")
+    assert not services.is_valid_breed("siamese")
+
+
+def test_snapshot_preload_survives_a_locked_cache(tmp_path, settings, monkeypatch, caplog):
+    path = tmp_path / "breeds.json"
+    services.write_breed_snapshot(path, [{"id": "beng", "name": "Bengal"}])
+    settings.BREEDS_SNAPSHOT_PATH = str(path)
+
+    def locked(*a, **k):
+        raise sqlite3.OperationalError("database is locked")
+
+    with monkeypatch.context() as patched:
+        patched.setattr(services.cache, "get", locked)
+        assert services.preload_breed_snapshot() is None
+    assert "Could not publish breed snapshot" in caplog.text
+    assert services.is_valid_breed("siamese")
+
+
+def test_missing_snapshot_is_ignored(tmp_path, settings):
+    settings.BREEDS_SNAPSHOT_PATH = str(tmp_path / "missing.json")
+    assert services.preload_breed_snapshot() is None
+
+
+def test_cold_start_without_snapshot_and_refresh_disabled(settings):
+    settings.BREEDS_REMOTE_REFRESH = False
+    with pytest.raises(services.BreedsUnavailable):
+        services.is_valid_breed("siamese")
@@ -0,0 +1,107 @@
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework.test import APIClient
+from apps.core.assignment import AssignmentConflict, apply_plan, plan_auto
+from apps.core.models import Cat, Mission
+
+pytestmark = pytest.mark.django_db
+
+
+def _cats(n):
+    return Cat.objects.bulk_create(
+        [Cat(name=f"C{i}", years_of_experience=1, breed="Siamese", salary=1) for i in range(n)]
+    )
+
+
+def _post(body):
+    return APIClient().post(reverse("missions-assign-bulk"), body, format="json")
+
+
+def test_pairs_assign_and_reject_conflicts():
+    a, b, c = _cats(3)
+    m1, m2, m3, m4 = Mission.objects.bulk_create([Mission() for _ in range(4)])
+    done = Mission.objects.create(is_complete=True)
+    Mission.objects.filter(pk=m4.pk).update(assigned_cat=c)
+    r = _post(
+        {
+            "pairs": [
+                {"mission": m1.pk, "cat": a.pk},
+                {"mission": m2.pk, "cat": a.pk},
+                {"mission": m2.pk, "cat": b.pk},
+                {"mission": m3.pk, "cat": c.pk},
+                {"mission": done.pk, "cat": b.pk},
+                {"mission": m3.pk, "cat": 999999},
+                {"mission": "x"},
+            ]
+        }
+    )
+    assert r.status_code == 200
+    assert r.json()["assigned"] == [{"mission": m1.pk, "cat": a.pk}, {"mission": m2.pk, "cat": b.pk}]
+    assert [rej["index"] for rej in r.json()["rejected"]] == [1, 3, 4, 5, 6]
+    assert dict(Mission.objects.filter(is_complete=False).values_list("id", "assigned_cat_id")) == {
+        m1.pk: a.pk, m2.pk: b.pk, m3.pk: None, m4.pk: c.pk,
+    }
+
+
+def test_pairs_can_swap_cats_between_missions():
+    a, b = _cats(2)
+    m1 = Mission.objects.create(assigned_cat=a)
+    m2 = Mission.objects.create(assigned_cat=b)
+    r = _post({"pairs": [{"mission": m1.pk, "cat": b.pk}, {"mission": m2.pk, "cat": a.pk}]})
+    assert r.status_code == 200 and r.json()["rejected"] == []
+    assert Mission.objects.get(pk=m1.pk).assigned_cat_id == b.pk
+    assert Mission.objects.get(pk=m2.pk).assigned_cat_id == a.pk
+
+
+def test_auto_assigns_idle_cats_to_unassigned_missions(django_assert_max_num_queries, settings):
+    settings.BULK_BATCH_SIZE = 50
+    cats = _cats(120)
+    busy = Mission.objects.create(assigned_cat=cats[0])
+    Mission.objects.bulk_create([Mission() for _ in range(150)])
+    with django_assert_max_num_queries(12):
+        r = _post({"auto": True})
+    assert r.status_code == 200 and len(r.json()["assigned"]) == 119
+    counts = {}
+    for cat_id in Mission.objects.filter(is_complete=False).exclude(assigned_cat=None).values_list("assigned_cat_id", flat=True):
+        counts[cat_id] = counts.get(cat_id, 0) + 1
+    assert len(counts) == 120 and set(counts.values()) == {1}
+    assert Mission.objects.get(pk=busy.pk).assigned_cat_id == cats[0].pk
+
+
+def test_auto_plan_does_not_inline_busy_cat_ids():
+    cats = _cats(300)
+    Mission.objects.bulk_create([Mission(assigned_cat=c) for c in cats[:-1]] + [Mission()])
+    with CaptureQueriesContext(connection) as queries:
+        plan = plan_auto()
+    assert list(plan.values()) == [cats[-1].pk]
+    assert all(len(q["sql"]) < 1000 for q in queries.captured_queries)
+
+
+def test_auto_limit():
+    _cats(5)
+    Mission.objects.bulk_create([Mission() for _ in range(5)])
+    r = _post({"auto": True, "limit": 2})
+    assert len(r.json()["assigned"]) == 2
+
+
+def test_stale_plan_is_a_conflict():
+    (a,) = _cats(1)
+    m1, m2 = Mission.objects.create(), Mission.objects.create()
+    Mission.objects.filter(pk=m2.pk).update(assigned_cat=a)
+    with pytest.raises(AssignmentConflict):
+        apply_plan({m1.pk: a.pk})
+    assert Mission.objects.get(pk=m1.pk).assigned_cat_id is None
+
+
+@pytest.mark.parametrize("body", [{}, {"pairs": []}, {"auto": True, "limit": 0}])
+def test_malformed_body(body):
+    assert _post(body).status_code == 400
+
+
+def test_malformed_body_errors_follow_the_declared_serializer(settings):
+    settings.BULK_MAX_ITEMS = 1
+    assert set(_post({"auto": True, "limit": 0}).json()) == {"limit"}
+    assert set(_post({"pairs": [{"mission": 1, "cat": 1}] * 2}).json()) == {"pairs"}
+    assert set(_post({"auto": False}).json()) == {"non_field_errors"}
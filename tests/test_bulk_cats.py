@@ -0,0 +1,71 @@
+import io
+import pytest
+from django.core.management import call_command
+from django.urls import reverse
+from rest_framework.test import APIClient
+from apps.core.models import Cat
+
+pytestmark = pytest.mark.django_db
+
+
+def test_bulk_api_creates_valid_and_reports_rejects():
+    payload = {
+        "cats": [
+            {"name": "A", "years_of_experience": 1, "breed": "Siamese", "salary": 100},
+            {"name": "B", "years_of_experience": 2, "breed": "Dragon", "salary": 100},
+            {"name": "", "years_of_experience": -1, "breed": "siam", "salary": "x"},
+            {"name": "D", "years_of_experience": "3", "breed": " NORW ", "salary": 300},
+        ]
+    }
+    r = APIClient().post(reverse("cats-bulk"), payload, format="json")
+    assert r.status_code == 207
+    body = r.json()
+    assert body["created"] == 2
+    assert [rej["row"] for rej in body["rejected"]] == [2, 3]
+    assert "breed" in body["rejected"][0]["errors"]
+    assert set(body["rejected"][1]["errors"]) == {"name", "years_of_experience", "salary"}
+    assert sorted(Cat.objects.values_list("name", flat=True)) == ["A", "D"]
+
+
+def test_bulk_api_constant_queries(django_assert_max_num_queries):
+    cats = [{"name": f"C{i}", "years_of_experience": 1, "breed": "siam", "salary": 1} for i in range(300)]
+    with django_assert_max_num_queries(5):
+        r = APIClient().post(reverse("cats-bulk"), {"cats": cats}, format="json")
+    assert r.status_code == 201 and Cat.objects.count() == 300
+
+
+def test_bulk_api_breeds_unavailable(monkeypatch):
+    class Resp:
+        status_code = 503
+        def json(self): return {}
+
+    monkeypatch.setattr("apps.core.http_client.HTTPClient.get", lambda *a, **k: Resp())
+    cats = [{"name": "A", "years_of_experience": 1, "breed": "siam", "salary": 1}]
+    r = APIClient().post(reverse("cats-bulk"), {"cats": cats}, format="json")
+    assert r.status_code == 503 and Cat.objects.count() == 0
+
+
+def test_import_command_csv(tmp_path):
+    path = tmp_path / "cats.csv"
+    path.write_text(
+        "name,years_of_experience,breed,salary\n"
+        "A,1,Siamese,100\n"
+        "B,2,Unknown,100\n"
+        "C,3,norw,300\n"
+    )
+    out, err = io.StringIO(), io.StringIO()
+    call_command("import_cats", str(path), batch_size=1, stdout=out, stderr=err)
+    assert "Imported 2 cats, rejected 1" in out.getvalue()
+    assert err.getvalue().startswith("row 2:")
+    assert Cat.objects.count() == 2
+
+
+def test_import_command_ndjson(tmp_path):
+    path = tmp_path / "cats.ndjson"
+    path.write_text(
+        '{"name": "A", "years_of_experience": 1, "breed": "siam", "salary": 1}\n'
+        "\n"
+        '{"name": "B", "years_of_experience": 1, "breed": "siam", "salary": 1}\n'
+    )
+    call_command("import_cats", str(path), stdout=io.StringIO())
+    assert Cat.objects.count() == 2
@@ -0,0 +1,58 @@
+import pytest
+from django.urls import reverse
+from rest_framework.test import APIClient
+from apps.core.models import Mission, Target
+
+pytestmark = pytest.mark.django_db
+
+
+def _payload(n):
+    return {
+        "missions": [
+            {"targets": [{"name": f"T{i}-{k}", "country": "DE"} for k in range(1 + i % 3)]}
+            for i in range(n)
+        ]
+    }
+
+
+def test_bulk_create_constant_queries(django_assert_max_num_queries):
+    c = APIClient()
+    with django_assert_max_num_queries(6):
+        r = c.post(reverse("missions-bulk"), _payload(50), format="json")
+    assert r.status_code == 201 and r.json()["created"] == 50
+    assert Mission.objects.count() == 50
+    assert Target.objects.count() == sum(1 + i % 3 for i in range(50))
+    ids = [item["id"] for item in r.json()["results"]]
+    assert list(Mission.objects.order_by("id").values_list("id", flat=True)) == ids
+
+
+def test_bulk_create_reports_errors_per_item():
+    payload = {
+        "missions": [
+            {"targets": [{"name": "A", "country": "DE"}]},
+            {"targets": []},
+            {"targets": [{"name": "A", "country": "DE"}, {"name": "A", "country": "UA"}]},
+            {"targets": [{"name": f"X{k}", "country": "DE"} for k in range(4)]},
+        ]
+    }
+    r = APIClient().post(reverse("missions-bulk"), payload, format="json")
+    assert r.status_code == 207
+    assert [item["status"] for item in r.json()["results"]] == [201, 400, 400, 400]
+    assert "targets" in r.json()["results"][2]["errors"]
+    assert Mission.objects.count() == 1 and Target.objects.count() == 1
+
+
+def test_bulk_create_all_invalid_is_400():
+    r = APIClient().post(reverse("missions-bulk"), {"missions": [{"targets": []}]}, format="json")
+    assert r.status_code == 400 and Mission.objects.count() == 0
+
+
+@pytest.mark.parametrize("body", [{}, {"missions": []}, {"missions": "x"}])
+def test_bulk_create_rejects_malformed_body(body):
+    assert APIClient().post(reverse("missions-bulk"), body, format="json").status_code == 400
+
+
+def test_bulk_create_respects_item_limit(settings):
+    settings.BULK_MAX_ITEMS = 2
+    r = APIClient().post(reverse("missions-bulk"), _payload(3), format="json")
+    assert r.status_code == 400 and Mission.objects.count() == 0
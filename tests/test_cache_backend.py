@@ -0,0 +1,134 @@
+import multiprocessing
+import sqlite3
+import time
+
+import pytest
+
+from apps.core.cache_backends import SQLiteCache
+
+
+def make(tmp_path, **options):
+    return SQLiteCache(str(tmp_path / "cache.sqlite3"), {"TIMEOUT": 60, "OPTIONS": options})
+
+
+def test_basic_operations(tmp_path):
+    cache = make(tmp_path)
+    cache.set("a", {"x": [1, 2]})
+    cache.set("n", 5)
+    assert cache.get("a") == {"x": [1, 2]} and cache.get("missing", "d") == "d"
+    assert cache.get_many(["a", "n", "missing"]) == {"a": {"x": [1, 2]}, "n": 5}
+    assert cache.add("a", 1) is False and cache.add("b", frozenset({"siam"})) is True
+    assert cache.get("b") == frozenset({"siam"})
+    assert cache.incr("n") == 6 and cache.decr("n", 2) == 4
+    with pytest.raises(ValueError):
+        cache.incr("missing")
+    assert cache.has_key("a") and cache.delete("a") and not cache.has_key("a")
+    cache.set("flag", True)
+    assert cache.get("flag") is True
+    cache.clear()
+    assert cache.get("b") is None
+
+
+def test_expiry(tmp_path):
+    cache = make(tmp_path)
+    cache.set("short", 1, timeout=0.05)
+    cache.set("forever", 1, timeout=None)
+    time.sleep(0.1)
+    assert cache.get("short") is None and cache.get("forever") == 1
+    assert cache.add("short", 2) is True and cache.get("short") == 2
+    cache.set("gone", 1, timeout=0.01)
+    assert cache.touch("forever", timeout=0.01)
+    time.sleep(0.05)
+    with pytest.raises(ValueError):
+        cache.incr("gone")
+    assert not cache.has_key("forever")
+
+
+def test_lru_eviction_by_entries(tmp_path):
+    cache = make(tmp_path, MAX_ENTRIES=3, CULL_FREQUENCY=0, LRU_RESOLUTION=0)
+    for key in "abc":
+        cache.set(key, key)
+        time.sleep(0.01)
+    cache.get("a")
+    cache.set("d", "d")
+    assert cache.get_many(["a", "b", "c", "d"]) == {"a": "a", "c": "c", "d": "d"}
+
+
+def test_eviction_by_size(tmp_path):
+    cache = make(tmp_path, MAX_ENTRIES=0, MAX_SIZE=3500, LRU_RESOLUTION=0)
+    for key in "abcd":
+        cache.set(key, "x" * 1000)
+        time.sleep(0.01)
+    assert not cache.has_key("a") and all(cache.has_key(k) for k in "bcd")
+
+
+def _bump(path, n):
+    cache = SQLiteCache(path, {"TIMEOUT": None})
+    for _ in range(n):
+        cache.add("version", 0)
+        cache.incr("version")
+
+
+def test_incr_is_atomic_across_processes(tmp_path):
+    path = str(tmp_path / "cache.sqlite3")
+    ctx = multiprocessing.get_context("fork")
+    procs = [ctx.Process(target=_bump, args=(path, 50)) for _ in range(4)]
+    for p in procs:
+        p.start()
+    for p in procs:
+        p.join(30)
+    assert [p.exitcode for p in procs] == [0, 0, 0, 0]
+    assert SQLiteCache(path, {}).get("version") == 200
+
+
+def test_visible_to_other_instances(tmp_path):
+    writer, reader = make(tmp_path), make(tmp_path)
+    writer.set("k", [1])
+    assert reader.get("k") == [1]
+
+
+def _stats(cache):
+    return cache._db.execute("SELECT entries, size FROM cache_stats").fetchone()
+
+
+def test_permanent_entries_are_never_evicted(tmp_path):
+    cache = make(tmp_path, MAX_ENTRIES=3, CULL_FREQUENCY=0, LRU_RESOLUTION=0)
+    cache.add("counter", 0, timeout=None)
+    cache.incr("counter")
+    for n in range(50):
+        cache.set(f"k{n}", n)
+    assert cache.get("counter") == 1
+    assert _stats(cache)[0] == 3
+    assert cache.get_many(["k47", "k48", "k49"]) == {"k47": 47, "k48": 48, "k49": 49}
+
+
+def test_running_totals_follow_every_write(tmp_path):
+    cache = make(tmp_path)
+    cache.set("a", "x" * 100)
+    cache.set("a", "x" * 10)
+    cache.set("b", 1)
+    cache.set("p", "y" * 50, timeout=None)
+    cache.touch("b", timeout=None)
+    cache.delete("a")
+    cache.add("c", 2)
+    expected = cache._db.execute(
+        "SELECT COUNT(*), TOTAL(size) FROM cache WHERE expires IS NOT NULL"
+    ).fetchone()
+    assert _stats(cache) == (expected[0], int(expected[1])) == (1, 8)
+    cache.clear()
+    assert _stats(cache) == (0, 0)
+
+
+def test_reads_do_not_wait_for_writers_to_refresh_lru(tmp_path):
+    cache = make(tmp_path, BUSY_TIMEOUT=5, LRU_RESOLUTION=0)
+    cache.set("k", 1)
+    writer = sqlite3.connect(cache.path, isolation_level=None)
+    writer.execute("BEGIN IMMEDIATE")
+    try:
+        started = time.monotonic()
+        assert cache.get("k") == 1
+        assert time.monotonic() - started < 1
+    finally:
+        writer.execute("ROLLBACK")
+        writer.close()
+    assert cache._db.execute("PRAGMA busy_timeout").fetchone() == (5000,)
@@ -27,7 +27,7 @@ def test_list_retrieve_delete_cat():
     created_obj = Cat.objects.latest("pk")
 
     r = c.get(reverse("cats-list"))
-    assert r.status_code == 200 and len(r.json()) >= 1
+    assert r.status_code == 200 and len(r.json()["results"]) >= 1
 
     r = c.get(reverse("cats-detail", args=[created_obj.pk]))
     assert r.status_code == 200
@@ -8,7 +8,7 @@ pytestmark = pytest.mark.django_db
 
 
 def _force_breeds_source(monkeypatch, fn):
-    monkeypatch.setattr("apps.core.services.requests.get", fn)
+    monkeypatch.setattr("apps.core.http_client.HTTPClient.get", fn)
 
 
 def _target_detail_url_or_skip(target_id: int) -> str:
@@ -72,7 +72,8 @@ def test_breed_api_non_200_causes_validation_error(monkeypatch):
         def json(self): return {}
 
     _force_breeds_source(monkeypatch, lambda *a, **k: Resp())
-    services.is_valid_breed("Siamese")
+    with pytest.raises(services.BreedsUnavailable):
+        services.is_valid_breed("Siamese")
 
     c = APIClient()
     r = c.post(
@@ -0,0 +1,49 @@
+import json
+import pytest
+from django.http import StreamingHttpResponse
+from rest_framework.test import APIClient
+from apps.core.models import Cat, Mission, Target
+
+pytestmark = pytest.mark.django_db
+
+
+@pytest.fixture
+def dataset(settings):
+    settings.EXPORT_CHUNK_SIZE = 2
+    cat = Cat.objects.create(name="A", years_of_experience=1, breed="Siamese", salary=100)
+    missions = Mission.objects.bulk_create([Mission(assigned_cat=cat if i == 0 else None) for i in range(5)])
+    Target.objects.bulk_create(
+        [Target(mission=m, name=f"T{n}", country="DE") for m in missions for n in range(1 + m.pk % 3)]
+    )
+
+
+def _body(resp):
+    assert isinstance(resp, StreamingHttpResponse)
+    return b"".join(resp.streaming_content)
+
+
+@pytest.mark.parametrize("resource", ["cats", "missions", "targets"])
+def test_json_export_matches_list_endpoint(dataset, resource):
+    c = APIClient()
+    listed = c.get(f"/api/{resource}/?page_size=100").json()["results"]
+    resp = c.get(f"/api/{resource}/export/")
+    assert resp.status_code == 200 and resp["Content-Type"] == "application/json"
+    assert json.loads(_body(resp)) == listed
+
+
+def test_ndjson_export_one_mission_per_line(dataset):
+    resp = APIClient().get("/api/missions/export/?output=ndjson")
+    lines = _body(resp).decode().splitlines()
+    assert resp["Content-Type"] == "application/x-ndjson"
+    assert len(lines) == 5
+    assert [len(json.loads(line)["targets"]) for line in lines] == [
+        m.targets.count() for m in Mission.objects.order_by("-id")
+    ]
+
+
+def test_empty_export_is_valid_json():
+    assert json.loads(_body(APIClient().get("/api/cats/export/"))) == []
+
+
+def test_unknown_output_rejected():
+    assert APIClient().get("/api/cats/export/?output=xml").status_code == 400
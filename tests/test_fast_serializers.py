@@ -0,0 +1,45 @@
+import pytest
+from rest_framework.renderers import JSONRenderer
+from apps.core.fast_serializers import CAT_FIELDS, MISSION_FIELDS, TARGET_FIELDS, cat_rows, mission_rows
+from apps.core.models import Cat, Mission, Target
+from apps.core.serializers import CatSerializer, MissionSerializer, TargetSerializer
+
+pytestmark = pytest.mark.django_db
+
+render = JSONRenderer().render
+
+
+@pytest.fixture
+def dataset():
+    cat = Cat.objects.create(name="Ünï", years_of_experience=3, breed="Siamese", salary=900)
+    Cat.objects.create(name="B", years_of_experience=0, breed="siam", salary=0)
+    m1 = Mission.objects.create(assigned_cat=cat)
+    Mission.objects.create(is_complete=True)
+    m3 = Mission.objects.create()
+    Target.objects.create(mission=m1, name="A", country="DE", notes="x\n\"y\"")
+    Target.objects.create(mission=m3, name="B", country="UA", is_complete=True)
+    Target.objects.create(mission=m1, name="C", country="PL")
+
+
+def test_cat_rows_match_serializer(dataset):
+    qs = Cat.objects.order_by("-id")
+    expected = render(CatSerializer(qs, many=True).data)
+    assert render(cat_rows(list(qs.values(*CAT_FIELDS)))) == expected
+
+
+def test_target_rows_match_serializer(dataset):
+    qs = Target.objects.order_by("-id")
+    assert render(list(qs.values(*TARGET_FIELDS))) == render(TargetSerializer(qs, many=True).data)
+
+
+def test_mission_rows_match_serializer(dataset):
+    qs = Mission.objects.prefetch_related("targets").order_by("-id")
+    expected = render(MissionSerializer(qs, many=True).data)
+    assert render(mission_rows(list(Mission.objects.order_by("-id").values(*MISSION_FIELDS)))) == expected
+
+
+def test_mission_list_uses_two_queries(dataset, django_assert_num_queries):
+    from rest_framework.test import APIClient
+    with django_assert_num_queries(2):
+        r = APIClient().get("/api/missions/")
+    assert [len(m["targets"]) for m in r.json()["results"]] == [1, 0, 2]
@@ -16,7 +16,7 @@ def test_assign_and_notes_rules(monkeypatch):
         status_code = 200
         def json(self): return [{"id": "siam", "name": "Siamese"}]
 
-    monkeypatch.setattr("apps.core.services.requests.get", lambda *a, **k: Resp())
+    monkeypatch.setattr("apps.core.http_client.HTTPClient.get", lambda *a, **k: Resp())
 
     client.post(
         reverse("cats-list"),
@@ -0,0 +1,137 @@
+import pytest
+from django.core.management import call_command
+from django.urls import reverse
+from rest_framework.test import APIClient
+
+from apps.core import http_cache
+from apps.core.models import Cat, Mission, Target
+
+pytestmark = pytest.mark.django_db
+
+
+def mk_cat(name="A"):
+    return Cat.objects.create(name=name, years_of_experience=1, breed="Siamese", salary=1)
+
+
+def get(c, url, etag=None):
+    headers = {"HTTP_IF_NONE_MATCH": etag} if etag else {}
+    return c.get(url, **headers)
+
+
+def test_unchanged_list_is_304_without_queries(django_assert_num_queries):
+    mk_cat()
+    c = APIClient()
+    first = get(c, reverse("cats-list"))
+    etag = first["ETag"]
+    assert first.status_code == 200 and etag.startswith('"')
+    with django_assert_num_queries(0):
+        second = get(c, reverse("cats-list"), etag)
+    assert second.status_code == 304 and second["ETag"] == etag
+    with django_assert_num_queries(0):
+        third = get(c, reverse("cats-list"))
+    assert third.status_code == 200 and third.json() == first.json()
+    assert get(c, reverse("cats-list"), f"W/{etag}").status_code == 304
+
+
+def test_etag_depends_on_url():
+    cat = mk_cat()
+    c = APIClient()
+    assert get(c, reverse("cats-list"))["ETag"] != get(c, reverse("cats-detail", args=[cat.pk]))["ETag"]
+    assert get(c, reverse("cats-list"))["ETag"] != get(c, reverse("cats-list") + "?page_size=1")["ETag"]
+
+
+def test_model_and_api_writes_invalidate():
+    cat = mk_cat()
+    c = APIClient()
+    url = reverse("cats-detail", args=[cat.pk])
+    etag = get(c, url)["ETag"]
+    c.patch(url, {"salary": 99}, format="json")
+    r = get(c, url, etag)
+    assert r.status_code == 200 and r.json()["salary"] == 99
+
+
+def test_queryset_update_and_bulk_writes_invalidate():
+    m = Mission.objects.create()
+    Target.objects.create(mission=m, name="T", country="DE")
+    c = APIClient()
+    url = reverse("missions-detail", args=[m.pk])
+    etag = get(c, url)["ETag"]
+
+    Target.objects.filter(mission=m).update(notes="changed")
+    r = get(c, url, etag)
+    assert r.status_code == 200 and r.json()["targets"][0]["notes"] == "changed"
+
+    etag = r["ETag"]
+    Target.objects.bulk_create([Target(mission=Mission.objects.create(), name="U", country="FR")])
+    assert get(c, url, etag).status_code == 200
+
+    list_etag = get(c, reverse("missions-list"))["ETag"]
+    c.post(reverse("missions-bulk"), {"missions": [{"targets": [{"name": "X", "country": "DE"}]}]}, format="json")
+    assert get(c, reverse("missions-list"), list_etag).status_code == 200
+
+
+def test_unrelated_writes_keep_etag():
+    m = Mission.objects.create()
+    c = APIClient()
+    etag = get(c, reverse("missions-detail", args=[m.pk]))["ETag"]
+    mk_cat()
+    assert get(c, reverse("missions-detail", args=[m.pk]), etag).status_code == 304
+
+
+def test_cascade_delete_invalidates_targets():
+    m = Mission.objects.create()
+    Target.objects.create(mission=m, name="T", country="DE")
+    c = APIClient()
+    etag = get(c, reverse("targets-list"))["ETag"]
+    m.delete()
+    r = get(c, reverse("targets-list"), etag)
+    assert r.status_code == 200 and r.json()["results"] == []
+
+
+def test_management_command_invalidates(tmp_path):
+    c = APIClient()
+    etag = get(c, reverse("cats-list"))["ETag"]
+    path = tmp_path / "cats.csv"
+    path.write_text("name,years_of_experience,breed,salary\nA,1,Siamese,100\n")
+    call_command("import_cats", str(path))
+    r = get(c, reverse("cats-list"), etag)
+    assert r.status_code == 200 and len(r.json()["results"]) == 1
+
+
+def test_errors_are_not_cached():
+    c = APIClient()
+    r = get(c, reverse("cats-detail", args=[404]))
+    assert r.status_code == 404 and "ETag" not in r
+    mk_cat()
+    cat_id = Cat.objects.get().pk
+    assert get(c, reverse("cats-detail", args=[cat_id])).status_code == 200
+
+
+def test_disabled(settings):
+    settings.RESPONSE_CACHE_ENABLED = False
+    assert "ETag" not in get(APIClient(), reverse("cats-list"))
+
+
+def test_version_moves_again_on_commit(django_capture_on_commit_callbacks):
+    [before] = http_cache.table_versions(["core_cat"])
+    with django_capture_on_commit_callbacks(execute=True) as callbacks:
+        mk_cat()
+    [after] = http_cache.table_versions(["core_cat"])
+    assert len(callbacks) == 1 and after == before + 2
+
+
+def test_tracker_installed_mid_request_keeps_wrapper_stack_balanced():
+    from django.db import connection
+
+    saved = list(connection.execute_wrappers)
+    connection.execute_wrappers[:] = [w for w in saved if not isinstance(w, http_cache.WriteTracker)]
+    try:
+        def outer(execute, *args):
+            return execute(*args)
+
+        with connection.execute_wrapper(outer):
+            http_cache.install_write_tracker(connection=connection)
+        assert outer not in connection.execute_wrappers
+        assert isinstance(connection.execute_wrappers[0], http_cache.WriteTracker)
+    finally:
+        connection.execute_wrappers[:] = saved
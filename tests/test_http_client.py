@@ -0,0 +1,119 @@
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+import requests
+
+from apps.core import metrics
+from apps.core.http_client import HostLimitExceeded, HTTPClient
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    flaky_failures = 0
+
+    def log_message(self, *args):
+        pass
+
+    def _send(self, status, payload):
+        body = json.dumps(payload).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        if self.path == "/flaky" and StubHandler.flaky_failures > 0:
+            StubHandler.flaky_failures -= 1
+            return self._send(503, {"detail": "busy"})
+        if self.path == "/broken":
+            return self._send(500, {"detail": "boom"})
+        self._send(200, [{"id": "siam", "name": "Siamese"}])
+
+
+@pytest.fixture
+def stub_url():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StubHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
+
+
+def test_connections_are_reused(stub_url):
+    client = HTTPClient()
+    for _ in range(5):
+        assert client.request("GET", f"{stub_url}/breeds").json()[0]["id"] == "siam"
+    pool = next(iter(client.stats()["pools"].values()))
+    assert pool["requests"] == 5
+    assert pool["connections_opened"] == 1
+    host = next(iter(client.stats()["hosts"].values()))
+    assert host["requests"] == 5 and host["in_flight"] == 0
+    client.close()
+
+
+def test_retryable_status_is_retried_with_backoff(stub_url):
+    StubHandler.flaky_failures = 2
+    client = HTTPClient(max_retries=2, backoff=0.001)
+    assert client.request("GET", f"{stub_url}/flaky").status_code == 200
+    host = next(iter(client.stats()["hosts"].values()))
+    assert host["retries"] == 2 and host["requests"] == 3
+    netloc = stub_url.split("//")[1]
+    latency = metrics.snapshot()
+    assert latency[("outbound_request_duration_seconds", (("host", netloc), ("status", "503")))][-1] == 2
+    assert latency[("outbound_request_duration_seconds", (("host", netloc), ("status", "200")))][-1] == 1
+
+
+def test_non_retryable_status_returned_as_is(stub_url):
+    client = HTTPClient(max_retries=3, backoff=0.001)
+    assert client.request("GET", f"{stub_url}/broken").status_code == 500
+    assert next(iter(client.stats()["hosts"].values()))["retries"] == 0
+
+
+def test_connection_errors_raise_after_retries():
+    client = HTTPClient(max_retries=1, backoff=0.001, timeout=1)
+    with pytest.raises(requests.exceptions.ConnectionError):
+        client.request("GET", "http://127.0.0.1:9/unreachable")
+    host = client.stats()["hosts"]["127.0.0.1:9"]
+    assert host["errors"] == 2 and host["retries"] == 1
+
+
+def test_host_slot_wait_uses_connect_timeout(stub_url):
+    client = HTTPClient(per_host_limit=1)
+    assert client.request("GET", f"{stub_url}/breeds", timeout=(1, 5)).status_code == 200
+    limit, _ = client._host_state(stub_url.split("//")[1])
+    limit.acquire()
+    try:
+        with pytest.raises(HostLimitExceeded):
+            client.request("GET", f"{stub_url}/breeds", timeout=(0.05, 5))
+    finally:
+        limit.release()
+    assert next(iter(client.stats()["hosts"].values()))["errors"] == 1
+    client.close()
+
+
+def test_host_stats_are_consistent_across_threads(stub_url):
+    client = HTTPClient(pool_maxsize=8, per_host_limit=8)
+
+    def fetch():
+        for _ in range(10):
+            client.request("GET", f"{stub_url}/breeds")
+
+    threads = [threading.Thread(target=fetch) for _ in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    host = next(iter(client.stats()["hosts"].values()))
+    assert host["requests"] == 80 and host["in_flight"] == 0 and host["errors"] == 0
+    client.close()
+
+
+def test_max_duration_covers_every_attempt_and_backoff():
+    client = HTTPClient(max_retries=2, backoff=0.2, backoff_max=0.3)
+    assert client.max_duration(10) == pytest.approx(10 + 3 * 10 + 0.2 + 0.3)
+    assert client.max_duration((1, 5)) == pytest.approx(1 + 3 * 6 + 0.2 + 0.3)
+    assert client.max_duration(None) == float("inf")
@@ -0,0 +1,55 @@
+import pytest
+from django.db import connection
+from apps.core.models import Cat, Mission, Target
+
+pytestmark = pytest.mark.django_db
+
+
+@pytest.fixture(autouse=True)
+def prefer_indexes():
+    if connection.vendor == "postgresql":
+        with connection.cursor() as cursor:
+            cursor.execute("SET enable_seqscan = off")
+
+
+def assert_uses_index(queryset, *index_names):
+    plan = queryset.explain()
+    assert any(name in plan for name in index_names), plan
+
+
+def test_active_mission_of_cat_uses_partial_unique_index():
+    qs = Mission.objects.filter(assigned_cat_id=1, is_complete=False)
+    assert_uses_index(qs, "uniq_active_mission_per_cat")
+
+
+def test_active_missions_snapshot_uses_partial_index():
+    qs = Mission.objects.filter(is_complete=False).order_by("-id").values_list("id", "assigned_cat_id")
+    assert_uses_index(qs, "mission_active_id_idx")
+
+
+def test_completed_missions_filter_uses_partial_index():
+    assert_uses_index(Mission.objects.filter(is_complete=True).order_by("-id"), "mission_done_id_idx")
+
+
+def test_target_name_in_mission_uses_unique_index():
+    qs = Target.objects.filter(mission_id=1, name="A")
+    # SQLite names the constraint created with the table after the table itself.
+    assert_uses_index(qs, "uniq_target_name_in_mission", "sqlite_autoindex_core_target_1")
+
+
+@pytest.mark.parametrize(
+    "queryset, index_name",
+    [
+        (lambda: Target.objects.filter(is_complete=False).order_by("-id"), "target_open_id_idx"),
+        (lambda: Target.objects.filter(is_complete=True).order_by("-id"), "target_done_id_idx"),
+        (lambda: Target.objects.filter(country="DE").order_by("-id"), "target_country_id_idx"),
+        (lambda: Cat.objects.filter(breed="Siamese").order_by("-id"), "cat_breed_id_idx"),
+    ],
+)
+def test_admin_filters_use_indexes(queryset, index_name):
+    assert_uses_index(queryset(), index_name)
+
+
+def test_keyset_page_uses_primary_key():
+    plan = Target.objects.filter(id__lt=100).order_by("-id").explain()
+    assert "PRIMARY KEY" in plan or "pkey" in plan, plan
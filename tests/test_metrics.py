@@ -0,0 +1,136 @@
+import json
+
+import pytest
+from django.urls import reverse
+from rest_framework.test import APIClient
+
+from apps.core import metrics
+from apps.core.models import Cat
+
+pytestmark = pytest.mark.django_db
+
+
+@pytest.fixture(autouse=True)
+def fresh_metrics():
+    metrics.reset()
+    yield
+    metrics.reset()
+
+
+def test_requests_are_recorded_per_route_and_status(settings):
+    settings.RESPONSE_CACHE_ENABLED = False
+    c = APIClient()
+    Cat.objects.create(name="A", years_of_experience=1, breed="Siamese", salary=1)
+    c.get(reverse("cats-list"))
+    c.get(reverse("cats-list"))
+    c.get(reverse("cats-detail", args=[999]))
+    text = c.get(reverse("metrics")).content.decode()
+    assert 'http_request_duration_seconds_count{method="GET",route="cats-list",status="200"} 2' in text
+    assert 'http_request_duration_seconds_count{method="GET",route="cats-detail",status="404"} 1' in text
+    assert 'http_request_duration_seconds_bucket{le="+Inf",method="GET",route="cats-list",status="200"} 2' not in text
+    assert 'http_request_duration_seconds_bucket{method="GET",route="cats-list",status="200",le="+Inf"} 2' in text
+    assert 'http_request_db_queries_total{route="cats-list"} 2' in text
+    assert "# TYPE http_request_db_duration_seconds histogram" in text
+
+
+def test_breed_lookups_are_counted():
+    cats = [{"name": "A", "years_of_experience": 1, "breed": "Siamese", "salary": 1}]
+    c = APIClient()
+    c.post(reverse("cats-bulk"), {"cats": cats}, format="json")
+    c.post(reverse("cats-bulk"), {"cats": cats}, format="json")
+    values = metrics.snapshot()
+    assert values[("breed_index_lookups_total", (("result", "miss"),))] == 1
+    assert values[("breed_index_lookups_total", (("result", "hit"),))] == 1
+
+
+def test_histogram_buckets_are_cumulative():
+    for value in (0.001, 0.02, 0.02, 20):
+        metrics.observe("outbound_request_duration_seconds", {"host": "h", "status": "200"}, value)
+    text = metrics.render(metrics.collect())
+    labels = 'host="h",status="200"'
+    assert f'outbound_request_duration_seconds_bucket{{{labels},le="0.005"}} 1' in text
+    assert f'outbound_request_duration_seconds_bucket{{{labels},le="0.025"}} 3' in text
+    assert f'outbound_request_duration_seconds_bucket{{{labels},le="10.0"}} 3' in text
+    assert f'outbound_request_duration_seconds_bucket{{{labels},le="+Inf"}} 4' in text
+    assert f"outbound_request_duration_seconds_count{{{labels}}} 4" in text
+
+
+def test_worker_files_are_merged(tmp_path, settings):
+    settings.METRICS_DIR = str(tmp_path)
+    metrics.inc("breed_index_lookups_total", {"result": "hit"}, 3)
+    metrics.observe("outbound_request_duration_seconds", {"host": "h", "status": "200"}, 0.2)
+    other = [
+        ["breed_index_lookups_total", [["result", "hit"]], 4],
+        ["outbound_request_duration_seconds", [["host", "h"], ["status", "200"]], [0] * 5 + [1] + [0] * 5 + [0.2, 1]],
+    ]
+    (tmp_path / "999999.json").write_text(json.dumps(other))
+    (tmp_path / "broken.json").write_text("{")
+    metrics.flush()
+    values = metrics.collect()
+    assert values[("breed_index_lookups_total", (("result", "hit"),))] == 7
+    hist = values[("outbound_request_duration_seconds", (("host", "h"), ("status", "200")))]
+    assert hist[5] == 2 and hist[-1] == 2
+
+
+def test_dead_workers_keep_counters_but_not_gauges(tmp_path, settings):
+    settings.METRICS_DIR = str(tmp_path)
+    hist = [0] * 5 + [1] + [0] * 5 + [0.2, 1]
+    for pid in (999998, 999999):
+        (tmp_path / f"{pid}.json").write_text(json.dumps([
+            ["breed_index_lookups_total", [["result", "hit"]], 2],
+            ["db_pool_connections", [["alias", "default"]], 3],
+            ["outbound_request_duration_seconds", [["host", "h"], ["status", "200"]], hist],
+        ]))
+        metrics.mark_process_dead(pid)
+    metrics.mark_process_dead(123)
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["dead.json"]
+    values = metrics.collect()
+    assert values[("breed_index_lookups_total", (("result", "hit"),))] == 4
+    assert values[("outbound_request_duration_seconds", (("host", "h"), ("status", "200")))][-1] == 2
+    assert ("db_pool_connections", (("alias", "default"),)) not in values
+
+
+def test_flush_writes_worker_file(tmp_path, settings):
+    settings.METRICS_DIR = str(tmp_path)
+    metrics.inc("breed_index_lookups_total", {"result": "stale"})
+    metrics.flush_if_due()
+    [path] = tmp_path.glob("*.json")
+    assert json.loads(path.read_text()) == [["breed_index_lookups_total", [["result", "stale"]], 1]]
+
+
+def test_metrics_endpoint_disabled(settings):
+    settings.METRICS_ENABLED = False
+    assert APIClient().get(reverse("metrics")).status_code == 404
+
+
+def test_metrics_endpoint_requires_token_when_set(settings):
+    settings.METRICS_TOKEN = "s3cret"
+    c = APIClient()
+    response = c.get(reverse("metrics"))
+    assert response.status_code == 401 and response["WWW-Authenticate"].startswith("Bearer")
+    assert c.get(reverse("metrics"), HTTP_AUTHORIZATION="Bearer wrong").status_code == 401
+    assert c.get(reverse("metrics"), HTTP_AUTHORIZATION="Bearer s3cret").status_code == 200
+
+
+class _FakePool:
+    def get_stats(self):
+        return {"pool_min": 1, "pool_max": 4, "pool_size": 3, "pool_available": 1,
+                "requests_num": 40, "requests_queued": 5, "requests_wait_ms": 250, "requests_errors": 1}
+
+
+def test_pool_stats_are_exported_on_scrape(monkeypatch):
+    from apps.core import db_pool
+
+    monkeypatch.setattr(db_pool, "open_pools", lambda: {"default": _FakePool()})
+    text = APIClient().get(reverse("metrics")).content.decode()
+    assert "# TYPE db_pool_connections_in_use gauge" in text
+    assert 'db_pool_connections_in_use{alias="default"} 2' in text
+    assert 'db_pool_overflow_connections{alias="default"} 2' in text
+    assert 'db_pool_wait_seconds_total{alias="default"} 0.25' in text
+    assert 'db_pool_timeouts_total{alias="default"} 1' in text
+
+
+def test_no_pools_are_sampled_without_postgres():
+    from apps.core import db_pool
+
+    assert db_pool.open_pools() == {}
@@ -20,7 +20,7 @@ def test_create_cat_unknown_breed(monkeypatch):
         status_code = 200
         def json(self): return [{"id": "siam", "name": "Siamese"}]
 
-    monkeypatch.setattr("apps.core.services.requests.get", lambda *a, **k: Resp())
+    monkeypatch.setattr("apps.core.http_client.HTTPClient.get", lambda *a, **k: Resp())
     r = client.post(
         reverse("cats-list"),
         {"name": "A", "years_of_experience": 1, "breed": "UnknownBreed", "salary": 1000},
@@ -36,7 +36,7 @@ def test_notes_update_forbidden_after_complete(monkeypatch):
         status_code = 200
         def json(self): return [{"id": "siam", "name": "Siamese"}]
 
-    monkeypatch.setattr("apps.core.services.requests.get", lambda *a, **k: Resp())
+    monkeypatch.setattr("apps.core.http_client.HTTPClient.get", lambda *a, **k: Resp())
 
     cat_resp = client.post(
         reverse("cats-list"),
@@ -72,7 +72,7 @@ def test_delete_mission_forbidden_if_assigned(monkeypatch):
         status_code = 200
         def json(self): return [{"id": "siam", "name": "Siamese"}]
 
-    monkeypatch.setattr("apps.core.services.requests.get", lambda *a, **k: Resp())
+    monkeypatch.setattr("apps.core.http_client.HTTPClient.get", lambda *a, **k: Resp())
 
     cat_resp = client.post(
         reverse("cats-list"),
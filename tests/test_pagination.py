@@ -0,0 +1,52 @@
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework.test import APIClient
+from apps.core.models import Cat, Mission, Target
+
+pytestmark = pytest.mark.django_db
+
+
+def _walk(c, url):
+    ids, pages = [], 0
+    while url:
+        r = c.get(url)
+        assert r.status_code == 200
+        ids += [row["id"] for row in r.json()["results"]]
+        url = r.json()["next"]
+        pages += 1
+    return ids, pages
+
+
+def test_cursor_walk_covers_all_rows_newest_first():
+    Cat.objects.bulk_create(
+        [Cat(name=f"C{i}", years_of_experience=1, breed="Siamese", salary=100) for i in range(7)]
+    )
+    ids, pages = _walk(APIClient(), reverse("cats-list") + "?page_size=3")
+    assert ids == sorted(Cat.objects.values_list("id", flat=True), reverse=True)
+    assert pages == 3
+
+
+def test_page_size_is_capped(settings):
+    settings.CORE_MAX_PAGE_SIZE = 2
+    Mission.objects.bulk_create([Mission() for _ in range(4)])
+    r = APIClient().get(reverse("missions-list") + "?page_size=100")
+    assert len(r.json()["results"]) == 2
+
+
+def test_deep_page_uses_keyset_not_offset():
+    m = Mission.objects.create()
+    Target.objects.bulk_create([Target(mission=m, name=f"T{i}", country="DE") for i in range(5)])
+    c = APIClient()
+    next_url = c.get(reverse("targets-list") + "?page_size=2").json()["next"]
+    with CaptureQueriesContext(connection) as ctx:
+        r = c.get(next_url)
+    assert r.status_code == 200 and len(r.json()["results"]) == 2
+    sql = " ".join(q["sql"] for q in ctx.captured_queries).upper()
+    assert "OFFSET" not in sql and '"ID" <' in sql
+
+
+def test_invalid_cursor_returns_404():
+    r = APIClient().get(reverse("cats-list") + "?cursor=garbage")
+    assert r.status_code == 404
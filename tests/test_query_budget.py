@@ -0,0 +1,122 @@
+import pytest
+from django.contrib.auth.models import User
+from django.test import override_settings
+from django.urls import reverse
+from rest_framework.test import APIClient
+
+from apps.core import querybudget
+from apps.core.models import Cat, Mission, Target
+
+pytestmark = pytest.mark.django_db
+
+
+def seed(n=5):
+    cats = [
+        Cat.objects.create(name=f"C{i}", years_of_experience=i, breed="Siamese", salary=1000 + i)
+        for i in range(n)
+    ]
+    missions = []
+    for i in range(n):
+        m = Mission.objects.create(target_count=3)
+        for j in range(3):
+            Target.objects.create(mission=m, name=f"T{i}-{j}", country="DE")
+        missions.append(m)
+    return cats, missions
+
+
+@override_settings(QUERY_BUDGET_HEADERS=True)
+def test_core_endpoints_stay_within_budget():
+    cats, missions = seed()
+    c = APIClient()
+    counts = {}
+
+    def call(label, method, url, data=None, expected=None):
+        resp = getattr(c, method)(url, data, format="json")
+        if expected is not None:
+            assert resp.status_code == expected, (label, resp.status_code, resp.content)
+        counts[label] = int(resp["X-Query-Count"])
+        return resp
+
+    call("cats.list", "get", reverse("cats-list"), expected=200)
+    call("cats.retrieve", "get", reverse("cats-detail", args=[cats[0].pk]), expected=200)
+    call("cats.create", "post", reverse("cats-list"),
+         {"name": "N", "years_of_experience": 1, "breed": "Siamese", "salary": 10}, expected=201)
+    call("cats.update", "patch", reverse("cats-detail", args=[cats[0].pk]), {"salary": 20}, expected=200)
+    call("cats.bulk", "post", reverse("cats-bulk"),
+         {"cats": [{"name": f"B{i}", "years_of_experience": 1, "breed": "siam", "salary": 1} for i in range(4)]},
+         expected=201)
+
+    call("missions.list", "get", reverse("missions-list"), expected=200)
+    call("missions.retrieve", "get", reverse("missions-detail", args=[missions[0].pk]), expected=200)
+    call("missions.create", "post", reverse("missions-list"),
+         {"targets": [{"name": "A", "country": "DE"}, {"name": "B", "country": "FR"}]}, expected=201)
+    call("missions.update", "patch", reverse("missions-detail", args=[missions[0].pk]),
+         {"assigned_cat": cats[0].pk}, expected=200)
+    call("missions.assign", "post", reverse("missions-assign", args=[missions[1].pk]),
+         {"cat_id": cats[1].pk}, expected=200)
+    call("missions.assign_bulk", "post", reverse("missions-assign-bulk"),
+         {"pairs": [{"mission": missions[2].pk, "cat": cats[2].pk},
+                    {"mission": missions[3].pk, "cat": cats[3].pk}]}, expected=200)
+    call("missions.bulk", "post", reverse("missions-bulk"),
+         {"missions": [{"targets": [{"name": f"X{i}", "country": "DE"}]} for i in range(3)]}, expected=201)
+
+    open_mission = Mission.objects.create()
+    call("targets.create", "post", reverse("mission-targets-create", args=[open_mission.pk]),
+         {"name": "New", "country": "DE"}, expected=201)
+    call("targets.list", "get", reverse("targets-list"), expected=200)
+    target = Target.objects.filter(mission=missions[4]).first()
+    call("targets.retrieve", "get", reverse("targets-detail", args=[target.pk]), expected=200)
+    call("targets.update", "patch", reverse("targets-detail", args=[target.pk]), {"is_complete": True}, expected=200)
+    call("targets.destroy", "delete", reverse("targets-detail", args=[target.pk]), expected=204)
+
+    call("missions.destroy", "delete", reverse("missions-detail", args=[missions[4].pk]), expected=204)
+    call("cats.destroy", "delete", reverse("cats-detail", args=[cats[4].pk]), expected=204)
+    assert counts["cats.list"] == 1
+    assert counts["missions.list"] == counts["missions.retrieve"] == 2
+
+
+@override_settings(QUERY_BUDGET_HEADERS=True)
+def test_user_endpoints_stay_within_budget():
+    admin = User.objects.create_superuser("admin", "a@example.com", "pw")
+    for i in range(3):
+        User.objects.create_user(f"u{i}", password="pw")
+    c = APIClient()
+    token = c.post(reverse("jwt-create"), {"username": "admin", "password": "pw"}, format="json").json()["access"]
+    c.credentials(HTTP_AUTHORIZATION=f"Bearer {token}")
+    other = User.objects.get(username="u0")
+    assert c.get(reverse("users-list")).status_code == 200
+    assert c.get(reverse("users-detail", args=[other.pk])).status_code == 200
+    me = c.get(reverse("users-me"))
+    assert me.status_code == 200 and me.data["username"] == "admin"
+    # The token's user lookup is timed but not counted against the view's budget.
+    assert me["X-Query-Count"] == "0"
+    assert float(me["X-DB-Time-ms"]) > 0
+    assert c.patch(reverse("users-detail", args=[other.pk]), {"first_name": "U"}, format="json").status_code == 200
+    inactive = User.objects.create_user("gone", password="pw", is_active=False)
+    assert c.post(reverse("users-restore", args=[inactive.pk])).status_code == 200
+    assert c.delete(reverse("users-detail", args=[other.pk])).status_code == 204
+
+
+@pytest.mark.allow_query_budget_overrun
+def test_violation_is_reported(query_budget_violations):
+    Cat.objects.create(name="C", years_of_experience=1, breed="Siamese", salary=1)
+    with override_settings(QUERY_BUDGETS={"apps.core.views.CatViewSet.list": 0}):
+        APIClient().get(reverse("cats-list"))
+    [violation] = query_budget_violations
+    assert violation.view == "apps.core.views.CatViewSet.list"
+    assert (violation.count, violation.budget) == (1, 0)
+
+
+def test_query_budget_decorator_sets_handler_budget():
+    @querybudget.query_budget(3)
+    def view(request):
+        return None
+
+    assert view.query_budget == 3
+
+
+def test_transaction_statements_are_not_counted():
+    stats = querybudget.QueryStats()
+    for sql in ("BEGIN", 'SAVEPOINT "s1"', 'RELEASE SAVEPOINT "s1"', "SELECT 1"):
+        stats(lambda *args: None, sql, None, False, {})
+    assert stats.count == 1
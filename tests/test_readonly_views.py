@@ -7,7 +7,7 @@ pytestmark = pytest.mark.django_db
 def test_missions_list_empty_then_nonempty():
     c = APIClient()
     r = c.get(reverse("missions-list"))
-    assert r.status_code == 200 and r.json() == []
+    assert r.status_code == 200 and r.json()["results"] == []
     c.post(reverse("missions-list"), {"targets":[{"name":"A","country":"DE"}]}, format="json")
     r = c.get(reverse("missions-list"))
-    assert r.status_code == 200 and len(r.json()) == 1
+    assert r.status_code == 200 and len(r.json()["results"]) == 1
@@ -0,0 +1,96 @@
+import pytest
+from django.db import connections
+from django.test import override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework.test import APIClient
+
+from apps.core import db_router
+from apps.core.models import Cat
+
+# The replica alias mirrors default through its own connection, so rows must be committed.
+pytestmark = pytest.mark.django_db(transaction=True, databases=["default", "replica"])
+
+REPLICAS = override_settings(DATABASE_REPLICAS=["replica"], RESPONSE_CACHE_ENABLED=False, REPLICA_STICKY_SECONDS=30)
+
+
+def _cat_reads(client, path, **kwargs):
+    """Return the aliases that served SELECTs on core_cat while fetching ``path``."""
+    with CaptureQueriesContext(connections["default"]) as primary, CaptureQueriesContext(connections["replica"]) as replica:
+        response = client.get(path, **kwargs)
+    assert response.status_code == 200
+    used = set()
+    for alias, ctx in (("default", primary), ("replica", replica)):
+        if any(q["sql"].startswith("SELECT") and "core_cat" in q["sql"] for q in ctx.captured_queries):
+            used.add(alias)
+    return used
+
+
+@pytest.fixture
+def cat():
+    return Cat.objects.create(name="C", years_of_experience=1, breed="Siamese", salary=1)
+
+
+@REPLICAS
+def test_safe_requests_read_from_replica(cat):
+    client = APIClient()
+    assert _cat_reads(client, reverse("cats-list")) == {"replica"}
+    assert _cat_reads(client, reverse("cats-detail", args=[cat.pk])) == {"replica"}
+
+
+@REPLICAS
+def test_writes_use_primary_and_pin_the_client(cat):
+    client = APIClient()
+    with CaptureQueriesContext(connections["replica"]) as replica:
+        r = client.patch(reverse("cats-detail", args=[cat.pk]), {"salary": 2}, format="json")
+    assert r.status_code == 200
+    assert not replica.captured_queries
+    assert r.cookies[db_router.STICKY_COOKIE].value == r[db_router.STICKY_HEADER]
+
+    # The cookie pins the writer; a cookieless client may echo the header instead.
+    assert _cat_reads(client, reverse("cats-list")) == {"default"}
+    other = APIClient()
+    assert _cat_reads(other, reverse("cats-list"), headers={db_router.STICKY_HEADER: r[db_router.STICKY_HEADER]}) == {
+        "default"
+    }
+    assert _cat_reads(other, reverse("cats-list")) == {"replica"}
+
+
+@REPLICAS
+def test_sticky_window_expires(cat):
+    client = APIClient()
+    with override_settings(REPLICA_STICKY_SECONDS=0):
+        assert client.patch(reverse("cats-detail", args=[cat.pk]), {"salary": 2}, format="json").status_code == 200
+    assert _cat_reads(client, reverse("cats-list")) == {"replica"}
+
+
+@REPLICAS
+def test_failed_write_does_not_pin(cat):
+    client = APIClient()
+    r = client.patch(reverse("cats-detail", args=[cat.pk]), {"salary": -1}, format="json")
+    assert r.status_code == 400
+    assert db_router.STICKY_HEADER not in r
+
+
+@REPLICAS
+def test_reads_outside_requests_and_all_writes_use_primary(cat):
+    router = db_router.ReplicaRouter()
+    assert router.db_for_read(Cat) == "default"
+    with CaptureQueriesContext(connections["replica"]) as replica:
+        assert Cat.objects.count() == 1
+    assert not replica.captured_queries
+    assert router.db_for_write(Cat, instance=Cat.objects.using("replica").get()) == "default"
+    assert router.allow_migrate("replica", "core") is False
+
+
+@REPLICAS
+def test_async_views_read_from_replica(cat):
+    assert _cat_reads(APIClient(), reverse("async-cats-list")) == {"replica"}
+
+
+@override_settings(DATABASE_REPLICAS=["replica"], REPLICA_STICKY_SECONDS=30)
+def test_replica_responses_get_their_own_etag(cat):
+    url = reverse("cats-list")
+    from_replica = APIClient().get(url)
+    pinned = APIClient().get(url, headers={db_router.STICKY_HEADER: "9999999999"})
+    assert from_replica["ETag"] != pinned["ETag"]
@@ -0,0 +1,74 @@
+import gzip
+import os
+from io import StringIO
+
+import pytest
+from django.core.management import call_command
+from django.urls import reverse
+from rest_framework.test import APIClient
+
+from apps.core.schema import accepts_gzip, artifact_path
+
+pytestmark = pytest.mark.django_db
+
+
+@pytest.fixture
+def schema_dir(settings, tmp_path):
+    settings.SCHEMA_DIR = str(tmp_path)
+    settings.DEBUG = False
+    return tmp_path
+
+
+def test_built_schema_is_served_with_etag_and_gzip(schema_dir):
+    call_command("build_schema", stdout=StringIO())
+    assert sorted(os.listdir(schema_dir)) == [
+        "openapi-1.0.0.json", "openapi-1.0.0.json.gz", "openapi-1.0.0.yaml", "openapi-1.0.0.yaml.gz",
+    ]
+    c = APIClient()
+    url = reverse("schema")
+    response = c.get(url, HTTP_ACCEPT="application/json")
+    assert response.status_code == 200
+    assert response["Content-Type"] == "application/json"
+    assert "/api/cats/" in response.json()["paths"]
+    assert set(response.json()["components"]["securitySchemes"]) == {"jwtAuth", "cookieAuth"}
+    assert response.content == (schema_dir / "openapi-1.0.0.json").read_bytes()
+    assert c.get(url, HTTP_ACCEPT="application/json", HTTP_IF_NONE_MATCH=response["ETag"]).status_code == 304
+    assert c.get(url, HTTP_IF_NONE_MATCH=response["ETag"]).status_code == 200  # the YAML rendering
+
+    zipped = c.get(url, HTTP_ACCEPT_ENCODING="gzip, br")
+    assert zipped["Content-Type"] == "application/vnd.oai.openapi"
+    assert zipped["Content-Encoding"] == "gzip"
+    assert gzip.decompress(zipped.content) == (schema_dir / "openapi-1.0.0.yaml").read_bytes()
+    assert zipped["ETag"] != response["ETag"]
+    refused = c.get(url, HTTP_ACCEPT_ENCODING="gzip;q=0, br")
+    assert "Content-Encoding" not in refused
+    assert refused.content == (schema_dir / "openapi-1.0.0.yaml").read_bytes()
+
+    path = artifact_path("json")
+    with open(path, "wb") as fh:
+        fh.write(b'{"openapi": "3.0.3", "paths": {}}')
+    os.utime(path, ns=(1, 1))
+    changed = c.get(url, HTTP_ACCEPT="application/json", HTTP_IF_NONE_MATCH=response["ETag"])
+    assert changed.status_code == 200
+    assert changed.json()["paths"] == {}
+
+
+@pytest.mark.parametrize(
+    "header, expected",
+    [
+        ("gzip", True), ("br, GZIP;q=0.5", True), ("*", True), ("gzip;q=0", False),
+        ("gzip; q=0.000", False), ("*;q=0", False), ("br, *;q=0.1", True), ("gzip;q=0, *", False),
+        ("x-gzip", True), ("deflate, br", False), ("", False), ("gzipped", False),
+    ],
+)
+def test_accepts_gzip_honours_q_values(header, expected):
+    assert accepts_gzip(header) is expected
+
+
+def test_missing_schema_is_generated_only_in_debug(schema_dir, settings):
+    c = APIClient()
+    assert c.get(reverse("schema")).status_code == 503
+    settings.DEBUG = True
+    response = c.get(reverse("schema"), {"format": "json"})
+    assert response.status_code == 200
+    assert "/api/cats/" in response.json()["paths"]
@@ -0,0 +1,49 @@
+import json
+from io import StringIO
+
+import pytest
+from django.core.management import call_command
+from django.urls import reverse
+from rest_framework.test import APIClient
+
+from apps.core.startup import parse_profile
+
+PROFILE = """\
+import time: self [us] | cumulative | imported package
+import time:       120 |        120 |   encodings
+phase: setup 410.5
+import time:      3000 |       3500 |     drf_spectacular.utils
+import time:       500 |       4000 |   apps.core.views
+phase: warm_up 20.0
+phase: first_request 4.2
+status: 200 OK
+"""
+
+
+def test_parse_profile_attributes_imports_to_phases():
+    profile = parse_profile(PROFILE)
+    assert profile["phases"] == {"setup": 410.5, "warm_up": 20.0, "first_request": 4.2}
+    assert profile["status"] == "200 OK"
+    assert [(m["module"], m["phase"]) for m in profile["modules"]] == [
+        ("encodings", "setup"),
+        ("drf_spectacular.utils", "warm_up"),
+        ("apps.core.views", "warm_up"),
+    ]
+    assert profile["modules"][1]["cumulative_ms"] == 3.5
+
+
+def test_profile_startup_serves_one_request():
+    out = StringIO()
+    call_command("profile_startup", path="/metrics", json=True, stdout=out)
+    profile = json.loads(out.getvalue())
+    assert profile["status"] == "200 OK"
+    assert set(profile["phases"]) == {"setup", "warm_up", "first_request"}
+    # The schema generator is only imported by a docs request.
+    assert not any(m["module"] == "drf_spectacular.generators" for m in profile["modules"])
+
+
+@pytest.mark.django_db
+def test_docs_views_are_served():
+    client = APIClient()
+    assert client.get(reverse("swagger-ui")).status_code == 200
+    assert client.get(reverse("redoc")).status_code == 200
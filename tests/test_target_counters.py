@@ -0,0 +1,138 @@
+import pytest
+from django.urls import reverse
+from rest_framework.test import APIClient
+from apps.core.models import Mission, Target
+from apps.core.targets import recount_targets
+
+pytestmark = pytest.mark.django_db
+
+
+def _mission(c, *names):
+    r = c.post(reverse("missions-list"), {"targets": [{"name": n, "country": "DE"} for n in names]}, format="json")
+    assert r.status_code == 201
+    return Mission.objects.latest("pk")
+
+
+def _counters(m):
+    m.refresh_from_db()
+    return m.target_count, m.completed_target_count, m.is_complete
+
+
+def test_counters_follow_create_add_complete_and_autocomplete():
+    c = APIClient()
+    m = _mission(c, "A", "B")
+    assert _counters(m) == (2, 0, False)
+    assert c.post(reverse("mission-targets-create", args=[m.pk]), {"name": "C", "country": "DE"}, format="json").status_code == 201
+    assert _counters(m) == (3, 0, False)
+
+    ids = list(m.targets.order_by("id").values_list("id", flat=True))
+    c.patch(reverse("targets-detail", args=[ids[0]]), {"is_complete": True}, format="json")
+    c.patch(reverse("targets-detail", args=[ids[0]]), {"is_complete": True}, format="json")
+    assert _counters(m) == (3, 1, False)
+    c.patch(reverse("target-update", args=[m.pk, ids[1]]), {"is_complete": True}, format="json")
+    assert _counters(m) == (3, 2, False)
+    c.patch(reverse("targets-detail", args=[ids[2]]), {"is_complete": True, "notes": "done"}, format="json")
+    assert _counters(m) == (3, 3, True)
+    assert Target.objects.get(pk=ids[2]).notes == "done"
+
+
+def test_deleting_last_open_target_completes_mission():
+    c = APIClient()
+    m = _mission(c, "A", "B")
+    done, open_ = m.targets.order_by("id")
+    c.patch(reverse("targets-detail", args=[done.pk]), {"is_complete": True}, format="json")
+    assert c.delete(reverse("target-update", args=[m.pk, open_.pk])).status_code == 204
+    assert _counters(m) == (1, 1, True)
+
+
+def test_deleting_only_target_does_not_complete_mission():
+    c = APIClient()
+    m = _mission(c, "A")
+    assert c.delete(reverse("targets-detail", args=[m.targets.get().pk])).status_code == 204
+    assert _counters(m) == (0, 0, False)
+
+
+def test_failed_add_does_not_leak_counter():
+    c = APIClient()
+    m = _mission(c, "A")
+    r = c.post(reverse("mission-targets-create", args=[m.pk]), {"name": "A", "country": "DE"}, format="json")
+    assert r.status_code == 400
+    assert _counters(m) == (1, 0, False)
+
+
+def test_bulk_created_missions_have_counters():
+    c = APIClient()
+    payload = {"missions": [{"targets": [{"name": "A", "country": "DE"}, {"name": "B", "country": "DE"}]}]}
+    c.post(reverse("missions-bulk"), payload, format="json")
+    assert _counters(Mission.objects.get()) == (2, 0, False)
+
+
+def test_counters_exposed_on_mission_representation():
+    c = APIClient()
+    m = _mission(c, "A", "B")
+    body = c.get(reverse("missions-detail", args=[m.pk])).json()
+    assert (body["target_count"], body["completed_target_count"]) == (2, 0)
+    listed = c.get(reverse("missions-list")).json()["results"][0]
+    assert (listed["target_count"], listed["completed_target_count"]) == (2, 0)
+
+
+def test_recount_repairs_drift():
+    c = APIClient()
+    m = _mission(c, "A", "B")
+    Mission.objects.filter(pk=m.pk).update(target_count=0, completed_target_count=5)
+    recount_targets(m.pk)
+    assert _counters(m) == (2, 0, False)
+
+
+@pytest.fixture
+def admin_client(client, django_user_model):
+    client.force_login(django_user_model.objects.create_superuser("root", "root@example.com", "pw"))
+    return client
+
+
+def _admin_target_form(target, **changes):
+    data = {"mission": target.mission_id, "name": target.name, "country": target.country, "notes": target.notes}
+    data.update(changes)
+    if data.pop("is_complete", target.is_complete):
+        data["is_complete"] = "on"
+    return data
+
+
+def test_admin_completing_last_open_target_completes_mission(admin_client):
+    m = _mission(APIClient(), "A", "B")
+    first, last = m.targets.order_by("id")
+    for target in (first, last):
+        url = reverse("admin:core_target_change", args=[target.pk])
+        assert admin_client.post(url, _admin_target_form(target, is_complete=True)).status_code == 302
+    assert _counters(m) == (2, 2, True)
+
+
+def test_admin_deleting_last_open_target_completes_mission(admin_client):
+    m = _mission(APIClient(), "A", "B")
+    done, open_ = m.targets.order_by("id")
+    Target.objects.filter(pk=done.pk).update(is_complete=True)
+    url = reverse("admin:core_target_delete", args=[open_.pk])
+    assert admin_client.post(url, {"post": "yes"}).status_code == 302
+    assert _counters(m) == (1, 1, True)
+
+
+def test_admin_bulk_deleting_open_targets_completes_mission(admin_client):
+    m = _mission(APIClient(), "A", "B", "C")
+    done, *open_ = m.targets.order_by("id")
+    Target.objects.filter(pk=done.pk).update(is_complete=True)
+    data = {"action": "delete_selected", "post": "yes", "_selected_action": [t.pk for t in open_]}
+    assert admin_client.post(reverse("admin:core_target_changelist"), data).status_code == 302
+    assert _counters(m) == (1, 1, True)
+
+
+def test_admin_mission_inline_completing_targets_completes_mission(admin_client):
+    m = _mission(APIClient(), "A")
+    target = m.targets.get()
+    data = {
+        "targets-TOTAL_FORMS": "1", "targets-INITIAL_FORMS": "1",
+        "targets-MIN_NUM_FORMS": "0", "targets-MAX_NUM_FORMS": "1000",
+        "targets-0-id": target.pk, "targets-0-mission": m.pk, "targets-0-name": "A",
+        "targets-0-country": "DE", "targets-0-notes": "", "targets-0-is_complete": "on",
+    }
+    assert admin_client.post(reverse("admin:core_mission_change", args=[m.pk]), data).status_code == 302
+    assert _counters(m) == (1, 1, True)
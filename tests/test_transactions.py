@@ -0,0 +1,63 @@
+import pytest
+from django.db import connection
+from django.urls import reverse
+from rest_framework.response import Response
+from rest_framework.test import APIClient, APIRequestFactory
+from rest_framework.views import APIView
+
+from apps.core.models import Cat
+from apps.core.transactions import TransactionPolicyMixin
+from apps.core.views import CatViewSet
+
+# Transactional: pytest's per-test atomic block would hide the policy's own.
+pytestmark = pytest.mark.django_db(transaction=True)
+
+
+def _in_atomic(client_call) -> set:
+    """Return in_atomic_block for every SQL statement the call runs (SQLite's BEGIN precedes the block)."""
+    seen = set()
+
+    def record(execute, sql, params, many, context):
+        if sql != "BEGIN":
+            seen.add(connection.in_atomic_block)
+        return execute(sql, params, many, context)
+
+    with connection.execute_wrapper(record):
+        response = client_call()
+    assert response.status_code < 400, response.content
+    return seen
+
+
+def test_reads_run_in_autocommit_and_updates_in_one_transaction():
+    cat = Cat.objects.create(name="C", years_of_experience=1, breed="Siamese", salary=1)
+    client = APIClient()
+    assert _in_atomic(lambda: client.get(reverse("cats-list"))) == {False}
+    assert _in_atomic(lambda: client.get(reverse("cats-detail", args=[cat.pk]))) == {False}
+    assert _in_atomic(lambda: client.patch(reverse("cats-detail", args=[cat.pk]), {"salary": 2}, format="json")) == {
+        True
+    }
+
+
+class _WriteThenFail(TransactionPolicyMixin, APIView):
+    atomic_actions = frozenset({"post"})
+
+    def post(self, request):
+        Cat.objects.create(name="C", years_of_experience=1, breed="Siamese", salary=1)
+        return Response({"detail": "nope"}, status=400)
+
+
+def test_error_response_rolls_back_atomic_actions():
+    request = APIRequestFactory().post("/", {}, format="json")
+    assert _WriteThenFail.as_view()(request).status_code == 400
+    assert not Cat.objects.exists()
+
+    autocommit = type("Autocommit", (_WriteThenFail,), {"atomic_actions": frozenset()})
+    autocommit.as_view()(APIRequestFactory().post("/", {}, format="json"))
+    assert Cat.objects.count() == 1
+
+
+def test_locking_actions_select_for_update():
+    view = CatViewSet(action="partial_update", request=None, format_kwarg=None)
+    assert not view.get_queryset().query.select_for_update
+    view._locking = True
+    assert view.get_queryset().query.select_for_update